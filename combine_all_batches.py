@@ -4,9 +4,16 @@ Combine all batch-generated sentences into final output file.
 """
 
 import json
+import sys
 from pathlib import Path
 from datetime import date
 
+# Inflection index (scripts/inflections.py) for locating the target word
+sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+from inflections import InflectionIndex
+
+INFLECTIONS = InflectionIndex.from_files(["public/data/vahiko/de.json", "public/data/jawad/de.json"], "de")
+
 def normalize_word(word):
     """Normalize word for ID generation."""
     word_clean = word.replace('die ', '').replace('der ', '').replace('das ', '')
@@ -19,15 +26,8 @@ def normalize_word(word):
             .replace('-', '_'))
 
 def find_word_position(sentence, target_word):
-    """Find the position of target word in sentence."""
-    words = sentence.split()
-    target_clean = target_word.replace('die ', '').replace('der ', '').replace('das ', '').lower()
-
-    for i, word in enumerate(words):
-        word_clean = word.strip('.,!?;:()[]{}«»"\'').lower()
-        if target_clean in word_clean or word_clean in target_clean:
-            return i
-    return 0
+    """Find the position (index) of the target word or one of its inflections, or -1."""
+    return INFLECTIONS.find(sentence, target_word)
 
 def create_sentence_entry(word, sentence_data, index):
     """Create a properly formatted sentence entry."""
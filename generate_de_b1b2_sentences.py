@@ -4,7 +4,13 @@ Generate B1-B2 German sentences from combined vocabulary of Hassan, Salman, and
 """
 
 import json
+import sys
 from datetime import datetime
+from pathlib import Path
+
+# Profile vocabularies resolve through the content store (scripts/content_store.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+import corpus
 
 def load_vocabulary(filepath, translation_language='ar'):
     """Extract vocabulary words from a profile's language file"""
@@ -37,7 +43,7 @@ def generate_b1b2_sentences():
     """Generate B1-B2 level German sentences for all vocabulary"""
 
     # Load vocabulary from all three profiles
-    hassan_words = load_vocabulary('public/data/hassan/de.json', 'ar')
+    hassan_words = load_vocabulary(corpus.url_to_path(corpus.vocabulary_url('hassan', 'de')), 'ar')
     salman_words = load_vocabulary('public/data/salman/de.json', 'ar')
     ameeno_words = load_vocabulary('public/data/ameeno/de.json', 'fa')
 
@@ -15,10 +15,16 @@ Requirements:
 import json
 import os
 import re
+import sys
 import time
 from datetime import datetime
+from pathlib import Path
 from anthropic import Anthropic
 
+# Shared German rules (scripts/grammar_rules.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+from grammar_rules import check_sentence, format_findings
+
 # Initialize Anthropic client
 client = Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
 
@@ -52,17 +58,10 @@ def validate_sentence_quality(sentence_de):
     Validate German sentence for common C1 gastronomy errors.
     Returns (is_valid, error_message)
     """
-    # Check for nonsense patterns
-    nonsense_patterns = [
-        r'\b(sollte|muss|kann)\s+(aromatisch|raffiniert|delikat|exquisit)\s+(das|die|der)',
-        r'\bDas\s+(raffiniert|exquisit|delikat|aromatisch)\s+(ist|muss|sollte)',
-        r'\bDie\s+(delikat|exquisit|aromatisch)\s*$',
-        r'\b(aromatisch|raffiniert|delikat)\s+(ist|muss)\s+(das|die)',
-    ]
-
-    for pattern in nonsense_patterns:
-        if re.search(pattern, sentence_de, re.IGNORECASE):
-            return False, f"Nonsense pattern detected: {pattern}"
+    # Check for nonsense patterns (scripts/grammar_rules.py)
+    findings = check_sentence(sentence_de, "de", "c1")
+    if findings:
+        return False, f"Nonsense pattern detected: {format_findings(findings)}"
 
     # Check word count (15-22 words for C1)
     word_count = len(sentence_de.split())
@@ -7,8 +7,14 @@ Generates 540 high-quality C1 sentences (3 per word × 180 words)
 import json
 import os
 import re
+import sys
+from pathlib import Path
 from anthropic import Anthropic
 
+# Shared German rules (scripts/grammar_rules.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+from grammar_rules import check_sentence, format_findings
+
 client = Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
 
 def load_vocabulary():
@@ -36,22 +42,11 @@ def validate_sentence(sentence, word):
     if base_word not in sentence_lower:
         return False, f"Target word '{word}' not found in sentence"
 
-    # Check for common grammatical errors
-
-    # Pattern 1: Adjectives used as nouns incorrectly (e.g., "Das strategisch ist")
-    bad_adj_noun = re.search(r'\b(Das|Die|Der|Ein|Eine)\s+(strategisch|umfassend|wesentlich|zeitgenössisch|niemals|immer)\s+(ist|muss|sollte|kann|wird)\b', sentence, re.IGNORECASE)
-    if bad_adj_noun:
-        return False, f"Adjective used as noun: '{bad_adj_noun.group()}'"
-
-    # Pattern 2: Adjectives used as verbs (e.g., "sollte strategisch das")
-    bad_adj_verb = re.search(r'\b(sollte|könnte|würde|müsste)\s+(strategisch|umfassend|wesentlich|zeitgenössisch)\s+(das|die|der)\b', sentence, re.IGNORECASE)
-    if bad_adj_verb:
-        return False, f"Adjective used as verb: '{bad_adj_verb.group()}'"
-
-    # Pattern 3: Incorrect article + adverb combinations
-    bad_article_adv = re.search(r'\bein\s+(niemals|immer|weil|obwohl)\b', sentence, re.IGNORECASE)
-    if bad_article_adv:
-        return False, f"Incorrect article + adverb: '{bad_article_adv.group()}'"
+    # Check for common grammatical errors: adjectives used as nouns ("Das strategisch ist")
+    # or verbs ("sollte strategisch das"), article + adverb ("ein niemals")
+    findings = check_sentence(sentence, "de", "c1", severity="error")
+    if findings:
+        return False, format_findings(findings)
 
     # Pattern 4: Check for sentence starting with verb (except questions/imperatives)
     if not sentence[0].isupper():
@@ -177,18 +172,12 @@ def run_quality_checks(output_file):
     # Check 2: Check for grammatical error patterns
     all_sentences = [item['sentence'] for item in data]
 
-    error_patterns = {
-        "Adjective as noun": r'\b(Das|Die|Der|Ein|Eine)\s+(strategisch|umfassend|wesentlich|zeitgenössisch|niemals|immer)\s+(ist|muss|sollte|kann|wird)\b',
-        "Adjective as verb": r'\b(sollte|könnte|würde|müsste)\s+(strategisch|umfassend|wesentlich|zeitgenössisch)\s+(das|die|der)\b',
-        "Bad article+adverb": r'\bein\s+(niemals|immer|weil|obwohl)\b'
-    }
-
-    for error_name, pattern in error_patterns.items():
-        matches = []
-        for item in data:
-            if re.search(pattern, item['sentence'], re.IGNORECASE):
-                matches.append(item)
+    matches_by_rule = {name: [] for name in ("de.adjective-as-noun", "de.adjective-as-verb", "de.indefinite-article-adverb")}
+    for item in data:
+        for rule, _ in check_sentence(item['sentence'], "de", "c1", severity="error"):
+            matches_by_rule.setdefault(rule.name, []).append(item)
 
+    for error_name, matches in matches_by_rule.items():
         if matches:
             print(f"\n❌ {error_name}: {len(matches)} errors found")
             for match in matches[:3]:  # Show first 3
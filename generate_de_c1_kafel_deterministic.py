@@ -7,8 +7,16 @@ DETERMINISTIC - No API calls, template-based generation
 
 import json
 import os
-import re
 import random
+import sys
+from pathlib import Path
+
+# Skeleton blocklist (scripts/template_skeletons.py) to keep templates from dominating the corpus
+sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+from grammar_rules import check_sentence, format_findings
+from template_skeletons import TemplateBlocklist
+
+BLOCKLIST = TemplateBlocklist.load()
 
 def load_vocabulary():
     """Load vocabulary from kafel de.json"""
@@ -68,6 +76,20 @@ def generate_c1_sentences_deterministic(word_data, word_index):
 
     return sentences
 
+def pick_template(templates, word_index, target):
+    """First template from word_index onwards whose skeleton is not blocked or used up"""
+    for offset in range(len(templates)):
+        sentence = templates[(word_index + offset) % len(templates)]
+        if BLOCKLIST.allows(sentence, target):
+            BLOCKLIST.record(sentence, target)
+            return sentence
+
+    # Every template is used up: take the least used one that is not blocked
+    ordered = [templates[(word_index + offset) % len(templates)] for offset in range(len(templates))]
+    sentence = BLOCKLIST.fallback(ordered, target)
+    BLOCKLIST.record(sentence, target)
+    return sentence
+
 def generate_verb_sentences(info, word_index):
     """Generate C1 sentences for verbs"""
     base_word = info['base_word']
@@ -103,14 +125,10 @@ def generate_verb_sentences(info, word_index):
         f"Bevor wir erfolgreich {base_word} können, müssen zunächst umfassende technische Analysen durchgeführt und alle Stakeholder informiert werden."
     ]
 
-    # Select templates based on word_index for variety
-    idx1 = word_index % len(templates_1)
-    idx2 = word_index % len(templates_2)
-    idx3 = word_index % len(templates_3)
-
-    sentences.append(templates_1[idx1])
-    sentences.append(templates_2[idx2])
-    sentences.append(templates_3[idx3])
+    # Select templates based on word_index for variety, skipping overused skeletons
+    sentences.append(pick_template(templates_1, word_index, base_word))
+    sentences.append(pick_template(templates_2, word_index, base_word))
+    sentences.append(pick_template(templates_3, word_index, base_word))
 
     return sentences
 
@@ -168,14 +186,10 @@ def generate_noun_sentences(info, word_index):
         f"Nachdem {nom} {base_word} ausführlich analysiert wurde, konnten die Verantwortlichen fundierte Empfehlungen für das weitere Vorgehen aussprechen."
     ]
 
-    # Select templates based on word_index for variety
-    idx1 = word_index % len(templates_1)
-    idx2 = word_index % len(templates_2)
-    idx3 = word_index % len(templates_3)
-
-    sentences.append(templates_1[idx1])
-    sentences.append(templates_2[idx2])
-    sentences.append(templates_3[idx3])
+    # Select templates based on word_index for variety, skipping overused skeletons
+    sentences.append(pick_template(templates_1, word_index, base_word))
+    sentences.append(pick_template(templates_2, word_index, base_word))
+    sentences.append(pick_template(templates_3, word_index, base_word))
 
     return sentences
 
@@ -197,18 +211,10 @@ def validate_sentence(sentence, word):
     if base_word not in sentence_lower:
         return False, f"Target word '{word}' not found in sentence"
 
-    # Check for common grammatical errors
-    bad_adj_noun = re.search(r'\b(Das|Die|Der|Ein|Eine)\s+(strategisch|umfassend|wesentlich|zeitgenössisch|niemals|immer)\s+(ist|muss|sollte|kann|wird)\b', sentence, re.IGNORECASE)
-    if bad_adj_noun:
-        return False, f"Adjective used as noun: '{bad_adj_noun.group()}'"
-
-    bad_adj_verb = re.search(r'\b(sollte|könnte|würde|müsste)\s+(strategisch|umfassend|wesentlich|zeitgenössisch)\s+(das|die|der)\b', sentence, re.IGNORECASE)
-    if bad_adj_verb:
-        return False, f"Adjective used as verb: '{bad_adj_verb.group()}'"
-
-    bad_article_adv = re.search(r'\bein\s+(niemals|immer|weil|obwohl)\b', sentence, re.IGNORECASE)
-    if bad_article_adv:
-        return False, f"Incorrect article + adverb: '{bad_article_adv.group()}'"
+    # Check for common grammatical errors (scripts/grammar_rules.py)
+    findings = check_sentence(sentence, "de", "c1", severity="error")
+    if findings:
+        return False, format_findings(findings)
 
     if not sentence[0].isupper():
         return False, "Sentence must start with capital letter"
@@ -232,18 +238,12 @@ def run_quality_checks(output_file):
 
     all_sentences = [item['sentence'] for item in data]
 
-    error_patterns = {
-        "Adjective as noun": r'\b(Das|Die|Der|Ein|Eine)\s+(strategisch|umfassend|wesentlich|zeitgenössisch|niemals|immer)\s+(ist|muss|sollte|kann|wird)\b',
-        "Adjective as verb": r'\b(sollte|könnte|würde|müsste)\s+(strategisch|umfassend|wesentlich|zeitgenössisch)\s+(das|die|der)\b',
-        "Bad article+adverb": r'\bein\s+(niemals|immer|weil|obwohl)\b'
-    }
-
-    for error_name, pattern in error_patterns.items():
-        matches = []
-        for item in data:
-            if re.search(pattern, item['sentence'], re.IGNORECASE):
-                matches.append(item)
+    matches_by_rule = {name: [] for name in ("de.adjective-as-noun", "de.adjective-as-verb", "de.indefinite-article-adverb")}
+    for item in data:
+        for rule, _ in check_sentence(item['sentence'], "de", "c1", severity="error"):
+            matches_by_rule.setdefault(rule.name, []).append(item)
 
+    for error_name, matches in matches_by_rule.items():
         if matches:
             print(f"\n❌ {error_name}: {len(matches)} errors found")
             for match in matches[:3]:
@@ -336,6 +336,9 @@ def main():
     print("="*70)
     print(f"📊 Total: {len(output_data)} sentences")
     print(f"📁 File: {output_file}")
+    overused = sum(1 for uses in BLOCKLIST.used.values() if uses > BLOCKLIST.max_reuse)
+    if overused:
+        print(f"⚠️  {overused} template skeletons used more than {BLOCKLIST.max_reuse} times")
     print("="*70)
 
 if __name__ == "__main__":
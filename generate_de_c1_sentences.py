@@ -6,11 +6,18 @@ Uses Anthropic Claude API to generate high-quality, contextually appropriate sen
 
 import json
 import os
+import sys
 from pathlib import Path
 from anthropic import Anthropic
 from datetime import date
 import time
 
+# Inflection index (scripts/inflections.py) for locating the target word
+sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+from inflections import InflectionIndex
+
+INFLECTIONS = InflectionIndex.from_files(["public/data/vahiko/de.json", "public/data/jawad/de.json"], "de")
+
 # Initialize Anthropic client
 client = Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
 
@@ -79,18 +86,8 @@ Example format:
         return None
 
 def find_word_position(sentence, target_word):
-    """Find the position (index) of the target word in the sentence."""
-    words = sentence.split()
-    target_lower = target_word.lower()
-
-    for i, word in enumerate(words):
-        # Remove punctuation for comparison
-        word_clean = word.strip('.,!?;:()[]{}«»"\'').lower()
-        if word_clean == target_lower or word_clean.startswith(target_lower):
-            return i
-
-    # If not found, return -1
-    return -1
+    """Find the position (index) of the target word or one of its inflections, or -1."""
+    return INFLECTIONS.find(sentence, target_word)
 
 def create_sentence_object(word, sentence_data, index, word_id):
     """Create a sentence object in the required format."""
@@ -6,12 +6,23 @@ Uses Anthropic Claude API with strict C1 validation and quality checks.
 
 import json
 import os
-import re
+import sys
 from pathlib import Path
 from anthropic import Anthropic
 from datetime import date
 import time
 
+# Inflection index (scripts/inflections.py) for locating the target word
+sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+from inflections import InflectionIndex
+from grammar_rules import format_findings
+from validation_cache import ValidationCache
+
+INFLECTIONS = InflectionIndex.from_files(["public/data/kafel/de.json"], "de")
+
+# Grammar results of sentences validated in earlier runs (scripts/validation_cache.py)
+VALIDATION_CACHE = ValidationCache.load()
+
 # Initialize Anthropic client
 client = Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
 
@@ -29,16 +40,10 @@ def validate_german_sentence(sentence):
     Validate German sentence for common C1 errors.
     Returns (is_valid, error_message).
     """
-    # Check for adjectives used as nouns/verbs incorrectly
-    problematic_patterns = [
-        r'\bein (niemals|immer|weil|obwohl)\b',  # Articles before adverbs/conjunctions
-        r'\bDas (strategisch|umfassend|wesentlich|zeitgenössisch|entscheidend) (ist|muss|sollte|wird)\b',  # Adjectives as nouns
-        r'\bsollte (strategisch|umfassend|wesentlich|zeitgenössisch) das\b',  # Adjectives as verbs
-    ]
-
-    for pattern in problematic_patterns:
-        if re.search(pattern, sentence, re.IGNORECASE):
-            return False, f"Invalid pattern found: {pattern}"
+    # Check for articles before adverbs/conjunctions and adjectives as nouns/verbs
+    findings = VALIDATION_CACHE.check_sentence(sentence, "de", "c1", severity="error")
+    if findings:
+        return False, f"Invalid pattern found: {format_findings(findings)}"
 
     # Check sentence length (should be 15-22 words for C1)
     word_count = len(sentence.split())
@@ -138,20 +143,8 @@ Example format:
         return None
 
 def find_word_position(sentence, target_word):
-    """Find the position (index) of the target word in the sentence."""
-    words = sentence.split()
-    target_lower = target_word.lower()
-    # Also try without article
-    target_without_article = target_word.split()[-1].lower() if ' ' in target_word else target_lower
-
-    for i, word in enumerate(words):
-        # Remove punctuation for comparison
-        word_clean = word.strip('.,!?;:()[]{}«»"\'').lower()
-        if word_clean == target_lower or word_clean == target_without_article or word_clean.startswith(target_without_article):
-            return i
-
-    # If not found, return -1
-    return -1
+    """Find the position (index) of the target word or one of its inflections, or -1."""
+    return INFLECTIONS.find(sentence, target_word)
 
 def create_sentence_object(word, sentence_data, index, word_id):
     """Create a sentence object in the required format."""
@@ -375,6 +368,7 @@ def main():
 
     # Generate all sentences
     sentences_data, total_words = generate_all_sentences(kafel_data)
+    VALIDATION_CACHE.save()
 
     if not sentences_data:
         print("\n❌ No sentences were generated. Exiting.")
@@ -4,7 +4,7 @@
 // - Assets: Cache-first with versioning
 // - Version mismatch: Unregister SW and clear all caches
 
-const CACHE_NAME = 'lingxm-v21';  // Phase 4: Multilingual sentences added (Arabic, French, Italian)
+const CACHE_NAME = 'lingxm-v22';  // Data artifacts cached by content hash on first use (precache-manifest.js)
 
 const urlsToCache = [
   '/',
@@ -24,6 +24,116 @@ const urlsToCache = [
   '/sql-wasm.wasm'
 ];
 
+// Data artifacts are cached under content-hashed URLs
+// (generated by scripts/build_precache_manifest.py) the first time the app
+// requests them, so a client only stores its own profile's files. Entries in
+// this cache never change, so it survives CACHE_NAME bumps and only new
+// hashes are fetched.
+const DATA_CACHE_NAME = 'lingxm-data';
+
+try {
+  importScripts('/precache-manifest.js');
+} catch (error) {
+  console.warn('[Service Worker] No precache manifest, data files use the asset cache');
+}
+
+const PRECACHE_MANIFEST = self.__PRECACHE_MANIFEST || { version: null, files: {} };
+
+// Hashed data URL -> { path, hash } ('/data/hashed/de/x.<hash>.json' -> '/data/de/x.json')
+function parseHashedUrl(hashedUrl) {
+  const match = new URL(hashedUrl, self.location.origin).pathname.match(/^\/data\/hashed\/(.+)\.([0-9a-f]+)\.json$/);
+  return match ? { path: `/data/${match[1]}.json`, hash: match[2] } : null;
+}
+
+// Apply a delta patch (port of apply_patch in scripts/build_corpus_deltas.py)
+function applyPatch(value, patch) {
+  if ('$replace' in patch) {
+    return patch.$replace;
+  }
+
+  const field = patch.$key;
+  const oldKeys = field ? value.map((item) => item[field]) : Object.keys(value);
+  const mapping = new Map(field ? value.map((item) => [item[field], item]) : Object.entries(value));
+
+  for (const key of patch.$del || []) {
+    mapping.delete(key);
+  }
+  for (const [key, sub] of Object.entries(patch.$patch || {})) {
+    mapping.set(key, applyPatch(mapping.get(key), sub));
+  }
+  for (const [key, item] of Object.entries(patch.$set || {})) {
+    mapping.set(key, item);
+  }
+
+  const kept = new Set(oldKeys);
+  const order = patch.$order || [
+    ...oldKeys.filter((key) => mapping.has(key)),
+    ...[...mapping.keys()].filter((key) => !kept.has(key))
+  ];
+  return field
+    ? order.map((key) => mapping.get(key))
+    : Object.fromEntries(order.map((key) => [key, mapping.get(key)]));
+}
+
+// Bring a cached artifact to the manifest's hash: patch it when the delta
+// build (scripts/build_corpus_deltas.py) has a patch from the cached hash,
+// otherwise download the new copy
+function upgradeArtifact(cache, request, entry, cachedHash) {
+  const patchUrl = entry.patches && entry.patches[cachedHash];
+  if (!patchUrl) {
+    return cache.add(entry.url);
+  }
+
+  return Promise.all([
+    cache.match(request).then((response) => response.json()),
+    fetch(patchUrl).then((response) => {
+      if (!response.ok) {
+        throw new Error(`HTTP ${response.status}`);
+      }
+      return response.json();
+    })
+  ]).then(([data, document]) => cache.put(entry.url, new Response(
+    JSON.stringify(applyPatch(data, document.patch)),
+    { headers: { 'Content-Type': 'application/json' } }
+  ))).catch((error) => {
+    console.warn(`[Service Worker] Patch failed for ${entry.url}, refetching:`, error);
+    return cache.add(entry.url);
+  });
+}
+
+// Upgrade every cached artifact whose hash changed (before pruning the old copies)
+function refreshDataCache() {
+  return caches.open(DATA_CACHE_NAME).then((cache) =>
+    cache.keys().then((requests) => Promise.all(requests.map((request) => {
+      const cached = parseHashedUrl(request.url);
+      const entry = cached && PRECACHE_MANIFEST.files[cached.path];
+      if (!entry || entry.hash === cached.hash) {
+        return null;
+      }
+      return cache.match(entry.url).then((current) =>
+        current || upgradeArtifact(cache, request, entry, cached.hash)
+      ).catch((error) => {
+        console.warn(`[Service Worker] Could not refresh ${cached.path}:`, error);
+      });
+    })))
+  );
+}
+
+// Drop hashed data entries that are no longer in the manifest
+function pruneDataCache() {
+  const current = new Set(
+    Object.values(PRECACHE_MANIFEST.files).map((entry) => new URL(entry.url, self.location.origin).href)
+  );
+
+  return caches.open(DATA_CACHE_NAME).then((cache) =>
+    cache.keys().then((requests) => Promise.all(
+      requests
+        .filter((request) => !current.has(request.url))
+        .map((request) => cache.delete(request))
+    ))
+  );
+}
+
 // Install event - cache essential files
 self.addEventListener('install', (event) => {
   console.log('[Service Worker] Installing...');
@@ -64,6 +174,28 @@ self.addEventListener('fetch', (event) => {
     return;
   }
 
+  // Hashed data artifacts: serve the immutable copy for the requested URL
+  const dataEntry = PRECACHE_MANIFEST.files[url.pathname];
+  if (dataEntry && url.origin === self.location.origin) {
+    event.respondWith(
+      caches.open(DATA_CACHE_NAME).then((cache) =>
+        cache.match(dataEntry.url).then((cached) => {
+          if (cached) {
+            return cached;
+          }
+          return fetch(dataEntry.url).then((response) => {
+            if (response && response.status === 200) {
+              cache.put(dataEntry.url, response.clone());
+              return response;
+            }
+            return fetch(event.request);
+          });
+        })
+      ).catch(() => fetch(event.request))
+    );
+    return;
+  }
+
   // Cache-first strategy for all other assets (CSS, JS, images, etc.)
   event.respondWith(
     caches.match(event.request)
@@ -108,13 +240,13 @@ self.addEventListener('activate', (event) => {
     caches.keys().then((cacheNames) => {
       return Promise.all(
         cacheNames.map((cacheName) => {
-          if (cacheName !== CACHE_NAME) {
+          if (cacheName !== CACHE_NAME && cacheName !== DATA_CACHE_NAME) {
             console.log('[Service Worker] Deleting old cache:', cacheName);
             return caches.delete(cacheName);
           }
         })
       );
-    })
+    }).then(() => refreshDataCache()).then(() => pruneDataCache())
   );
   // Claim clients immediately
   return self.clients.claim();
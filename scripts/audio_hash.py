@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Python port of the audio filename hash (scripts/hash.js, AudioManager.generateHash).
+
+    hash = 0
+    for each UTF-16 code unit c of text.toLowerCase().trim():
+        hash = ToInt32((hash << 5) - hash + c)
+    Math.abs(hash).toString(16).substring(0, 8)
+
+The JS loop iterates charCodeAt, i.e. UTF-16 code units, so characters
+outside the BMP contribute two surrogate units here as well. trim() strips
+the ECMAScript whitespace set, which includes U+FEFF unlike str.strip().
+
+Usage:
+    python3 scripts/audio_hash.py Hallo de
+"""
+
+import sys
+
+# ECMAScript WhiteSpace + LineTerminator (String.prototype.trim)
+JS_WHITESPACE = (
+    "\t\n\v\f\r \u00a0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006"
+    "\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000\ufeff"
+)
+
+
+def _to_int32(value):
+    value &= 0xFFFFFFFF
+    return value - 0x100000000 if value & 0x80000000 else value
+
+
+def utf16_units(text):
+    """UTF-16 code units of text, as String.prototype.charCodeAt yields them."""
+    encoded = text.encode("utf-16-le", "surrogatepass")
+    return [int.from_bytes(encoded[i:i + 2], "little") for i in range(0, len(encoded), 2)]
+
+
+def normalize(text):
+    """text.toLowerCase().trim()"""
+    return text.lower().strip(JS_WHITESPACE)
+
+
+def generate_hash(text):
+    """8-hex-char (or shorter) audio hash, identical to generateHash in JS."""
+    value = 0
+    for unit in utf16_units(normalize(text)):
+        value = _to_int32((value << 5) - value + unit)
+    return format(abs(value), "x")[:8]
+
+
+def normalize_language(language):
+    """Base language code, as AudioManager.normalizeLanguage ('de-gastro' -> 'de')."""
+    return language.lower().split("-", 1)[0]
+
+
+def audio_filename(word, language):
+    """Relative audio path: de/abc123ef.mp3"""
+    return f"{normalize_language(language)}/{generate_hash(word)}.mp3"
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python3 scripts/audio_hash.py <word> [language]")
+        sys.exit(1)
+    word, lang = sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else "de"
+    print(f"Word: {word}")
+    print(f"Hash: {generate_hash(word)}")
+    print(f"Filename: {audio_filename(word, lang)}")
@@ -8,6 +8,8 @@ import json
 import os
 from datetime import date
 
+import corpus
+
 
 def load_vocabulary(file_paths):
     """Load and merge vocabulary from multiple files."""
@@ -166,7 +168,7 @@ def main():
             "language_name": "Italian",
             "level": "A1",
             "source_profiles": ["ameeno"],
-            "source_files": [f"{base_dir}/public/data/ameeno/it.json"],
+            "source_files": [str(corpus.url_to_path(corpus.vocabulary_url("ameeno", "it")))],
             "output_file": f"{base_dir}/temp/it-a1-sentences-template.json",
             "translation_langs": ["fa", "en"],
             "gen_lang": "en",
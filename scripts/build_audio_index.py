@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Build a per-language index of word -> audio file, with collision checks.
+
+AudioManager maps a word to /audio/<lang>/<hash>.mp3 with a 32-bit rolling
+hash (scripts/audio_hash.py) and learns that a file is missing only when
+the request fails (failedHashes). Nothing checks whether two words share a
+hash, in which case one of them plays the other's recording.
+
+For every vocabulary word of every profile, this script computes the hash
+and checks public/audio/<lang>/<hash>.mp3. Collisions (different words,
+same hash) are resolved with audio-raw/batch-mapping.json, which records
+the word each file was cut for. The other words on that hash are marked
+as having no audio.
+
+Output (one file per language):
+    public/data/audio/<lang>.json
+    {
+      "language": "de",
+      "available": ["die ambivalenz", ...],      # normalized words the app may fetch
+      "words": {"die Ambivalenz": {"hash": "5e74756", "audio": true}, ...},
+      "collisions": {"<hash>": {"words": [...], "owner": "..." or null}},
+      "orphans": ["<hash>", ...]                 # files no vocabulary word maps to
+    }
+
+The app loads the index once per language. It skips fetching any word whose
+normalized form (toLowerCase().trim()) is not in "available" and goes
+straight to speech synthesis. The check is by word, not by hash: a word
+that merely shares its hash with the owner of a file must not fetch it.
+"""
+
+import corpus
+from audio_hash import generate_hash, normalize, normalize_language
+
+AUDIO_DIR = corpus.PUBLIC_DIR / "audio"
+BATCH_MAPPING = corpus.ROOT / "audio-raw/batch-mapping.json"
+AUDIO_INDEX_DIR = corpus.DATA_DIR / "audio"
+
+
+def vocabulary_words():
+    """Base language -> {normalized word: word as written} across all profiles."""
+    words = {}
+    for profile_key, profile in corpus.load_profiles().items():
+        for lang in profile["learningLanguages"]:
+            path = corpus.url_to_path(corpus.vocabulary_url(profile_key, lang["code"]))
+            if not path.is_file():
+                continue
+            bucket = words.setdefault(normalize_language(lang["code"]), {})
+            for entry in corpus.load_json(path):
+                word = entry.get("word") if isinstance(entry, dict) else None
+                if isinstance(word, str) and normalize(word):
+                    bucket.setdefault(normalize(word), word.strip())
+    return words
+
+
+def recorded_words():
+    """'de/abc.mp3' -> normalized word the file was cut for (from batch-mapping.json)."""
+    if not BATCH_MAPPING.is_file():
+        return {}
+    owners = {}
+    for entries in corpus.load_json(BATCH_MAPPING).values():
+        for entry in entries:
+            owners[entry["filename"]] = normalize(entry["word"])
+    return owners
+
+
+def build_language_index(language, words, owners):
+    """Index document for one language."""
+    files = {path.stem for path in (AUDIO_DIR / language).glob("*.mp3")}
+
+    by_hash = {}
+    for key in sorted(words):
+        by_hash.setdefault(generate_hash(key), []).append(key)
+
+    collisions = {}
+    entries = {}
+    available = []
+    for digest, keys in sorted(by_hash.items()):
+        has_file = digest in files
+        owner = None
+        if len(keys) > 1:
+            owner = owners.get(f"{language}/{digest}.mp3")
+            owner = owner if owner in keys else None
+            collisions[digest] = {"words": [words[k] for k in keys], "owner": words[owner] if owner else None}
+        for key in keys:
+            audio = has_file and (len(keys) == 1 or key == owner)
+            entries[words[key]] = {"hash": digest, "audio": audio}
+            if audio:
+                available.append(key)
+
+    return {
+        "language": language,
+        "available": sorted(available),
+        "words": dict(sorted(entries.items())),
+        "collisions": collisions,
+        "orphans": sorted(files - set(by_hash))
+    }
+
+
+def main():
+    print("=" * 70)
+    print("Building Audio Index")
+    print("=" * 70)
+
+    owners = recorded_words()
+    written = set()
+    for language, words in sorted(vocabulary_words().items()):
+        index = build_language_index(language, words, owners)
+        path = AUDIO_INDEX_DIR / f"{language}.json"
+        corpus.write_json(path, index, compact=True)
+        written.add(path)
+
+        with_audio = sum(1 for entry in index["words"].values() if entry["audio"])
+        print(f"   ✅ {language}: {with_audio}/{len(index['words'])} words with audio, "
+              f"{len(index['collisions'])} collisions, {len(index['orphans'])} orphan files")
+        for digest, collision in index["collisions"].items():
+            owner = collision["owner"] or "no owner"
+            print(f"      ⚠️  {digest}: {' / '.join(collision['words'])} ({owner})")
+
+    indexed = {path.stem for path in written}
+    for directory in sorted(path for path in AUDIO_DIR.iterdir() if path.is_dir()):
+        # sprites/ holds build_audio_sprites.py output, not clips
+        if directory.name not in indexed and directory.name != "sprites":
+            print(f"   ⚠️  {directory.name}: audio files but no vocabulary, not indexed")
+
+    for stale in AUDIO_INDEX_DIR.glob("*.json"):
+        if stale not in written:
+            stale.unlink()
+
+    print("=" * 70)
+    print(f"✅ {len(written)} audio indexes in {corpus.path_to_url(AUDIO_INDEX_DIR)}")
+
+
+if __name__ == "__main__":
+    main()
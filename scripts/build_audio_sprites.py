@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Concatenate each profile language's word clips into one sprite per day.
+
+AudioManager fetches one small MP3 per word (/audio/<lang>/<hash>.mp3,
+about 2,600 files), so a study session costs one request per word and the
+iOS bundle carries thousands of tiny files. The app walks a vocabulary
+file in order, dailyWords (src/config.js) words a day. Here the clips of
+every block of dailyWords words become one sprite, so a day's audio is one
+request, or two when the day starts mid-block.
+
+Clips are MPEG Layer III as split_audio.py cuts them. A sprite is their
+audio frames back to back (ID3 tags and Xing/Info frames dropped), with
+nothing re-encoded; the few frames at the start of a clip whose bit
+reservoir reaches into the previous clip are muted, so each clip decodes
+as it does on its own. Offsets come from the frame counts plus the decoder
+delay and are exact to the sample. Only words the audio index
+(build_audio_index.py) marks as having unambiguous audio are included.
+
+Output:
+    public/audio/sprites/<lang>/<hash>.mp3   content-addressed, so profiles with
+                                             the same vocabulary share sprites
+    public/audio/sprites/clips.json          clips every sprite placement covers; the
+                                             build drops them from dist (vite.config.js)
+    public/data/audio/sprites/<profile>.json
+    {
+      "profile": "salman",
+      "languages": {
+        "de-gastro": {
+          "dailyWords": 10,
+          "sprites": ["/audio/sprites/de/3f2a9c01d4.mp3", ...],      # block order
+          "words": {"<word, lowercased and trimmed>": [sprite, offset s, duration s], ...}
+        }
+      }
+    }
+
+Usage:
+    python3 scripts/build_audio_sprites.py
+"""
+
+import sys
+
+import corpus
+from audio_hash import normalize, normalize_language
+from build_audio_index import AUDIO_DIR, AUDIO_INDEX_DIR, build_language_index, recorded_words, vocabulary_words
+
+SPRITES_DIR = AUDIO_DIR / "sprites"
+SPRITE_INDEX_DIR = AUDIO_INDEX_DIR / "sprites"
+COVERAGE_FILE = SPRITES_DIR / "clips.json"
+
+HASH_LENGTH = 10
+DEFAULT_DAILY_WORDS = 10
+
+# Layer III bitrates (kbit/s) by MPEG-1 / MPEG-2 and 2.5, and sample rates by version
+BITRATES = {
+    1: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+# Samples a Layer III decoder outputs before the first frame's audio
+DECODER_DELAY = 529
+
+
+def skip_id3(data):
+    """Offset of the first byte after a leading ID3v2 tag."""
+    if data[:3] != b"ID3" or len(data) < 10:
+        return 0
+    size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+    return 10 + size + (10 if data[5] & 0x10 else 0)
+
+
+def mp3_frames(data):
+    """Yield (frame bytes, samples, sample rate, side info offset, side info layout) per audio frame.
+
+    The layout is (main_data_begin bits, bits before the first granule,
+    granule/channel blocks, bits per block).
+    """
+    position = skip_id3(data)
+    first = True
+    while position + 4 <= len(data):
+        b1, b2, b3 = data[position + 1], data[position + 2], data[position + 3]
+        version = (b1 >> 3) & 3
+        if data[position] != 0xFF or b1 & 0xE0 != 0xE0 or version == 1 or (b1 >> 1) & 3 != 1:
+            break
+        bitrate = BITRATES[1 if version == 3 else 2][b2 >> 4] * 1000
+        if not bitrate or (b2 >> 2) & 3 == 3:
+            break
+        rate = SAMPLE_RATES[version][(b2 >> 2) & 3]
+        samples = 1152 if version == 3 else 576
+        length = samples // 8 * bitrate // rate + ((b2 >> 1) & 1)
+        frame = data[position:position + length]
+        position += length
+
+        channels = 1 if b3 >> 6 == 3 else 2
+        if version == 3:
+            layout = (9, 9 + (5 if channels == 1 else 3) + 4 * channels, 2 * channels, 59)
+        else:
+            layout = (8, 8 + channels, channels, 63)
+        side_info = 4 if b1 & 1 else 6
+
+        # The first frame of an encoder's output may be a Xing/Info header, not audio
+        if first and (b"Xing" in frame[:48] or b"Info" in frame[:48]):
+            first = False
+            continue
+        first = False
+        yield frame, samples, rate, side_info, layout
+
+
+def main_data(frame, side_info, layout):
+    """(main_data_begin, bytes of main data the frame carries)."""
+    begin_bits, skip, blocks, block_bits = layout
+    size = (skip + blocks * block_bits + 7) // 8
+    bits = int.from_bytes(frame[side_info:side_info + size], "big")
+    return bits >> (size * 8 - begin_bits), len(frame) - side_info - size
+
+
+def mute(frame, side_info, layout):
+    """The frame with part2_3_length, big_values and global_gain zeroed (decodes to silence).
+
+    main_data_begin is kept: the decoder still steps back over the same
+    bytes, so the reservoir of the frames that follow is unchanged.
+    """
+    _, skip, blocks, block_bits = layout
+    size = (skip + blocks * block_bits + 7) // 8
+    bits = int.from_bytes(frame[side_info:side_info + size], "big")
+    total = size * 8
+    for block in range(blocks):
+        # part2_3_length (12), big_values (9), global_gain (8) open every block
+        start = skip + block * block_bits
+        bits &= ~(((1 << 29) - 1) << (total - start - 29))
+    return frame[:side_info] + bits.to_bytes(size, "big") + frame[side_info + size:]
+
+
+def clip_frames(payload):
+    """(frames, samples, sample rate) of a clip, ready to follow any other clip.
+
+    Frames use the bit reservoir: their data may start up to
+    main_data_begin bytes back, in earlier frames. At the start of a clip
+    that reaches into the previous clip of the sprite and decodes to a
+    full-scale click, so frames reaching before the clip are muted, as a
+    decoder does when the clip is played on its own.
+    """
+    frames, samples, rates = [], 0, set()
+    available = 0
+    for frame, count, rate, side_info, layout in mp3_frames(payload):
+        begin, carried = main_data(frame, side_info, layout)
+        frames.append(frame if begin <= available else mute(frame, side_info, layout))
+        available += carried
+        samples += count
+        rates.add(rate)
+    return frames, samples, rates
+
+
+def daily_blocks(words, daily):
+    """Consecutive blocks of daily words (block k starts at word k * daily)."""
+    return [words[start:start + daily] for start in range(0, len(words), daily)]
+
+
+def build_sprite(clips):
+    """(sprite bytes, [(offset, duration)] per clip) for a block's clip payloads.
+
+    Offsets are where a clip starts in the decoded sprite, which lags the
+    frames by the decoder delay (there is no Xing/Info header to trim it).
+    """
+    chunks, placements = [], []
+    samples_before, rate = DECODER_DELAY, None
+    for payload in clips:
+        frames, samples, rates = clip_frames(payload)
+        if len(rates) != 1 or (rate and rates != {rate}):
+            placements.append(None)
+            continue
+        rate = rates.pop()
+        chunks += frames
+        placements.append((samples_before / rate, samples / rate))
+        samples_before += samples
+    return b"".join(chunks), placements
+
+
+def audio_words(language, words_by_language, owners, cache):
+    """{normalized word: clip path} of the words with unambiguous audio in a base language."""
+    if language not in cache:
+        index = build_language_index(language, words_by_language.get(language, {}), owners)
+        cache[language] = {normalize(word): AUDIO_DIR / language / f"{entry['hash']}.mp3"
+                           for word, entry in index["words"].items() if entry["audio"]}
+    return cache[language]
+
+
+def build_profile(profile_key, profile, words_by_language, owners, cache, written, covered):
+    """Sprites and index document of one profile.
+
+    covered maps each clip path to whether every placement of it so far
+    succeeded; a clip that failed once (mixed sample rates) stays False.
+    """
+    languages = {}
+    for lang in profile["learningLanguages"]:
+        code = lang["code"]
+        path = corpus.url_to_path(corpus.vocabulary_url(profile_key, code))
+        if not path.is_file():
+            continue
+        clips = audio_words(normalize_language(code), words_by_language, owners, cache)
+        vocabulary = [entry["word"] for entry in corpus.load_json(path)
+                      if isinstance(entry, dict) and isinstance(entry.get("word"), str)]
+        daily = lang.get("dailyWords") or DEFAULT_DAILY_WORDS
+
+        sprites, words = [], {}
+        for block in daily_blocks(vocabulary, daily):
+            keys = list(dict.fromkeys(normalize(word) for word in block if normalize(word) in clips))
+            keys = [key for key in keys if key not in words]
+            if not keys:
+                continue
+            payload, placements = build_sprite([clips[key].read_bytes() for key in keys])
+            if not payload:
+                continue
+
+            digest = corpus.content_hash(payload, HASH_LENGTH)
+            target = SPRITES_DIR / normalize_language(code) / f"{digest}.mp3"
+            if not target.exists():
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_bytes(payload)
+            written.add(target)
+
+            for key, placement in zip(keys, placements):
+                covered[clips[key]] = covered.get(clips[key], True) and bool(placement)
+                if placement:
+                    words[key] = [len(sprites), round(placement[0], 6), round(placement[1], 6)]
+            sprites.append(corpus.path_to_url(target))
+
+        languages[code] = {"dailyWords": daily, "sprites": sprites, "words": words}
+    return {"profile": profile_key, "languages": languages}
+
+
+def main():
+    print("=" * 70)
+    print("Building Audio Sprites")
+    print("=" * 70)
+
+    if not AUDIO_DIR.is_dir():
+        print(f"❌ No clips in {AUDIO_DIR.relative_to(corpus.ROOT)} (run: npm run split-audio)")
+        sys.exit(1)
+
+    words_by_language = vocabulary_words()
+    owners = recorded_words()
+    cache = {}
+    written = set()
+    indexes = set()
+    covered = {}
+    for profile_key, profile in corpus.load_profiles().items():
+        document = build_profile(profile_key, profile, words_by_language, owners, cache, written, covered)
+        path = SPRITE_INDEX_DIR / f"{profile_key}.json"
+        corpus.write_json(path, document, compact=True)
+        indexes.add(path)
+
+        for code, entry in document["languages"].items():
+            size = sum(corpus.url_to_path(url).stat().st_size for url in entry["sprites"])
+            print(f"   ✅ {profile_key:8} {code:10} {len(entry['words']):4} words in "
+                  f"{len(entry['sprites']):3} sprites ({size / 1024:.0f} KB)")
+
+    # Clips played only from sprites need not ship; the rest stay as single files
+    covered_clips = sorted(corpus.path_to_url(path) for path, ok in covered.items() if ok)
+    corpus.write_json(COVERAGE_FILE, {"clips": covered_clips}, compact=True)
+
+    stale = [path for path in SPRITES_DIR.rglob("*.mp3") if path not in written]
+    stale += [path for path in SPRITE_INDEX_DIR.glob("*.json") if path not in indexes]
+    for path in stale:
+        path.unlink()
+
+    clips = sum(1 for _ in AUDIO_DIR.glob("*/*.mp3"))
+    print("=" * 70)
+    print(f"✅ {len(written)} sprites for {clips} clips, {len(indexes)} indexes in "
+          f"{corpus.path_to_url(SPRITE_INDEX_DIR)} ({len(stale)} stale files removed)")
+    print(f"✅ {len(covered_clips)} clips covered by sprites, left out of the build "
+          f"({corpus.path_to_url(COVERAGE_FILE)})")
+
+
+if __name__ == "__main__":
+    main()
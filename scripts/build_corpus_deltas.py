@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Build entry-level delta patches between corpus versions.
+
+Every vocabulary and sentence file is diffed against the versions listed in
+the previous manifest. Instead of a byte-level delta the patch addresses
+JSON entries (vocabulary words, sentence lists per word, metadata keys), so
+a handful of sentence fixes becomes a patch of a few KB that the client
+applies to its cached copy instead of refetching the whole file.
+
+Output:
+    public/data/versions/manifest.json          version manifest
+    public/data/versions/patches/*.json         one patch per (artifact, from, to)
+    .content-cache/snapshots/<hash>.json.gz     previous versions (local only)
+
+Patch format (applied recursively by apply_patch):
+    {"$set": {key: value}, "$del": [key], "$patch": {key: subpatch},
+     "$order": [key, ...], "$key": "word"}
+"$key" marks a list of objects addressed by that field; "$order" is only
+present when the resulting key order cannot be derived from the edits.
+"""
+
+import argparse
+import gzip
+import json
+import subprocess
+from datetime import datetime
+
+import corpus
+
+VERSIONS_DIR = corpus.DATA_DIR / "versions"
+PATCHES_DIR = VERSIONS_DIR / "patches"
+MANIFEST_FILE = VERSIONS_DIR / "manifest.json"
+SNAPSHOT_DIR = corpus.ROOT / ".content-cache/snapshots"
+
+# Keep patches from this many previous versions of each artifact
+HISTORY_DEPTH = 3
+
+# Fields that identify an object inside a list, in order of preference
+LIST_KEYS = ("word", "id")
+
+
+def list_key_field(items):
+    """Return the field that uniquely identifies every object in a list."""
+    if not items or not all(isinstance(item, dict) for item in items):
+        return None
+    for field in LIST_KEYS:
+        values = [item.get(field) for item in items]
+        if all(isinstance(v, str) for v in values) and len(set(values)) == len(values):
+            return field
+    return None
+
+
+def _as_mapping(value, field):
+    """View a keyed list as an ordered dict."""
+    if field is None:
+        return value
+    return {item[field]: item for item in value}
+
+
+def _default_order(old_keys, new_keys):
+    """Key order produced by applying deletes then appending new keys."""
+    kept = [k for k in old_keys if k in new_keys]
+    added = [k for k in new_keys if k not in set(old_keys)]
+    return kept + added
+
+
+def diff_json(old, new):
+    """Return a patch turning old into new, or None when they are equal."""
+    if old == new and json.dumps(old) == json.dumps(new):
+        return None
+
+    field = None
+    if isinstance(old, list) and isinstance(new, list):
+        field = list_key_field(old)
+        if field is None or field != list_key_field(new):
+            return {"$replace": new}
+    elif not (isinstance(old, dict) and isinstance(new, dict)):
+        return {"$replace": new}
+
+    old_map = _as_mapping(old, field)
+    new_map = _as_mapping(new, field)
+    patch = {}
+    sets, subpatches = {}, {}
+
+    for key, value in new_map.items():
+        if key not in old_map:
+            sets[key] = value
+            continue
+        sub = diff_json(old_map[key], value)
+        if sub is None:
+            continue
+        if "$replace" in sub or len(json.dumps(sub)) >= len(json.dumps(value)):
+            sets[key] = value
+        else:
+            subpatches[key] = sub
+
+    deleted = [key for key in old_map if key not in new_map]
+    new_keys = list(new_map)
+
+    if field:
+        patch["$key"] = field
+    if sets:
+        patch["$set"] = sets
+    if deleted:
+        patch["$del"] = deleted
+    if subpatches:
+        patch["$patch"] = subpatches
+    if _default_order(list(old_map), new_keys) != new_keys:
+        patch["$order"] = new_keys
+    return patch
+
+
+def apply_patch(value, patch):
+    """Apply a patch produced by diff_json."""
+    if "$replace" in patch:
+        return patch["$replace"]
+
+    field = patch.get("$key")
+    mapping = dict(_as_mapping(value, field))
+
+    for key in patch.get("$del", []):
+        mapping.pop(key, None)
+    for key, sub in patch.get("$patch", {}).items():
+        mapping[key] = apply_patch(mapping[key], sub)
+    for key, item in patch.get("$set", {}).items():
+        mapping[key] = item
+
+    order = patch.get("$order") or _default_order(list(_as_mapping(value, field)), list(mapping))
+    result = {key: mapping[key] for key in order}
+    return list(result.values()) if field else result
+
+
+def snapshot_path(digest):
+    return SNAPSHOT_DIR / f"{digest}.json.gz"
+
+
+def save_snapshot(digest, payload):
+    path = snapshot_path(digest)
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(gzip.compress(payload))
+
+
+def load_snapshot(digest, url, base_rev):
+    """Previous content by hash: local snapshot first, then git (--base)."""
+    path = snapshot_path(digest)
+    if path.exists():
+        return json.loads(gzip.decompress(path.read_bytes()))
+
+    if base_rev:
+        git_path = corpus.url_to_path(url).relative_to(corpus.ROOT).as_posix()
+        result = subprocess.run(
+            ["git", "show", f"{base_rev}:{git_path}"],
+            cwd=corpus.ROOT, capture_output=True
+        )
+        if result.returncode == 0 and corpus.content_hash(result.stdout, 12) == digest:
+            save_snapshot(digest, result.stdout)
+            return json.loads(result.stdout)
+    return None
+
+
+def seed_manifest_from_git(base_rev):
+    """Manifest entries for the corpus as it was at a git revision."""
+    artifacts = {}
+    for path in corpus.iter_data_files():
+        git_path = path.relative_to(corpus.ROOT).as_posix()
+        result = subprocess.run(
+            ["git", "show", f"{base_rev}:{git_path}"],
+            cwd=corpus.ROOT, capture_output=True
+        )
+        if result.returncode == 0:
+            digest = corpus.content_hash(result.stdout, 12)
+            save_snapshot(digest, result.stdout)
+            artifacts[corpus.path_to_url(path)] = {"hash": digest, "history": []}
+    return {"artifacts": artifacts}
+
+
+def build_patch(url, old_hash, new_hash, old_data, new_data, full_size):
+    """Write a patch file if it is smaller than refetching the artifact."""
+    patch = diff_json(old_data, new_data)
+    if patch is None:
+        return None
+
+    # Sanity check: the patch must reproduce the new file exactly
+    rebuilt = apply_patch(old_data, patch)
+    if corpus.dump_json(rebuilt, compact=True) != corpus.dump_json(new_data, compact=True):
+        raise AssertionError(f"Patch for {url} does not reproduce the artifact")
+
+    document = {"artifact": url, "from": old_hash, "to": new_hash, "patch": patch}
+    payload = corpus.dump_json(document, compact=True).encode("utf-8")
+    if len(payload) >= full_size:
+        return None
+
+    stem = url.strip("/").replace("/", "__").removesuffix(".json")
+    path = PATCHES_DIR / f"{stem}.{old_hash}-{new_hash}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(payload)
+    return {"file": corpus.path_to_url(path), "size": len(payload)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build corpus delta patches")
+    parser.add_argument("--base", metavar="REV",
+                        help="git revision to diff against when no previous manifest/snapshot exists")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("Building Corpus Deltas")
+    print("=" * 70)
+
+    if MANIFEST_FILE.exists():
+        previous = corpus.load_json(MANIFEST_FILE)
+    elif args.base:
+        print(f"\n🌱 Seeding previous version from git {args.base}")
+        previous = seed_manifest_from_git(args.base)
+    else:
+        previous = {"artifacts": {}}
+
+    artifacts = {}
+    changed = 0
+    patch_count = 0
+    patch_bytes = 0
+    full_bytes = 0
+
+    for path in corpus.iter_data_files():
+        url = corpus.path_to_url(path)
+        payload = path.read_bytes()
+        digest = corpus.content_hash(payload, 12)
+        try:
+            data = json.loads(payload)
+        except json.JSONDecodeError as e:
+            print(f"   ⚠️  Skipping invalid JSON {url}: {e}")
+            continue
+        save_snapshot(digest, payload)
+
+        old_entry = previous["artifacts"].get(url, {})
+        history = [h for h in [old_entry.get("hash")] + old_entry.get("history", []) if h]
+        history = list(dict.fromkeys(h for h in history if h != digest))[:HISTORY_DEPTH]
+
+        entry = {
+            "hash": digest,
+            "size": len(payload),
+            "history": history,
+            "patches": {}
+        }
+
+        if old_entry.get("hash") not in (None, digest):
+            changed += 1
+            full_bytes += len(payload)
+
+        for old_hash in history:
+            old_data = load_snapshot(old_hash, url, args.base)
+            if old_data is None:
+                continue
+            patch_info = build_patch(url, old_hash, digest, old_data, data, len(payload))
+            if patch_info:
+                entry["patches"][old_hash] = patch_info
+                patch_count += 1
+                if old_hash == old_entry.get("hash"):
+                    patch_bytes += patch_info["size"]
+                    print(f"   🔧 {url}: {len(payload) / 1024:.0f} KB → patch {patch_info['size'] / 1024:.1f} KB")
+
+        artifacts[url] = entry
+
+    # Remove patch files that are no longer referenced
+    referenced = {p["file"] for a in artifacts.values() for p in a["patches"].values()}
+    if PATCHES_DIR.exists():
+        for stale in PATCHES_DIR.glob("*.json"):
+            if corpus.path_to_url(stale) not in referenced:
+                stale.unlink()
+
+    version = corpus.content_hash("".join(f"{u}:{a['hash']}" for u, a in sorted(artifacts.items())), 12)
+    previous_version = previous.get("version")
+    if version == previous_version:
+        generated = previous.get("generated")
+        previous_version = previous.get("previous")
+    else:
+        generated = datetime.now().isoformat(timespec="seconds")
+
+    manifest = {
+        "version": version,
+        "previous": previous_version,
+        "generated": generated,
+        "artifacts": artifacts
+    }
+    corpus.write_json(MANIFEST_FILE, manifest)
+
+    print("\n" + "=" * 70)
+    print(f"✅ Version {version} ({len(artifacts)} artifacts, {changed} changed)")
+    if changed:
+        print(f"   Patches: {patch_count} written, {patch_bytes / 1024:.1f} KB "
+              f"vs {full_bytes / 1024:.0f} KB full refetch")
+    print(f"   Manifest: {corpus.path_to_url(MANIFEST_FILE)}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Precompute word-bank distractors for every vocabulary file.
+
+SentenceManager.selectDistractors used to filter the whole vocabulary by a
+±3 character length window and shuffle it on every exercise. This build
+ranks, per word, the top-K other words of the same file by orthographic
+similarity and groups them into buckets from best to worst:
+
+    0  same part of speech and same article (der/die/das, le/la, il/la, ...)
+    1  same part of speech with a different article, or part of speech unknown
+    2  anything else
+
+The app samples from bucket 0 first and only falls back to the next bucket
+when it runs short, so distractors look like the answer (a feminine noun
+gets feminine nouns, a verb gets verbs) instead of being random words of
+similar length.
+
+The vocabulary files carry no part-of-speech field, so it is inferred:
+a conjugation table or "to ..." means verb, an article means noun, and
+otherwise per-language endings are used (-en/-ieren, -er/-ir, -are/-ere,
+-ть, ...). Words that cannot be classified never land in bucket 0 but are
+not excluded either.
+
+Output:
+    public/data/distractors/<profile>/<code>.json
+    {
+      "vocabulary": "/data/<profile>/<code>.json",
+      "k": 12,
+      "words": {"die Ambivalenz": [[bucket 0 ...], [bucket 1 ...], [bucket 2 ...]]},
+      "forms": {"Ambivalenz": "die Ambivalenz"},     # article-less lookups
+      "bare": {"die Ambivalenz": "Ambivalenz"}       # display without article
+    }
+"""
+
+import argparse
+from difflib import SequenceMatcher
+
+import corpus
+
+DISTRACTORS_DIR = corpus.DATA_DIR / "distractors"
+
+# Candidates kept per word across all buckets
+TOP_K = 12
+
+ARTICLES = {
+    "de": {"der", "die", "das"},
+    "fr": {"le", "la", "les", "l'", "l’"},
+    "it": {"il", "lo", "la", "i", "gli", "le", "l'", "l’"},
+    "en": {"a", "an", "the"},
+}
+
+# Elided articles are written without a space ("l'entrée")
+ELIDED = ("l'", "l’")
+
+VERB_MARKERS = {"to", "sich", "se", "s'"}
+
+VERB_ENDINGS = {
+    "de": ("ieren", "eln", "ern", "en"),
+    "fr": ("er", "ir", "re"),
+    "it": ("are", "ere", "ire", "rsi"),
+    "ru": ("ть", "ться", "ти"),
+    "pl": ("ć", "ać", "ić"),
+}
+
+ADJECTIVE_ENDINGS = {
+    "de": ("ig", "lich", "isch", "bar", "sam", "los", "voll"),
+    "en": ("ive", "ous", "ful", "able", "ible", "al", "ic", "ent", "ant", "ate"),
+    "fr": ("eux", "euse", "if", "ive", "able", "ique"),
+    "it": ("oso", "osa", "ivo", "iva", "abile", "ibile"),
+}
+
+NOUN_ENDINGS = {
+    "en": ("tion", "sion", "ment", "ness", "ity", "ance", "ence", "ship", "ism", "ogy", "sis", "um"),
+}
+
+
+def base_language(code):
+    """'de-gastro' -> 'de'."""
+    return code.split("-", 1)[0]
+
+
+def split_article(word, language):
+    """Return (article or None, word without it)."""
+    articles = ARTICLES.get(language, set())
+    lowered = word.lower()
+    for elided in ELIDED:
+        if elided in articles and lowered.startswith(elided):
+            return "l'", word[len(elided):]
+    parts = word.split(" ", 1)
+    if len(parts) == 2 and parts[0].lower() in articles:
+        return parts[0].lower(), parts[1]
+    return None, word
+
+
+def classify(entry, language):
+    """Return (part of speech, article, bare form) for a vocabulary entry."""
+    word = entry["word"].strip()
+    article, bare = split_article(word, language)
+    first = word.split(" ", 1)[0].lower()
+    last = bare.split(" ")[-1].lower()
+
+    if article:
+        return "noun", article, bare
+    if entry.get("conjugations") or first in VERB_MARKERS:
+        return "verb", None, bare
+    if language == "de" and bare[:1].isupper():
+        return "noun", None, bare
+    if last.endswith(NOUN_ENDINGS.get(language, ())):
+        return "noun", None, bare
+    if last.endswith(ADJECTIVE_ENDINGS.get(language, ())):
+        return "adjective", None, bare
+    if " " not in bare and last.endswith(VERB_ENDINGS.get(language, ())):
+        return "verb", None, bare
+    return None, None, bare
+
+
+def similarity(a, b):
+    """Orthographic similarity of two bare forms (0..1)."""
+    return SequenceMatcher(None, a.lower(), b.lower()).ratio()
+
+
+def bucket_for(target, candidate):
+    """0 = same POS and article, 1 = same or unknown POS, 2 = other."""
+    target_pos, target_article, _ = target
+    pos, article, _ = candidate
+    if target_pos and pos and target_pos != pos:
+        return 2
+    if target_pos is None or pos is None or target_pos != pos or target_article != article:
+        return 1
+    return 0
+
+
+def build_table(vocabulary, language, k=TOP_K):
+    """Distractor table for one vocabulary file."""
+    entries = [entry for entry in vocabulary if isinstance(entry.get("word"), str) and entry["word"].strip()]
+    info = {entry["word"]: classify(entry, language) for entry in entries}
+
+    words = {}
+    for word, target in info.items():
+        ranked = sorted(
+            (
+                (bucket_for(target, candidate), -similarity(target[2], candidate[2]), other)
+                for other, candidate in info.items()
+                if candidate[2].lower() != target[2].lower()
+            )
+        )[:k]
+        buckets = [[], [], []]
+        for bucket, _, other in ranked:
+            buckets[bucket].append(other)
+        while buckets and not buckets[-1]:
+            buckets.pop()
+        words[word] = buckets
+
+    bare = {word: item[2] for word, item in info.items() if item[2] != word}
+    forms = {}
+    for word, bare_form in bare.items():
+        forms.setdefault(bare_form, word)
+
+    return {"k": k, "words": words, "forms": forms, "bare": bare}
+
+
+def table_path(vocab_url):
+    """/data/<profile>/<code>.json -> public/data/distractors/<profile>/<code>.json"""
+    return DISTRACTORS_DIR / vocab_url.removeprefix("/data/")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build word-bank distractor tables")
+    parser.add_argument("--k", type=int, default=TOP_K, help="candidates kept per word")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("Building Distractor Tables")
+    print("=" * 70)
+
+    written = set()
+    for profile_key, profile in corpus.load_profiles().items():
+        for lang in profile["learningLanguages"]:
+            vocab_url = corpus.vocabulary_url(profile_key, lang["code"])
+            vocab_path = corpus.url_to_path(vocab_url)
+            if not vocab_path.is_file():
+                continue
+
+            language = base_language(lang["code"])
+            table = {"vocabulary": vocab_url, **build_table(corpus.load_json(vocab_path), language, args.k)}
+            path = table_path(vocab_url)
+            corpus.write_json(path, table, compact=True)
+            written.add(path)
+
+            first_bucket = sum(1 for buckets in table["words"].values() if buckets and len(buckets[0]) >= 3)
+            print(f"   ✅ {profile_key}/{lang['code']}: {len(table['words'])} words, "
+                  f"{first_bucket} with 3+ same-class distractors")
+
+    for stale in DISTRACTORS_DIR.rglob("*.json"):
+        if stale not in written:
+            stale.unlink()
+
+    print("=" * 70)
+    print(f"✅ {len(written)} distractor tables in {corpus.path_to_url(DISTRACTORS_DIR)}")
+
+
+if __name__ == "__main__":
+    main()
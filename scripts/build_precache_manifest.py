@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Content-hash data artifacts and generate the service-worker precache manifest.
+
+Every vocabulary and sentence file under public/data is published a second
+time under a content-hashed name, and a manifest maps the URL the app
+requests to that immutable copy:
+
+    public/data/hashed/<path>.<hash>.json      immutable copy
+    public/precache-manifest.js                loaded by service-worker.js
+    public/precache-manifest.json              same data for other tooling
+
+The service worker caches a hashed URL forever the first time the app
+requests the artifact (nothing is downloaded on install, so a client only
+stores the files of its own profile) and downloads it again only when its
+hash changes. When build_corpus_deltas.py has run
+first, an entry also lists its delta patches by previous hash, and the
+worker patches its cached copy instead of refetching the file.
+"""
+
+import shutil
+
+import corpus
+from build_corpus_deltas import MANIFEST_FILE as VERSIONS_MANIFEST
+
+HASHED_DIR = corpus.DATA_DIR / "hashed"
+MANIFEST_JSON = corpus.PUBLIC_DIR / "precache-manifest.json"
+MANIFEST_JS = corpus.PUBLIC_DIR / "precache-manifest.js"
+
+HASH_LENGTH = 10
+
+# Build outputs whose URL is fixed but whose content changes between builds
+EXTRA_FILES = [corpus.DATA_DIR / "bundles/index.json", corpus.DATA_DIR / "manifest/sentences.json", corpus.STORE_INDEX]
+EXTRA_DIRS = [corpus.DATA_DIR / "index", corpus.DATA_DIR / "distractors", corpus.DATA_DIR / "audio"]
+
+
+def hashed_path(path, digest):
+    """public/data/a/b.json -> public/data/hashed/a/b.<digest>.json"""
+    relative = path.relative_to(corpus.DATA_DIR)
+    return HASHED_DIR / relative.parent / f"{relative.stem}.{digest}{relative.suffix}"
+
+
+def publish(source, target):
+    """Copy source to target unless it is already there.
+
+    A real copy rather than a hardlink: generators rewrite sources in place,
+    which would silently change an "immutable" hashed file sharing the inode.
+    """
+    if target.exists():
+        return False
+    target.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(source, target)
+    return True
+
+
+def load_patches():
+    """URL -> (hash, {previous hash: patch URL}) from the delta manifest."""
+    if not VERSIONS_MANIFEST.exists():
+        return {}
+    artifacts = corpus.load_json(VERSIONS_MANIFEST)["artifacts"]
+    return {
+        url: (entry["hash"], {old[:HASH_LENGTH]: patch["file"] for old, patch in entry["patches"].items()})
+        for url, entry in artifacts.items() if entry.get("patches")
+    }
+
+
+def build_manifest():
+    """Publish hashed copies and return the manifest entries."""
+    files = {}
+    written = 0
+    patches = load_patches()
+
+    extra = [path for path in EXTRA_FILES if path.exists()]
+    extra += [path for directory in EXTRA_DIRS for path in sorted(directory.rglob("*.json"))]
+    for path in list(corpus.iter_data_files()) + extra:
+        payload = path.read_bytes()
+        digest = corpus.content_hash(payload, HASH_LENGTH)
+        target = hashed_path(path, digest)
+        if publish(path, target):
+            written += 1
+
+        url = corpus.path_to_url(path)
+        files[url] = {
+            "hash": digest,
+            "size": len(payload),
+            "url": corpus.path_to_url(target)
+        }
+        # Delta hashes are longer prefixes of the same digest; stale deltas are ignored
+        delta_hash, delta_patches = patches.get(url, ("", {}))
+        if delta_patches and delta_hash.startswith(digest):
+            files[url]["patches"] = delta_patches
+
+    return files, written
+
+
+def remove_stale(files):
+    """Delete hashed copies that are no longer referenced."""
+    current = {entry["url"] for entry in files.values()}
+    removed = 0
+    for path in HASHED_DIR.rglob("*.json"):
+        if corpus.path_to_url(path) not in current:
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def main():
+    print("=" * 70)
+    print("Building Precache Manifest")
+    print("=" * 70)
+
+    files, written = build_manifest()
+    removed = remove_stale(files)
+
+    version = corpus.content_hash(
+        "".join(f"{url}:{entry['hash']}" for url, entry in sorted(files.items())),
+        HASH_LENGTH
+    )
+    manifest = {"version": version, "files": files}
+
+    corpus.write_json(MANIFEST_JSON, manifest)
+    MANIFEST_JS.write_text(
+        "// Generated by scripts/build_precache_manifest.py - do not edit\n"
+        f"self.__PRECACHE_MANIFEST = {corpus.dump_json(manifest)};\n",
+        encoding="utf-8"
+    )
+
+    total = sum(entry["size"] for entry in files.values())
+    patched = sum(1 for entry in files.values() if "patches" in entry)
+    print(f"\n📦 {len(files)} artifacts ({total / 1024 / 1024:.1f} MB), {patched} with delta patches")
+    print(f"   ✅ {written} new hashed files, 🗑️  {removed} stale removed")
+    print(f"   Version: {version}")
+    print(f"   Manifest: {corpus.path_to_url(MANIFEST_JS)}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
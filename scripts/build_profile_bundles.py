@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Build one content bundle per profile.
+
+Each bundle holds exactly the vocabulary and sentence files the app loads
+for that profile (resolved from PROFILES in src/config.js with the same
+rules as app.loadWordData and SentenceManager.loadSentences), so first
+load is a single request instead of one fetch per file.
+
+Output:
+    public/data/bundles/<profile>.<hash>.json   bundle (compact JSON)
+    public/data/bundles/index.json              profile -> bundle file
+"""
+
+import argparse
+
+import corpus
+
+BUNDLES_DIR = corpus.DATA_DIR / "bundles"
+INDEX_FILE = BUNDLES_DIR / "index.json"
+
+
+def profile_languages(profile_key, profile, file_map):
+    """Resolve vocabulary and sentence URLs for each learning language."""
+    languages = []
+    for lang in profile['learningLanguages']:
+        user_level = corpus.level_key(lang.get('level'))
+        vocab_url = corpus.vocabulary_url(profile_key, lang['code'])
+        if not corpus.url_to_path(vocab_url).is_file():
+            print(f"   ⚠️  Missing vocabulary: {vocab_url}")
+            vocab_url = None
+
+        languages.append({
+            "code": lang['code'],
+            "level": lang.get('level'),
+            "specialty": lang.get('specialty'),
+            "levelKey": user_level,
+            "vocabulary": vocab_url,
+            "sentences": corpus.resolve_sentence_url(lang['code'], user_level, file_map)
+        })
+    return languages
+
+
+def build_bundle(profile_key, profile, file_map):
+    """Assemble the bundle payload for one profile."""
+    languages = profile_languages(profile_key, profile, file_map)
+
+    files = {}
+    for lang in languages:
+        for url in (lang['vocabulary'], lang['sentences']):
+            if url and url not in files:
+                files[url] = corpus.load_json(corpus.url_to_path(url))
+
+    return {
+        "profile": profile_key,
+        "languages": languages,
+        "files": files
+    }
+
+
+def write_bundle(profile_key, bundle):
+    """Write a bundle under its content-hashed name and drop stale versions."""
+    payload = corpus.dump_json(bundle, compact=True).encode("utf-8")
+    digest = corpus.content_hash(payload)
+    path = BUNDLES_DIR / f"{profile_key}.{digest}.json"
+
+    BUNDLES_DIR.mkdir(parents=True, exist_ok=True)
+    for stale in BUNDLES_DIR.glob(f"{profile_key}.*.json"):
+        if stale != path:
+            stale.unlink()
+    if not path.exists():
+        path.write_bytes(payload)
+
+    return {
+        "file": corpus.path_to_url(path),
+        "hash": digest,
+        "size": len(payload),
+        "files": sorted(bundle['files'])
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("profiles", nargs="*", help="profile keys (default: all)")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("Building Profile Bundles")
+    print("=" * 70)
+
+    profiles = corpus.load_profiles()
+    file_map = corpus.load_sentence_file_map()
+    selected = args.profiles or list(profiles)
+
+    index = corpus.load_json(INDEX_FILE) if INDEX_FILE.exists() else {}
+
+    for profile_key in selected:
+        if profile_key not in profiles:
+            print(f"\n❌ Unknown profile: {profile_key}")
+            continue
+
+        print(f"\n📦 {profile_key}")
+        bundle = build_bundle(profile_key, profiles[profile_key], file_map)
+        entry = write_bundle(profile_key, bundle)
+        index[profile_key] = entry
+
+        for lang in bundle['languages']:
+            sentences = lang['sentences'] or "no sentence file"
+            print(f"   {lang['code']:<10} {lang['levelKey']:<6} {sentences}")
+        print(f"   ✅ {entry['file']} ({entry['size'] / 1024:.0f} KB, {len(entry['files'])} files)")
+
+    corpus.write_json(INDEX_FILE, dict(sorted(index.items())))
+
+    print("\n" + "=" * 70)
+    print(f"✅ Index written: {corpus.path_to_url(INDEX_FILE)}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
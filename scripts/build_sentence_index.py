@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Tokenize every sentence file once and emit integer token arrays plus an
+inverted index for i+1 selection.
+
+SentenceManager.findI1Sentences used to split every sentence with a regex,
+lowercase and strip each token and look it up in the mastered set on every
+call. With the index it maps the mastered words to term ids once and counts
+known terms per sentence by walking their posting lists.
+
+Output (one file per sentence file, same relative path):
+    public/data/index/<lang>/<file>.json
+
+Index format:
+    {
+      "source": "/data/sentences/de/de-c1-sentences.json",
+      "hash": "<content hash of the source file>",
+      "entries": 1800,                            # sentence entries in the source file
+      "fingerprint": "<hash of the indexed sentences>",
+      "terms": ["der", "ambivalenz", ...],        # term id = position
+      "sentences": [["Ambivalenz", 0], ...],      # sentence id -> (word key, position)
+      "lengths": [12, ...],                       # denominator of known_percentage
+      "ids": [[0, 1, 5, ...], ...],               # term ids per sentence
+      "postings": [[0, 0, 3, ...], ...],          # term id -> sentence ids, one per occurrence
+      "features": {"word_count": [...], ...}      # per sentence id, see sentence_features.py
+    }
+
+Terms follow the runtime rules exactly: `vocabulary_used` (lowercased) when a
+sentence has it, otherwise whitespace tokens lowercased with .,!?;:'"()
+removed. Tokens that are empty after stripping still count in "lengths".
+
+SentenceManager.loadSentenceIndex recomputes "entries" and "fingerprint"
+from the sentence file it loaded (from the network or a bundle) and
+rejects the index when either differs, so a sentence edited in place never
+scores with stale token ids.
+"""
+
+import re
+
+import corpus
+from sentence_features import corpus_features
+
+INDEX_DIR = corpus.DATA_DIR / "index"
+
+# Same characters findI1Sentences removes: /[.,!?;:'"()]/g
+STRIP_CHARS = re.compile(r"""[.,!?;:'"()]""")
+
+
+def index_path(path):
+    """public/data/sentences/de/x.json -> public/data/index/de/x.json"""
+    return INDEX_DIR / path.relative_to(corpus.SENTENCES_DIR)
+
+
+def sentence_terms(sentence):
+    """Return (terms, length) the way findI1Sentences scores a sentence."""
+    vocabulary = sentence.get("vocabulary_used")
+    if isinstance(vocabulary, list) and vocabulary:
+        return [w.lower() for w in vocabulary if isinstance(w, str)], len(vocabulary)
+
+    words = sentence["sentence"].split()
+    terms = [STRIP_CHARS.sub("", w.lower()) for w in words]
+    return [t for t in terms if t], len(words)
+
+
+def fingerprint(data, sentences):
+    """Hash of the indexed sentences in index order (SentenceManager.indexFingerprint)."""
+    rows = []
+    for word, position in sentences:
+        entry = data["sentences"][word][position]
+        vocabulary = entry.get("vocabulary_used")
+        words = [w for w in vocabulary if isinstance(w, str)] if isinstance(vocabulary, list) else []
+        rows.append(f"{word}\t{position}\t{entry.get('sentence') or ''}\t{' '.join(words)}\n")
+    return corpus.content_hash("".join(rows), 12)
+
+
+def build_index(data, url, digest):
+    """Build the index document for one loaded sentence file."""
+    term_ids = {}
+    sentences, lengths, ids, postings = [], [], [], []
+
+    for word, entries in data["sentences"].items():
+        if not isinstance(entries, list):
+            continue
+        for position, sentence in enumerate(entries):
+            if not isinstance(sentence, dict) or not isinstance(sentence.get("sentence"), str):
+                continue
+            terms, length = sentence_terms(sentence)
+            if length == 0:
+                continue
+
+            sentence_id = len(sentences)
+            row = []
+            for term in terms:
+                term_id = term_ids.setdefault(term, len(term_ids))
+                if term_id == len(postings):
+                    postings.append([])
+                postings[term_id].append(sentence_id)
+                row.append(term_id)
+
+            sentences.append([word, position])
+            lengths.append(length)
+            ids.append(row)
+
+    return {
+        "source": url,
+        "hash": digest,
+        "entries": sum(len(entries) for entries in data["sentences"].values() if isinstance(entries, list)),
+        "fingerprint": fingerprint(data, sentences),
+        "terms": list(term_ids),
+        "sentences": sentences,
+        "lengths": lengths,
+        "ids": ids,
+        "postings": postings
+    }
+
+
+def remove_stale(written):
+    """Delete index files whose sentence file no longer exists."""
+    removed = 0
+    for path in INDEX_DIR.rglob("*.json"):
+        if path not in written:
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def main():
+    print("=" * 70)
+    print("Building Sentence Token Index")
+    print("=" * 70)
+
+    indexes = {}
+    for path in corpus.iter_sentence_files():
+        payload = path.read_bytes()
+        data = corpus.load_json(path)
+        indexes[path] = (data, build_index(data, corpus.path_to_url(path), corpus.content_hash(payload, 12)))
+
+    features = corpus_features({path: (data, index["sentences"]) for path, (data, index) in indexes.items()})
+
+    written = set()
+    for path, (_, index) in indexes.items():
+        index["features"] = features[path]
+        target = index_path(path)
+        size = len(corpus.write_json(target, index, compact=True))
+        written.add(target)
+
+        postings = sum(len(p) for p in index["postings"])
+        print(f"   ✅ {path.name}: {len(index['sentences'])} sentences, "
+              f"{len(index['terms'])} terms, {postings} postings ({size / 1024:.0f} KB)")
+
+    removed = remove_stale(written)
+    print("=" * 70)
+    print(f"✅ {len(written)} index files in {corpus.path_to_url(INDEX_DIR)}"
+          + (f", {removed} stale removed" if removed else ""))
+
+
+if __name__ == "__main__":
+    main()
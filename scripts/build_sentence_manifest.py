@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Scan public/data/sentences and emit a manifest of every available sentence
+file, so SentenceManager.loadSentences resolves its file with one local
+lookup instead of a chain of fetches.
+
+Without the manifest, a (language, level) that is not in SENTENCE_FILE_MAP
+makes the loader try up to seven URLs in turn (-<level>, -c1c2, -c1, -b2c1,
+-b1b2, -a1a2, legacy), each a network round-trip and most of them 404s.
+
+Output:
+    public/data/manifest/sentences.json
+    {
+      "files": {
+        "/data/sentences/de/de-c1-sentences.json": {
+          "language": "de", "level": "c1", "specialty": null,
+          "size": 123456, "hash": "<same hash as the token index>",
+          "sentences": 400
+        }, ...
+      },
+      "resolve": {
+        "de-c1": "/data/sentences/de/de-c1-sentences.json",   # "<language>-<level>[-<specialty>]"
+        "de": "/data/sentences/de/de-c1-sentences.json",      # no level / unknown level
+        ...
+      }
+    }
+
+Keys in "resolve" come from the file names, SENTENCE_FILE_MAP (which wins
+over file names) and every profile language in src/config.js. The bare
+language key is the file the old fallback chain would load without a
+level. A key missing from "resolve" falls back to the bare language key,
+and a language missing entirely has no sentences.
+"""
+
+import re
+
+import corpus
+
+MANIFEST_PATH = corpus.DATA_DIR / "manifest/sentences.json"
+
+# Same length as the token index "hash", so the two can be compared
+HASH_LENGTH = 12
+
+LEVEL = re.compile(r"^[abc][12](?:[abc][12])?$")
+
+
+def parse_stem(path):
+    """de-b2-gastro-sentences.json -> ("de", "b2", "gastro")"""
+    parts = path.name.removesuffix(".json").removesuffix("-sentences").split("-")
+    language = parts[0]
+    level = parts[1] if len(parts) > 1 and LEVEL.match(parts[1]) else None
+    rest = parts[2:] if level else parts[1:]
+    return language, level, "-".join(rest) or None
+
+
+def file_key(language, level, specialty):
+    """Cache key the loader builds for this file ("de-b2-gastro")."""
+    return "-".join(part for part in (language, level, specialty) if part)
+
+
+def build_manifest():
+    """Return the manifest document."""
+    file_map = corpus.load_sentence_file_map()
+    files = {}
+    resolve = {}
+
+    for path in corpus.iter_sentence_files():
+        url = corpus.path_to_url(path)
+        payload = path.read_bytes()
+        language, level, specialty = parse_stem(path)
+        data = corpus.load_json(path)
+        files[url] = {
+            "language": language,
+            "level": level,
+            "specialty": specialty,
+            "size": len(payload),
+            "hash": corpus.content_hash(payload, HASH_LENGTH),
+            "sentences": data.get("metadata", {}).get("total_sentences", 0)
+        }
+        resolve[file_key(language, level, specialty)] = url
+
+    # Explicit mappings override names (de-c1-stadtsverwaltung lives in de-specialized/)
+    for key, url in file_map.items():
+        if url in files:
+            resolve[key] = url
+
+    # Whatever the old fallback chain would load for each profile language and bare language
+    languages = {entry["language"] for entry in files.values()}
+    for profile in corpus.load_profiles().values():
+        for lang in profile["learningLanguages"]:
+            key = f"{lang['code']}-{corpus.level_key(lang.get('level'))}"
+            if key not in resolve:
+                url = corpus.resolve_sentence_url(lang["code"], corpus.level_key(lang.get("level")), file_map)
+                if url:
+                    resolve[key] = url
+            languages.add(lang["code"])
+
+    for language in sorted(languages):
+        url = corpus.resolve_sentence_url(language, None, file_map)
+        if url:
+            resolve[language] = url
+
+    return {"files": files, "resolve": dict(sorted(resolve.items()))}
+
+
+def main():
+    print("=" * 70)
+    print("Building Sentence File Manifest")
+    print("=" * 70)
+
+    manifest = build_manifest()
+    size = len(corpus.write_json(MANIFEST_PATH, manifest, compact=True))
+
+    for key, url in manifest["resolve"].items():
+        entry = manifest["files"][url]
+        print(f"   ✅ {key:28} -> {url} ({entry['size'] / 1024:.0f} KB, {entry['sentences']} sentences)")
+
+    unresolved = sorted(set(manifest["files"]) - set(manifest["resolve"].values()))
+    for url in unresolved:
+        print(f"   ⚠️  not reachable by any key: {url}")
+
+    print("=" * 70)
+    print(f"✅ {len(manifest['files'])} files, {len(manifest['resolve'])} keys "
+          f"in {corpus.path_to_url(MANIFEST_PATH)} ({size / 1024:.1f} KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Encode each sentence's vocabulary as a bitset over the profile's vocabulary
+ids and score i+1 known percentages with one vectorized popcount.
+
+Vocabulary id = position of the word in /data/<profile>/<code>.json. A
+sentence sets bit i when one of its terms (same tokenization as
+build_sentence_index.py) equals vocabulary word i, with or without its
+article ("die Ambivalenz" / "ambivalenz", "to scrutinize" / "scrutinize").
+With the mastered words as a bitset too, the known count is
+popcount(sentence & mastery), so every sentence is scored in one NumPy pass:
+
+    known_percentage = popcount(bits & mastery).sum(axis=1) / lengths * 100
+
+Unlike the per-token loop in findI1Sentences, a word that occurs twice
+counts once, and tokens outside the vocabulary can never be known.
+
+Output (one file per profile language that has a sentence file):
+    public/data/bitsets/<profile>/<code>.json
+    {
+      "profile", "language", "vocabulary", "sentences", "source_hash",
+      "words": 180,                 # vocabulary size
+      "row_words": 6,               # uint32 words per sentence row
+      "entries": [[word, pos], ...],
+      "lengths": [...],
+      "bits": "<base64, little-endian uint32, len(entries) x row_words>"
+    }
+
+Usage:
+    python3 scripts/build_vocab_bitsets.py build
+    python3 scripts/build_vocab_bitsets.py bench [--profile P --language L] [--scales 1 10 100]
+"""
+
+import argparse
+import base64
+import time
+
+import numpy as np
+
+import build_profile_bundles
+import corpus
+from build_sentence_index import sentence_terms
+from normalize_sentences import strip_article
+
+BITSETS_DIR = corpus.DATA_DIR / "bitsets"
+
+# Lookup table for NumPy < 2.0, which has no np.bitwise_count
+_POPCOUNT8 = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def popcount(array):
+    """Per-element popcount of an unsigned integer array."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(array)
+    counts = _POPCOUNT8[array.view(np.uint8)]
+    return counts.reshape(*array.shape, array.itemsize).sum(axis=-1)
+
+
+def vocabulary_keys(vocabulary):
+    """Lowercased lookup key -> vocabulary id (first entry wins)."""
+    keys = {}
+    for vocab_id, entry in enumerate(vocabulary):
+        word = (entry.get("word") or "").strip().lower()
+        for key in (word, strip_article(word)):
+            if key:
+                keys.setdefault(key, vocab_id)
+    return keys
+
+
+def encode_sentences(data, vocabulary):
+    """Return (entries, lengths, bits) for one sentence file."""
+    keys = vocabulary_keys(vocabulary)
+    row_words = (len(vocabulary) + 31) // 32
+
+    entries, lengths, rows = [], [], []
+    for word, sentences in data["sentences"].items():
+        for position, sentence in enumerate(sentences):
+            terms, length = sentence_terms(sentence)
+            if length == 0:
+                continue
+            row = np.zeros(row_words, dtype=np.uint32)
+            for term in terms:
+                vocab_id = keys.get(term)
+                if vocab_id is not None:
+                    row[vocab_id >> 5] |= np.uint32(1 << (vocab_id & 31))
+            entries.append([word, position])
+            lengths.append(length)
+            rows.append(row)
+
+    bits = np.vstack(rows) if rows else np.zeros((0, row_words), dtype=np.uint32)
+    return entries, lengths, bits
+
+
+def mastery_bitset(vocab_ids, words):
+    """Bitset row for a collection of mastered vocabulary ids."""
+    row = np.zeros((words + 31) // 32, dtype=np.uint32)
+    for vocab_id in vocab_ids:
+        row[vocab_id >> 5] |= np.uint32(1 << (vocab_id & 31))
+    return row
+
+
+def score(bits, lengths, mastery):
+    """Known percentage of every sentence in one vectorized pass."""
+    known = popcount(bits & mastery).sum(axis=1, dtype=np.int32)
+    return known * 100.0 / lengths
+
+
+def bitset_path(profile_key, code):
+    return BITSETS_DIR / profile_key / f"{code}.json"
+
+
+def load_bitset(path):
+    """Load a bitset file as (document, bits, lengths) NumPy arrays."""
+    document = corpus.load_json(path)
+    bits = np.frombuffer(base64.b64decode(document["bits"]), dtype="<u4")
+    bits = bits.reshape(len(document["entries"]), document["row_words"])
+    return document, bits, np.asarray(document["lengths"], dtype=np.float64)
+
+
+def build():
+    print("=" * 70)
+    print("Building Vocabulary Bitsets")
+    print("=" * 70)
+
+    file_map = corpus.load_sentence_file_map()
+    written = set()
+    for profile_key, profile in corpus.load_profiles().items():
+        for lang in build_profile_bundles.profile_languages(profile_key, profile, file_map):
+            if not lang["vocabulary"] or not lang["sentences"]:
+                continue
+            vocabulary = corpus.load_json(corpus.url_to_path(lang["vocabulary"]))
+            sentence_path = corpus.url_to_path(lang["sentences"])
+            entries, lengths, bits = encode_sentences(corpus.load_json(sentence_path), vocabulary)
+
+            path = bitset_path(profile_key, lang["code"])
+            corpus.write_json(path, {
+                "profile": profile_key,
+                "language": lang["code"],
+                "vocabulary": lang["vocabulary"],
+                "sentences": lang["sentences"],
+                "source_hash": corpus.content_hash(sentence_path.read_bytes(), 12),
+                "words": len(vocabulary),
+                "row_words": bits.shape[1],
+                "entries": entries,
+                "lengths": lengths,
+                "bits": base64.b64encode(bits.astype("<u4").tobytes()).decode("ascii")
+            }, compact=True)
+            written.add(path)
+
+            covered = int(np.count_nonzero(popcount(bits).sum(axis=1)))
+            print(f"   ✅ {profile_key}/{lang['code']}: {len(entries)} sentences × {len(vocabulary)} words "
+                  f"({bits.nbytes / 1024:.0f} KB bits, {covered} sentences use vocabulary)")
+
+    for stale in BITSETS_DIR.rglob("*.json"):
+        if stale not in written:
+            stale.unlink()
+
+    print("=" * 70)
+    print(f"✅ {len(written)} bitset files in {corpus.path_to_url(BITSETS_DIR)}")
+
+
+def reference_scores(bits, lengths, mastered):
+    """Plain Python baseline: per sentence, count mastered ids one by one."""
+    words = bits.shape[1] * 32
+    rows = [
+        [vocab_id for vocab_id in range(words) if row[vocab_id >> 5] >> (vocab_id & 31) & 1]
+        for row in bits
+    ]
+    start = time.perf_counter()
+    scores = [sum(1 for vocab_id in row if vocab_id in mastered) * 100.0 / length
+              for row, length in zip(rows, lengths)]
+    return np.array(scores), time.perf_counter() - start
+
+
+def best_time(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def bench(profile_key, code, scales, repeat):
+    if code and not profile_key:
+        raise SystemExit("❌ --language needs --profile")
+    if code:
+        paths = [path for path in [bitset_path(profile_key, code)] if path.exists()]
+    elif profile_key:
+        paths = sorted((BITSETS_DIR / profile_key).glob("*.json"))
+    else:
+        paths = sorted(BITSETS_DIR.rglob("*.json"))
+    if not paths:
+        target = "/".join(part for part in (profile_key, code) if part) or "any profile"
+        raise SystemExit(f"❌ No bitset files for {target} - run: python3 scripts/build_vocab_bitsets.py build")
+
+    # Largest corpus of the selection by default
+    loaded = [load_bitset(path) for path in paths]
+    document, bits, lengths = max(loaded, key=lambda item: len(item[0]["entries"]))
+
+    rng = np.random.default_rng(0)
+    mastered = set(rng.choice(document["words"], size=document["words"] // 2, replace=False).tolist())
+    mastery = mastery_bitset(mastered, document["words"])
+
+    print("=" * 70)
+    print(f"Bitset Scoring Benchmark: {document['profile']}/{document['language']} "
+          f"({len(lengths)} sentences × {document['words']} words)")
+    print("=" * 70)
+    print(f"{'scale':>6} {'sentences':>10} {'bits':>9} {'numpy':>10} {'python':>10} {'speedup':>8} {'M sent/s':>9}")
+
+    for scale in scales:
+        scaled_bits = np.tile(bits, (scale, 1))
+        scaled_lengths = np.tile(lengths, scale)
+
+        scores, numpy_time = best_time(lambda: score(scaled_bits, scaled_lengths, mastery), repeat)
+        expected, python_time = reference_scores(scaled_bits, scaled_lengths, mastered)
+        if not np.allclose(scores, expected):
+            raise AssertionError("Vectorized scores differ from the reference implementation")
+
+        print(f"{scale:>5}× {len(scaled_lengths):>10} {scaled_bits.nbytes / 1024:>7.0f}KB "
+              f"{numpy_time * 1000:>8.2f}ms {python_time * 1000:>8.1f}ms "
+              f"{python_time / numpy_time:>7.0f}× {len(scaled_lengths) / numpy_time / 1e6:>9.1f}")
+
+    print("=" * 70)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vocabulary bitsets for i+1 scoring")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("build", help="write bitset files for every profile language")
+
+    bench_cmd = commands.add_parser("bench", help="benchmark vectorized scoring at larger corpus sizes")
+    bench_cmd.add_argument("--profile", help="profile key (default: largest corpus of any profile)")
+    bench_cmd.add_argument("--language", help="language code, with --profile (default: its largest corpus)")
+    bench_cmd.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    bench_cmd.add_argument("--repeat", type=int, default=5, help="best of N timings")
+
+    args = parser.parse_args()
+    if args.command == "build":
+        build()
+    else:
+        bench(args.profile, args.language, args.scales, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Check cross-references between sentence entries and the vocabulary, over
+the whole corpus at once.
+
+Nothing verified that a sentence entry agrees with itself and with the
+vocabulary it was generated from. For every entry of every sentence file
+this checks:
+
+    vocabulary     target_word is a word (with or without its article) of a
+                   vocabulary file of the same language
+    target_index   0 <= target_index < number of tokens (generators fall back
+                   to 0 or -1 when they cannot find the word)
+    target_token   the token at target_index is the target: it contains the
+                   article-less target (normalize_sentences.find_target_index)
+                   or is one of its inflections (scripts/inflections.py)
+    blank          blank is the sentence with exactly one span replaced by
+                   _____, and that span lies on the target token (plus its
+                   article and the other words of a multi-word target)
+
+The corpus is loaded once into columns: one row per entry (language,
+target, sentence, blank, target_index as NumPy arrays, fixed-width
+unicode for text) and one row per token (text, character offset) with each entry's
+first-token offset. Every check is then a NumPy expression over all
+entries (binary search in the sorted vocabulary keys, np.strings.find/partition,
+gathers at starts + target_index), with no Python loop per entry.
+
+Requires NumPy >= 2.0 (np.strings): python3 -m pip install -r requirements.txt
+
+Exits 1 when any file's failing share is above --fail-above (default 5%,
+which npm run check-integrity also passes); --fail-above 1 only reports.
+
+Usage:
+    python3 scripts/check_integrity.py
+    python3 scripts/check_integrity.py --json integrity.json
+    python3 scripts/check_integrity.py --fail-above 1        # report only
+"""
+
+import argparse
+import re
+import sys
+import time
+
+import numpy as np
+
+if not hasattr(np, "strings"):
+    sys.exit(f"❌ check_integrity.py needs NumPy >= 2.0 for np.strings (found {np.__version__}); "
+             "run: python3 -m pip install -r requirements.txt")
+
+import corpus
+from build_sentence_manifest import parse_stem
+from inflections import InflectionIndex
+from normalize_sentences import ARTICLES, BLANK, TOKEN_STRIP
+
+TOKEN = re.compile(r"\S+")
+
+# Largest failing share of a file before the check fails
+FAIL_ABOVE = 0.05
+
+CHECKS = {
+    "vocabulary": "target_word is not in the vocabulary",
+    "target_index": "target_index is outside the sentence",
+    "target_token": "token at target_index is not the target word",
+    "blank": "blank is not the sentence with the target masked",
+}
+
+
+def text_array(values):
+    """Fixed-width unicode array (np.searchsorted is unreliable on StringDType)."""
+    return np.array(values, dtype=str)
+
+
+def contains(keys, values):
+    """values in keys (sorted, unique), by binary search."""
+    if not len(keys):
+        return np.zeros(len(values), dtype=bool)
+    position = np.minimum(np.searchsorted(keys, values), len(keys) - 1)
+    return keys[position] == values
+
+
+def vocabulary_files():
+    """Base language -> vocabulary file paths of every profile."""
+    files = {}
+    for profile_key, profile in corpus.load_profiles().items():
+        for lang in profile["learningLanguages"]:
+            path = corpus.url_to_path(corpus.vocabulary_url(profile_key, lang["code"]))
+            if path.is_file():
+                files.setdefault(lang["code"].split("-", 1)[0], []).append(path)
+    return files
+
+
+def strip_articles(words):
+    """Lowercased words without a leading article, and whether one was removed."""
+    lowered = np.strings.lower(np.strings.strip(words))
+    head, separator, tail = np.strings.partition(lowered, text_array(" "))
+    has_article = contains(text_array(sorted(ARTICLES)), head) & (separator != "")
+    return np.where(has_article, tail, lowered), has_article
+
+
+def vocabulary_keys(files):
+    """'<lang>\\t<word>' for every vocabulary word, with and without its article,
+    and '<lang>\\t<word>\\t<form>' for every inflected form."""
+    words, forms = [], []
+    for language, paths in sorted(files.items()):
+        index = InflectionIndex.from_files(paths, language)
+        lemmas = text_array(sorted(index.lemmas))
+        stripped, _ = strip_articles(lemmas)
+        words += [f"{language}\t{w}" for w in np.strings.lower(lemmas).tolist() + stripped.tolist()]
+        core = dict(zip(lemmas.tolist(), stripped.tolist()))
+        forms += [f"{language}\t{core[lemma]}\t{form}" for form, owners in index.forms.items() for lemma in owners]
+    return np.unique(text_array(words)), np.unique(text_array(forms))
+
+
+def load_columns():
+    """Entry columns and flattened token columns for every sentence file."""
+    urls, rows = [], []
+    tokens, offsets, starts, counts = [], [], [], []
+    for file_id, path in enumerate(corpus.iter_sentence_files()):
+        urls.append(corpus.path_to_url(path))
+        language = parse_stem(path)[0]
+        for word, entries in corpus.load_json(path)["sentences"].items():
+            for position, entry in enumerate(entries):
+                sentence = entry.get("sentence") or ""
+                index = entry.get("target_index")
+                rows.append((file_id, language, f"sentences.{word}[{position}]", entry.get("id", ""),
+                             entry.get("target_word") or "", sentence, entry.get("blank") or "",
+                             index if isinstance(index, int) and not isinstance(index, bool) else -1))
+                matches = list(TOKEN.finditer(sentence))
+                starts.append(len(tokens))
+                counts.append(len(matches))
+                tokens += [m.group(0) for m in matches]
+                offsets += [m.start() for m in matches]
+
+    file_ids, languages, locations, ids, targets, sentences, blanks, indexes = zip(*rows)
+    return urls, {
+        "file": np.array(file_ids, dtype=np.int64),
+        "language": text_array(languages),
+        "location": list(locations),
+        "id": list(ids),
+        "target": text_array(targets),
+        "sentence": text_array(sentences),
+        "blank": text_array(blanks),
+        "target_index": np.array(indexes, dtype=np.int64),
+        "start": np.array(starts, dtype=np.int64),
+        "count": np.array(counts, dtype=np.int64),
+        # A sentinel token keeps gathers in range for empty sentences
+        "token": text_array(tokens + [""]),
+        "offset": np.array(offsets + [0], dtype=np.int64),
+    }
+
+
+def check(columns, words, forms):
+    """Boolean failure array per check (True = entry fails)."""
+    language = np.strings.add(columns["language"], "\t")
+    target = columns["target"]
+    index = columns["target_index"]
+    count = columns["count"]
+    start = columns["start"]
+    token, offset = columns["token"], columns["offset"]
+
+    core, has_article = strip_articles(target)
+    vocabulary_ok = (contains(words, np.strings.add(language, np.strings.lower(target)))
+                     | contains(words, np.strings.add(language, core)))
+
+    index_ok = (index >= 0) & (index < count)
+    at = start + np.where(index_ok, index, 0)
+    found = np.strings.lower(np.strings.strip(token[at], TOKEN_STRIP))
+    first = np.strings.strip(np.strings.partition(core, text_array(" "))[0], TOKEN_STRIP)
+    inflected = contains(forms, np.strings.add(np.strings.add(np.strings.add(language, core), "\t"), found))
+    token_ok = ~index_ok | ((np.strings.str_len(first) > 0) & (np.strings.find(found, first) >= 0)) | inflected
+
+    blank = columns["blank"]
+    sentence = columns["sentence"]
+    before, _, after = np.strings.partition(blank, text_array(BLANK))
+    length = np.strings.str_len(sentence)
+    span_start = np.strings.str_len(before)
+    span_end = length - np.strings.str_len(after)
+    framed = ((np.strings.count(blank, BLANK) == 1) & np.strings.startswith(sentence, before)
+              & np.strings.endswith(sentence, after) & (span_start <= span_end))
+
+    # The span may cover the article before the target and the rest of a multi-word target
+    words_in_target = np.strings.count(core, " ") + 1
+    last = np.maximum(count - 1, 0)
+    low = start + np.clip(np.where(index_ok, index, 0) - has_article, 0, last)
+    high = start + np.clip(np.where(index_ok, index, 0) + words_in_target - 1, 0, last)
+    target_start = offset[at]
+    target_end = target_start + np.strings.str_len(token[at])
+    on_target = ((span_start >= offset[low]) & (span_end <= offset[high] + np.strings.str_len(token[high]))
+                 & (span_start < target_end) & (span_end > target_start))
+    blank_ok = framed & (~index_ok | on_target)
+
+    return {
+        "vocabulary": ~vocabulary_ok,
+        "target_index": ~index_ok,
+        "target_token": ~token_ok,
+        "blank": ~blank_ok,
+    }
+
+
+def build_report(urls, columns, failures):
+    """Per-file and per-check counts and the failing entries."""
+    files = columns["file"]
+    any_failure = np.logical_or.reduce(list(failures.values()))
+    entries = np.bincount(files, minlength=len(urls))
+    failing = np.bincount(files, weights=any_failure, minlength=len(urls)).astype(np.int64)
+    per_check = {name: np.bincount(files, weights=failed, minlength=len(urls)).astype(np.int64)
+                 for name, failed in failures.items()}
+
+    report_files = {}
+    for i, url in enumerate(urls):
+        report_files[url] = {
+            "entries": int(entries[i]),
+            "failing": int(failing[i]),
+            "rate": round(float(failing[i] / max(entries[i], 1)), 4),
+            **{name: int(counts[i]) for name, counts in per_check.items()}
+        }
+
+    rows = []
+    for row in np.flatnonzero(any_failure).tolist():
+        rows.append({
+            "file": urls[files[row]],
+            "location": columns["location"][row],
+            "id": columns["id"][row],
+            "checks": [name for name, failed in failures.items() if failed[row]]
+        })
+
+    return {
+        "entries": int(len(files)),
+        "failing": int(any_failure.sum()),
+        "checks": {name: int(failed.sum()) for name, failed in failures.items()},
+        "files": report_files,
+        "failures": rows
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cross-reference integrity of sentence entries")
+    parser.add_argument("--json", help="write the report (summary + failing entries) to this path")
+    parser.add_argument("--examples", type=int, default=2, help="failing entries to show per check")
+    parser.add_argument("--fail-above", type=float, default=FAIL_ABOVE,
+                        help=f"exit 1 if any file's failing share exceeds this (default {FAIL_ABOVE})")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("Sentence Integrity Check")
+    print("=" * 70)
+
+    start = time.perf_counter()
+    words, forms = vocabulary_keys(vocabulary_files())
+    urls, columns = load_columns()
+    loaded = time.perf_counter()
+    failures = check(columns, words, forms)
+    checked = time.perf_counter()
+    report = build_report(urls, columns, failures)
+
+    print(f"\n📄 Files ({', '.join(CHECKS)}):")
+    for url, entry in report["files"].items():
+        over = entry["rate"] > args.fail_above
+        icon = "❌" if over else ("⚠️ " if entry["failing"] else "✅")
+        counts = " ".join(f"{entry[name]:4}" for name in CHECKS)
+        print(f"   {icon} {url.rsplit('/', 1)[-1]:44} {entry['entries']:5} entries  {counts}  ({entry['rate']:.1%})")
+
+    print("\n🔎 Checks:")
+    for name, message in CHECKS.items():
+        print(f"   {'✅' if not report['checks'][name] else '⚠️ '} {name:14} {report['checks'][name]:5}  {message}")
+        examples = np.flatnonzero(failures[name])[:args.examples].tolist()
+        for row in examples:
+            print(f"      {urls[columns['file'][row]].rsplit('/', 1)[-1]} {columns['location'][row]}: "
+                  f"{str(columns['sentence'][row])[:60]!r} / {str(columns['blank'][row])[:60]!r}")
+
+    if args.json:
+        corpus.write_json(args.json, report)
+
+    print("\n" + "=" * 70)
+    print(f"{'✅' if not report['failing'] else '⚠️ '} {report['entries']} entries, {report['failing']} failing "
+          f"(loaded in {(loaded - start) * 1000:.0f} ms, checked in {(checked - loaded) * 1000:.0f} ms)")
+
+    if any(entry["rate"] > args.fail_above for entry in report["files"].values()):
+        print(f"❌ Integrity failures above {args.fail_above:.0%} of a file")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
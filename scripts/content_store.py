@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Content-addressed store for profile vocabularies.
+
+Several profiles learn from byte-identical vocabulary files (dmitri/en.json
+and hassan/en.json, ameeno/it.json and valeria/it.json, ...). The store
+publishes each shared vocabulary once, named by its SHA-256, and the
+profiles reference it instead of carrying their own copy:
+
+    public/data/store/<sha[:16]>/<lang>.json    shared vocabulary (blob)
+    public/data/store/index.json                {"/data/<profile>/<lang>.json":
+                                                 "/data/store/<sha[:16]>/<lang>.json"}
+
+corpus.vocabulary_url, the app (App.vocabularyUrl) and the Node scripts
+(scripts/store-index.js) resolve profile vocabulary URLs through the index,
+so bundles, indexes, distractor tables and the service worker all use the
+blob, and the repository and the deploy carry each vocabulary once. A
+vocabulary used by a single profile stays at its own path.
+
+ingest is idempotent. A profile file found at its own path (written by a
+generator) replaces that profile's reference. A blob edited in place is
+stored again under its new hash. Blobs nobody references any more are
+removed, and a vocabulary left with a single profile moves back to that
+profile's path.
+
+sync materializes the per-profile view in data/<profile>/<lang>.json (not
+tracked) for tools that want one file per profile language. Every file is
+a hardlink to the published file, or a copy with --copy or across devices,
+and only files whose source changed are relinked. Files that no profile
+language maps to are removed. ingest never reads data/, so a sync is not
+undone by the next ingest.
+
+Usage:
+    python3 scripts/content_store.py ingest        # move shared vocabularies into the store
+    python3 scripts/content_store.py sync          # hardlink data/<profile>/<lang>.json
+    python3 scripts/content_store.py sync --copy
+    python3 scripts/content_store.py status
+"""
+
+import argparse
+import hashlib
+import os
+import shutil
+
+import corpus
+
+HASH_LENGTH = 16
+
+# Per-profile view written by sync
+MIRROR_DIR = corpus.ROOT / "data"
+
+
+def file_sha(path):
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def relative(path):
+    return path.relative_to(corpus.ROOT).as_posix()
+
+
+def profile_urls():
+    """Own vocabulary URL of every profile language."""
+    return [corpus.profile_vocabulary_url(profile_key, lang["code"])
+            for profile_key, profile in corpus.load_profiles().items()
+            for lang in profile["learningLanguages"]]
+
+
+def current_sources(index):
+    """Profile URL -> file holding its vocabulary now (own copy first, then the blob)."""
+    sources = {}
+    for url in profile_urls():
+        own = corpus.url_to_path(url)
+        if own.is_file():
+            sources[url] = own
+        elif url in index and corpus.url_to_path(index[url]).is_file():
+            sources[url] = corpus.url_to_path(index[url])
+    return sources
+
+
+def mirror_path(url):
+    """data/<profile>/<lang>.json for a profile vocabulary URL."""
+    return MIRROR_DIR / url.removeprefix("/data/")
+
+
+def mirror_current(target, source, copy):
+    """True if target already holds source: the same inode, or (with copy) the same bytes."""
+    if not target.is_file():
+        return False
+    if target.samefile(source):
+        return True
+    return copy and file_sha(target) == file_sha(source)
+
+
+def blob_url(sha, url):
+    """Store URL of a vocabulary, keeping the language file name of its first profile."""
+    return f"/data/store/{sha[:HASH_LENGTH]}/{url.rsplit('/', 1)[-1]}"
+
+
+def ingest():
+    """Move every vocabulary shared by several profiles into the store and rewrite the index."""
+    groups = {}
+    payloads = {}
+    for url, source in current_sources(corpus.load_store_index()).items():
+        payload = source.read_bytes()
+        sha = hashlib.sha256(payload).hexdigest()
+        groups.setdefault(sha, []).append(url)
+        payloads[sha] = payload
+
+    index = {}
+    stored = 0
+    for sha, urls in groups.items():
+        if len(urls) == 1:
+            # Only one profile left: its own path holds the vocabulary
+            own = corpus.url_to_path(urls[0])
+            if not own.is_file():
+                own.parent.mkdir(parents=True, exist_ok=True)
+                own.write_bytes(payloads[sha])
+                print(f"   ↩️  {urls[0]} (no longer shared)")
+            continue
+
+        target_url = blob_url(sha, urls[0])
+        target = corpus.url_to_path(target_url)
+        if not target.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(payloads[sha])
+            stored += 1
+        for url in urls:
+            index[url] = target_url
+            own = corpus.url_to_path(url)
+            if own.is_file():
+                own.unlink()
+                print(f"   📦 {url} → {target_url}")
+
+    corpus.write_json(corpus.STORE_INDEX, dict(sorted(index.items())))
+
+    referenced = {corpus.url_to_path(url) for url in index.values()}
+    removed = 0
+    for blob in corpus.STORE_DIR.glob("*/*.json"):
+        if blob not in referenced:
+            blob.unlink()
+            removed += 1
+    for directory in corpus.STORE_DIR.iterdir():
+        if directory.is_dir() and not any(directory.iterdir()):
+            directory.rmdir()
+
+    saved = sum(len(payloads[sha]) * (len(urls) - 1) for sha, urls in groups.items() if len(urls) > 1)
+    print(f"✅ {len(index)} profile vocabularies reference {len(referenced)} blobs "
+          f"({stored} new, {removed} removed), {saved / 1024 / 1024:.1f} MB of copies saved")
+
+
+def sync(copy=False):
+    """Hardlink (or copy) every profile vocabulary into data/, touching only changed files."""
+    index = corpus.load_store_index()
+    wanted = set()
+    linked = unchanged = 0
+    for url in profile_urls():
+        source = corpus.url_to_path(index.get(url, url))
+        if not source.is_file():
+            print(f"   ❌ Missing {index.get(url, url)} for {url}")
+            continue
+        target = mirror_path(url)
+        wanted.add(target)
+        if mirror_current(target, source, copy):
+            unchanged += 1
+            continue
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.unlink(missing_ok=True)
+        if copy:
+            shutil.copyfile(source, target)
+        else:
+            try:
+                os.link(source, target)
+            except OSError:
+                # Hardlinks cannot cross devices
+                shutil.copyfile(source, target)
+        linked += 1
+        print(f"   🔗 {relative(target)} → {relative(source)}")
+
+    removed = 0
+    if MIRROR_DIR.is_dir():
+        for stale in sorted(path for path in MIRROR_DIR.rglob("*") if path.is_file() and path not in wanted):
+            stale.unlink()
+            removed += 1
+            print(f"   🗑️  {relative(stale)}")
+        for directory in sorted((path for path in MIRROR_DIR.rglob("*") if path.is_dir()), reverse=True):
+            if not any(directory.iterdir()):
+                directory.rmdir()
+
+    print(f"✅ {relative(MIRROR_DIR)}/: {linked} updated, {unchanged} unchanged, {removed} removed")
+
+
+def status():
+    """Report shared vocabularies, pending copies and blobs edited in place."""
+    index = corpus.load_store_index()
+    by_blob = {}
+    for url, target_url in index.items():
+        by_blob.setdefault(target_url, []).append(url)
+
+    print(f"📦 {len(by_blob)} blobs shared by {len(index)} profile vocabularies")
+    for target_url, urls in sorted(by_blob.items()):
+        print(f"   - {target_url}: {', '.join(urls)}")
+
+    pending = []
+    groups = {}
+    for url, source in current_sources(index).items():
+        groups.setdefault(file_sha(source), []).append(url)
+        if source != corpus.url_to_path(index.get(url, url)):
+            pending.append(url)
+    shared = [urls for urls in groups.values() if len(urls) > 1 and not all(url in index for url in urls)]
+    edited = [target_url for target_url in by_blob
+              if corpus.url_to_path(target_url).is_file()
+              and not target_url.startswith(f"/data/store/{file_sha(corpus.url_to_path(target_url))[:HASH_LENGTH]}/")]
+
+    if pending or shared or edited:
+        print("\n✏️  Run ingest:")
+        for url in pending:
+            print(f"   - {url}: own copy next to its blob")
+        for urls in shared:
+            print(f"   - identical, not stored: {', '.join(urls)}")
+        for target_url in edited:
+            print(f"   - {target_url}: edited in place")
+    else:
+        print("✅ Store is up to date")
+
+    stale = [url for url in profile_urls()
+             if corpus.url_to_path(index.get(url, url)).is_file()
+             and not mirror_current(mirror_path(url), corpus.url_to_path(index.get(url, url)), copy=True)]
+    if stale:
+        print(f"\n🔗 {len(stale)} files in {relative(MIRROR_DIR)}/ out of date (run sync)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Content-addressed store for profile vocabularies")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("ingest", help="move shared vocabularies into the store")
+    sync_parser = commands.add_parser("sync", help="hardlink profile vocabularies into data/")
+    sync_parser.add_argument("--copy", action="store_true", help="copy instead of hardlinking")
+    commands.add_parser("status", help="report shared vocabularies and drift")
+
+    args = parser.parse_args()
+    if args.command == "ingest":
+        ingest()
+    elif args.command == "sync":
+        sync(args.copy)
+    else:
+        status()
+
+
+if __name__ == "__main__":
+    main()
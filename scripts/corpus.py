@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the content build scripts.
+
+Reads the app's own definitions (PROFILES in src/config.js and
+SENTENCE_FILE_MAP in src/utils/sentenceManager.js) so the Python build
+resolves files exactly the way the browser does.
+"""
+
+import hashlib
+import json
+import re
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+PUBLIC_DIR = ROOT / "public"
+DATA_DIR = PUBLIC_DIR / "data"
+SENTENCES_DIR = DATA_DIR / "sentences"
+STORE_DIR = DATA_DIR / "store"
+STORE_INDEX = STORE_DIR / "index.json"
+CONFIG_JS = ROOT / "src/config.js"
+SENTENCE_MANAGER_JS = ROOT / "src/utils/sentenceManager.js"
+
+# Directories under public/data that hold build outputs, not corpus files
+GENERATED_DIRS = {"bundles", "versions", "hashed", "index", "bitsets", "distractors", "manifest", "audio"}
+
+_JS_TOKEN = re.compile(r"""
+    (?P<ws>\s+|//[^\n]*|/\*.*?\*/)
+  | (?P<str>'(?:\\.|[^'\\])*'|"(?:\\.|[^"\\])*")
+  | (?P<num>-?\d+(?:\.\d+)?)
+  | (?P<ident>[A-Za-z_$][\w$]*)
+  | (?P<punct>[{}\[\]:,])
+""", re.VERBOSE | re.DOTALL)
+
+_JS_CONSTANTS = {"true": "true", "false": "false", "null": "null"}
+
+
+def _js_string_to_json(literal):
+    """Convert a single- or double-quoted JS string literal to a JSON string."""
+    out = []
+    body = literal[1:-1]
+    i = 0
+    while i < len(body):
+        ch = body[i]
+        if ch == "\\" and i + 1 < len(body):
+            nxt = body[i + 1]
+            # \' is valid JS but not valid JSON
+            out.append("'" if nxt == "'" else ch + nxt)
+            i += 2
+            continue
+        out.append('\\"' if ch == '"' else ch)
+        i += 1
+    return '"' + "".join(out) + '"'
+
+
+def parse_js_literal(source):
+    """Parse a plain JS object/array literal (no expressions) into Python."""
+    out = []
+    pos = 0
+    while pos < len(source):
+        match = _JS_TOKEN.match(source, pos)
+        if not match:
+            raise ValueError(f"Unsupported JS syntax near: {source[pos:pos + 40]!r}")
+        pos = match.end()
+        kind = match.lastgroup
+        token = match.group()
+        if kind == "ws":
+            continue
+        if kind == "str":
+            out.append(_js_string_to_json(token))
+        elif kind == "ident":
+            out.append(_JS_CONSTANTS.get(token, json.dumps(token)))
+        else:
+            out.append(token)
+    text = "".join(out)
+    # JS allows trailing commas, JSON does not
+    text = re.sub(r",(?=[}\]])", "", text)
+    return json.loads(text)
+
+
+def read_js_const(js_path, name):
+    """Extract `const NAME = {...};` from a JS module and parse it."""
+    source = Path(js_path).read_text(encoding="utf-8")
+    match = re.search(rf"const\s+{name}\s*=\s*", source)
+    if not match:
+        raise KeyError(f"{name} not found in {js_path}")
+
+    start = match.end()
+    opener = source[start]
+    closer = {"{": "}", "[": "]"}[opener]
+    depth = 0
+    in_string = None
+    i = start
+    while i < len(source):
+        ch = source[i]
+        if in_string:
+            if ch == "\\":
+                i += 1
+            elif ch == in_string:
+                in_string = None
+        elif ch in "'\"":
+            in_string = ch
+        elif ch == opener:
+            depth += 1
+        elif ch == closer:
+            depth -= 1
+            if depth == 0:
+                return parse_js_literal(source[start:i + 1])
+        i += 1
+    raise ValueError(f"Unterminated literal for {name} in {js_path}")
+
+
+def load_profiles():
+    """Return PROFILES from src/config.js."""
+    return read_js_const(CONFIG_JS, "PROFILES")
+
+
+def load_sentence_file_map():
+    """Return SENTENCE_FILE_MAP from src/utils/sentenceManager.js."""
+    return read_js_const(SENTENCE_MANAGER_JS, "SENTENCE_FILE_MAP")
+
+
+def level_key(level):
+    """Normalize a profile level the way app.js does ("B1-B2" -> "b1b2")."""
+    return re.sub(r"[-\s]", "", (level or "").lower()) or "b1b2"
+
+
+def url_to_path(url):
+    """Map a served URL (/data/...) to its file under public/."""
+    return PUBLIC_DIR / url.lstrip("/")
+
+
+def path_to_url(path):
+    """Map a file under public/ to the URL the app fetches."""
+    return "/" + Path(path).resolve().relative_to(PUBLIC_DIR).as_posix()
+
+
+def sentence_candidates(language, user_level=None, file_map=None):
+    """URLs SentenceManager.loadSentences tries, in order."""
+    if file_map is None:
+        file_map = load_sentence_file_map()
+
+    candidates = []
+    cache_key = f"{language}-{user_level}" if user_level else language
+    if user_level and cache_key in file_map:
+        candidates.append(file_map[cache_key])
+
+    if user_level:
+        candidates.append(f"/data/sentences/{language}/{language}-{user_level}-sentences.json")
+    for fallback in ("c1c2", "c1", "b2c1", "b1b2", "a1a2"):
+        candidates.append(f"/data/sentences/{language}/{language}-{fallback}-sentences.json")
+    candidates.append(f"/data/sentences/{language}-sentences.json")
+    return candidates
+
+
+def resolve_sentence_url(language, user_level=None, file_map=None):
+    """First candidate URL that exists on disk, or None (what the app would load)."""
+    for url in sentence_candidates(language, user_level, file_map):
+        if url_to_path(url).is_file():
+            return url
+    return None
+
+
+def profile_vocabulary_url(profile_key, language_code):
+    """A profile language's own vocabulary URL, before the content store."""
+    return f"/data/{profile_key}/{language_code}.json"
+
+
+def load_store_index():
+    """Profile vocabulary URL -> shared store URL (scripts/content_store.py)."""
+    return load_json(STORE_INDEX) if STORE_INDEX.is_file() else {}
+
+
+def vocabulary_url(profile_key, language_code):
+    """URL app.loadWordData fetches for a profile language (App.vocabularyUrl)."""
+    url = profile_vocabulary_url(profile_key, language_code)
+    return load_store_index().get(url, url)
+
+
+def iter_data_files():
+    """Yield corpus JSON files (vocabulary + sentences) under public/data, stale backups excluded."""
+    for path in sorted(DATA_DIR.rglob("*.json")):
+        if (path.relative_to(DATA_DIR).parts[0] in GENERATED_DIRS or "BACKUP" in path.name.upper()
+                or path == STORE_INDEX):
+            continue
+        yield path
+
+
+def iter_sentence_files():
+    """Sentence files the app can load (stale backups excluded)."""
+    for path in sorted(SENTENCES_DIR.rglob("*.json")):
+        if "BACKUP" not in path.name.upper():
+            yield path
+
+
+def iter_generator_scripts():
+    """Sentence generator scripts (repo root and scripts/), excluding the build tools."""
+    for path in sorted(ROOT.glob("*.py")) + sorted((ROOT / "scripts").glob("*.py")):
+        source = path.read_text(encoding="utf-8", errors="replace")
+        if re.search(r"^import corpus$", source, re.M) or path.name == "corpus.py":
+            continue
+        yield path, source
+
+
+def sentence_generators():
+    """Sentence file path -> generator scripts that reference its file name."""
+    scripts = list(iter_generator_scripts())
+    return {
+        path: [script.relative_to(ROOT).as_posix() for script, source in scripts if path.name in source]
+        for path in iter_sentence_files()
+    }
+
+
+def load_json(path):
+    """Load a UTF-8 JSON file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def dump_json(data, compact=False):
+    """Serialize data the way artifacts are written (stable key order)."""
+    if compact:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+def write_json(path, data, compact=False):
+    """Write JSON, creating parent directories. Returns the bytes written."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = dump_json(data, compact).encode("utf-8")
+    path.write_bytes(payload)
+    return payload
+
+
+def content_hash(payload, length=8):
+    """Short SHA-256 hex digest used in hashed filenames."""
+    if isinstance(payload, str):
+        payload = payload.encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()[:length]
@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Declarative schemas for vocabulary and sentence entries, compiled into
+Python validation functions.
+
+generate-dmitri-russian-vocabulary.py hand-coded its structure checks
+(translations/explanation/examples objects with both language keys) for
+one profile. The schemas below describe every entry shape the app reads,
+in a JSON Schema subset:
+
+    {"type": "string", "minLength": 1, "pattern": "..."}
+    {"type": "integer", "minimum": 0}
+    {"type": "null"}
+    {"type": "array", "items": {...}, "minItems": 2}
+    {"type": "object", "properties": {...}, "required": [...],
+     "additionalProperties": False or {...},
+     "languages": {...}}          # one value per interface language of the profile
+    {"anyOf": [{...}, ...]}
+
+compile_schema() turns a schema into the source of one function with
+every check inlined (isinstance tests, key lookups, loops over arrays),
+compiles it once and returns it; nothing walks the schema per entry.
+Locations are only built when a check fails. interpret() walks the schema
+instead and is kept as the reference for --bench, which checks that both
+report the same errors.
+
+"languages" is what app.js indexes with interfaceLanguages[0] and [1]
+(word.translations[primaryLang], word.examples[secondaryLang][1]), so a
+vocabulary file whose keys do not match its profile shows "undefined".
+
+Usage:
+    python3 scripts/entry_schema.py                  # validate every file, entries/s
+    python3 scripts/entry_schema.py --bench          # compiled vs interpreted
+    python3 scripts/entry_schema.py --source vocabulary   # print the generated code
+"""
+
+import argparse
+import re
+import sys
+import time
+
+import corpus
+from normalize_sentences import BLANK
+
+TEXT = {"type": "string", "minLength": 1}
+
+VOCABULARY_ENTRY = {
+    "type": "object",
+    "required": ["word", "translations", "explanation", "examples", "conjugations"],
+    "additionalProperties": False,
+    "properties": {
+        "word": TEXT,
+        "translations": {"type": "object", "languages": TEXT},
+        "explanation": {"type": "object", "languages": TEXT},
+        # app.js shows examples[lang][0] and [1]
+        "examples": {"type": "object", "languages": {"type": "array", "items": TEXT, "minItems": 2}},
+        "conjugations": {"anyOf": [
+            {"type": "null"},
+            {"type": "array", "items": TEXT, "minItems": 1},
+            {"type": "array", "minItems": 1, "items": {
+                "type": "object", "required": ["form", "value"], "additionalProperties": False,
+                "properties": {"form": TEXT, "value": TEXT}
+            }},
+            {"type": "object", "additionalProperties": {"type": "array", "items": TEXT}}
+        ]}
+    }
+}
+
+SENTENCE_ENTRY = {
+    "type": "object",
+    "required": ["id", "sentence", "blank", "target_word", "target_index", "translation"],
+    "additionalProperties": False,
+    "properties": {
+        "id": TEXT,
+        "sentence": TEXT,
+        "blank": {"type": "string", "pattern": re.escape(BLANK)},
+        "target_word": TEXT,
+        "target_index": {"type": "integer", "minimum": 0},
+        "translation": {"type": "string"},
+        "translation_language": TEXT,
+        "difficulty": TEXT,
+        "domain": TEXT,
+        "context": TEXT,
+        "vocabulary_used": {"type": "array", "items": TEXT}
+    }
+}
+
+SCHEMAS = {"vocabulary": VOCABULARY_ENTRY, "sentence": SENTENCE_ENTRY}
+
+# type: (inlined check, same check for interpret(), message)
+TYPES = {
+    "string": ("isinstance({v}, str)", lambda v: isinstance(v, str), "expected a string"),
+    "integer": ("(isinstance({v}, int) and not isinstance({v}, bool))",
+                lambda v: isinstance(v, int) and not isinstance(v, bool), "expected an integer"),
+    "null": ("{v} is None", lambda v: v is None, "expected null"),
+    "array": ("isinstance({v}, list)", lambda v: isinstance(v, list), "expected an array"),
+    "object": ("isinstance({v}, dict)", lambda v: isinstance(v, dict), "expected an object"),
+}
+
+
+class SchemaCompiler:
+    """Emits the source of a validator function for one schema.
+
+    The generated function is validate(value, loc, errors, languages): it
+    appends (location, message) to errors and returns nothing. Regexes and
+    anyOf branches become module-level names of the generated code.
+    """
+
+    def __init__(self):
+        self.functions = []
+        self.lines = []
+        self.names = {}
+        self.counter = 0
+
+    def fresh(self, prefix):
+        self.counter += 1
+        return f"{prefix}{self.counter}"
+
+    def emit(self, depth, line):
+        self.lines.append("    " * depth + line)
+
+    def constant(self, prefix, value):
+        name = self.fresh(prefix)
+        self.names[name] = value
+        return name
+
+    def function(self, schema, name):
+        """Emit def name(value, loc, errors, languages) for schema."""
+        outer, self.lines = self.lines, []
+        self.node(schema, "value", "loc", 1)
+        body, self.lines = self.lines, outer
+        self.functions.append("\n".join([f"def {name}(value, loc, errors, languages):", *body, ""]))
+
+    def fail(self, depth, loc, message):
+        self.emit(depth, f"errors.append(({loc}, {message!r}))")
+
+    def node(self, schema, v, loc, depth):
+        if "anyOf" in schema:
+            branches = []
+            for branch in schema["anyOf"]:
+                name = self.fresh("branch")
+                self.function(branch, name)
+                branches.append(name)
+            branch = self.fresh("branch")
+            self.emit(depth, f"for {branch} in ({', '.join(branches)},):")
+            self.emit(depth + 1, f"if not _fails({branch}, {v}, {loc}, languages):")
+            self.emit(depth + 2, "break")
+            self.emit(depth, "else:")
+            self.fail(depth + 1, loc, "matches none of the allowed shapes")
+            return
+
+        kind = schema["type"]
+        check, _, message = TYPES[kind]
+        self.emit(depth, f"if not {check.format(v=v)}:")
+        self.fail(depth + 1, loc, message)
+        rest = len(self.lines)
+        self.emit(depth, "else:")
+        inner = depth + 1
+
+        if kind == "string":
+            if "minLength" in schema:
+                self.emit(inner, f"if len({v}.strip()) < {schema['minLength']}:")
+                self.fail(inner + 1, loc, "empty string")
+            if "pattern" in schema:
+                regex = self.constant("pattern", re.compile(schema["pattern"]))
+                self.emit(inner, f"if not {regex}.search({v}):")
+                self.fail(inner + 1, loc, f"does not match {schema['pattern']}")
+        elif kind == "integer" and "minimum" in schema:
+            self.emit(inner, f"if {v} < {schema['minimum']}:")
+            self.fail(inner + 1, loc, f"below {schema['minimum']}")
+        elif kind == "array":
+            if "minItems" in schema:
+                self.emit(inner, f"if len({v}) < {schema['minItems']}:")
+                self.fail(inner + 1, loc, f"fewer than {schema['minItems']} items")
+            if "items" in schema:
+                i, item = self.fresh("i"), self.fresh("item")
+                self.emit(inner, f"for {i}, {item} in enumerate({v}):")
+                self.node(schema["items"], item, f'{loc} + "[" + str({i}) + "]"', inner + 1)
+        elif kind == "object":
+            self.object(schema, v, loc, inner)
+
+        if len(self.lines) == rest + 1:  # nothing but "else:"
+            self.lines.pop()
+
+    def object(self, schema, v, loc, depth):
+        properties = schema.get("properties", {})
+        required = set(schema.get("required", ()))
+        for key, subschema in properties.items():
+            child = self.fresh("v")
+            child_loc = f'{loc} + ".{key}"'
+            self.emit(depth, f"{child} = {v}.get({key!r}, _MISSING)")
+            if key in required:
+                self.emit(depth, f"if {child} is _MISSING:")
+                self.fail(depth + 1, loc, f"missing {key!r}")
+                self.emit(depth, "else:")
+                self.node(subschema, child, child_loc, depth + 1)
+            else:
+                self.emit(depth, f"if {child} is not _MISSING:")
+                self.node(subschema, child, child_loc, depth + 1)
+        for key in sorted(required - set(properties)):
+            self.emit(depth, f"if {key!r} not in {v}:")
+            self.fail(depth + 1, loc, f"missing {key!r}")
+
+        if "languages" in schema:
+            lang, child = self.fresh("lang"), self.fresh("v")
+            self.emit(depth, f"for {lang} in languages:")
+            self.emit(depth + 1, f"{child} = {v}.get({lang}, _MISSING)")
+            self.emit(depth + 1, f"if {child} is _MISSING:")
+            self.emit(depth + 2, f'errors.append(({loc}, "missing language " + repr({lang})))')
+            self.emit(depth + 1, "else:")
+            self.node(schema["languages"], child, f'{loc} + "." + {lang}', depth + 2)
+
+        extra = schema.get("additionalProperties", True)
+        if extra is True or "languages" in schema:
+            return
+        key, child = self.fresh("key"), self.fresh("v")
+        known = self.constant("known", frozenset(properties))
+        self.emit(depth, f"for {key}, {child} in {v}.items():")
+        self.emit(depth + 1, f"if {key} not in {known}:")
+        if extra is False:
+            self.emit(depth + 2, f'errors.append(({loc}, "unexpected key " + repr({key})))')
+        else:
+            self.node(extra, child, f'{loc} + "." + str({key})', depth + 2)
+
+
+def _fails(function, value, loc, languages):
+    """True if an anyOf branch reports any error."""
+    scratch = []
+    function(value, loc, scratch, languages)
+    return bool(scratch)
+
+
+def generate_source(schema, name="validate"):
+    """Python source of the validator and the constants it refers to."""
+    compiler = SchemaCompiler()
+    compiler.function(schema, name)
+    return "\n".join(compiler.functions), compiler.names
+
+
+def compile_schema(schema, name="validate"):
+    """Compile a schema into validate(value, loc, errors, languages)."""
+    source, names = generate_source(schema, name)
+    namespace = {"_MISSING": _MISSING, "_fails": _fails, **names}
+    exec(compile(source, f"<schema {name}>", "exec"), namespace)
+    return namespace[name]
+
+
+class _Missing:
+    def __repr__(self):
+        return "<missing>"
+
+
+_MISSING = _Missing()
+
+VALIDATORS = {kind: compile_schema(schema, f"validate_{kind}") for kind, schema in SCHEMAS.items()}
+
+
+def interpret(schema, value, loc, errors, languages):
+    """Reference validator that walks the schema (same errors as the compiled one)."""
+    if "anyOf" in schema:
+        for branch in schema["anyOf"]:
+            scratch = []
+            interpret(branch, value, loc, scratch, languages)
+            if not scratch:
+                return
+        errors.append((loc, "matches none of the allowed shapes"))
+        return
+
+    kind = schema["type"]
+    _, check, message = TYPES[kind]
+    if not check(value):
+        errors.append((loc, message))
+        return
+    if kind == "string":
+        if "minLength" in schema and len(value.strip()) < schema["minLength"]:
+            errors.append((loc, "empty string"))
+        if "pattern" in schema and not re.search(schema["pattern"], value):
+            errors.append((loc, f"does not match {schema['pattern']}"))
+    elif kind == "integer" and "minimum" in schema and value < schema["minimum"]:
+        errors.append((loc, f"below {schema['minimum']}"))
+    elif kind == "array":
+        if "minItems" in schema and len(value) < schema["minItems"]:
+            errors.append((loc, f"fewer than {schema['minItems']} items"))
+        for i, item in enumerate(value):
+            if "items" in schema:
+                interpret(schema["items"], item, f"{loc}[{i}]", errors, languages)
+    elif kind == "object":
+        properties = schema.get("properties", {})
+        required = set(schema.get("required", ()))
+        for key, subschema in properties.items():
+            if key not in value:
+                if key in required:
+                    errors.append((loc, f"missing {key!r}"))
+            else:
+                interpret(subschema, value[key], f"{loc}.{key}", errors, languages)
+        for key in sorted(required - set(properties)):
+            if key not in value:
+                errors.append((loc, f"missing {key!r}"))
+        if "languages" in schema:
+            for lang in languages:
+                if lang not in value:
+                    errors.append((loc, f"missing language {lang!r}"))
+                else:
+                    interpret(schema["languages"], value[lang], f"{loc}.{lang}", errors, languages)
+            return
+        extra = schema.get("additionalProperties", True)
+        if extra is not True:
+            for key, item in value.items():
+                if key not in properties:
+                    if extra is False:
+                        errors.append((loc, f"unexpected key {key!r}"))
+                    else:
+                        interpret(extra, item, f"{loc}.{key}", errors, languages)
+
+
+def validate_vocabulary(entries, languages, validate=VALIDATORS["vocabulary"]):
+    """[(location, message)] for a vocabulary file's entries."""
+    errors = []
+    for position, entry in enumerate(entries):
+        validate(entry, f"[{position}]", errors, languages)
+    return errors
+
+
+def validate_sentences(data, validate=VALIDATORS["sentence"]):
+    """[(location, message)] for a sentence file's entries."""
+    errors = []
+    for word, entries in data["sentences"].items():
+        for position, entry in enumerate(entries):
+            validate(entry, f"sentences.{word}[{position}]", errors, ())
+    return errors
+
+
+def schema_tasks():
+    """(path, kind, entries or document, interface languages) for every profile and sentence file."""
+    tasks = []
+    for profile_key, profile in corpus.load_profiles().items():
+        for lang in profile["learningLanguages"]:
+            path = corpus.url_to_path(corpus.vocabulary_url(profile_key, lang["code"]))
+            if path.is_file():
+                tasks.append((path, "vocabulary", corpus.load_json(path), tuple(profile["interfaceLanguages"])))
+    for path in corpus.iter_sentence_files():
+        tasks.append((path, "sentence", corpus.load_json(path), ()))
+    return tasks
+
+
+def run(tasks, validators):
+    """Errors per file and the time spent in the validators."""
+    results = []
+    elapsed = 0.0
+    for path, kind, data, languages in tasks:
+        start = time.perf_counter()
+        if kind == "vocabulary":
+            errors = validate_vocabulary(data, languages, validators["vocabulary"])
+        else:
+            errors = validate_sentences(data, validators["sentence"])
+        elapsed += time.perf_counter() - start
+        results.append(errors)
+    return results, elapsed
+
+
+def count_entries(tasks):
+    return sum(len(data) if kind == "vocabulary" else sum(map(len, data["sentences"].values()))
+               for _, kind, data, _ in tasks)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate vocabulary and sentence entries against compiled schemas")
+    parser.add_argument("--bench", action="store_true", help="compare with the interpreting validator")
+    parser.add_argument("--repeat", type=int, default=5, help="runs for the timing (best is reported)")
+    parser.add_argument("--errors", type=int, default=3, help="errors to show per file")
+    parser.add_argument("--source", choices=sorted(SCHEMAS), help="print the generated validator and exit")
+    args = parser.parse_args()
+
+    if args.source:
+        print(generate_source(SCHEMAS[args.source], f"validate_{args.source}")[0])
+        return
+
+    print("=" * 70)
+    print("Entry Schema Validation")
+    print("=" * 70)
+
+    tasks = schema_tasks()
+    entries = count_entries(tasks)
+    results, best = run(tasks, VALIDATORS)
+    for _ in range(args.repeat - 1):
+        best = min(best, run(tasks, VALIDATORS)[1])
+
+    print("\n📄 Files:")
+    for (path, kind, _, languages), errors in zip(tasks, results):
+        label = f"{kind}{' ' + '/'.join(languages) if languages else ''}"
+        print(f"   {'❌' if errors else '✅'} {corpus.path_to_url(path):52} {label:16} {len(errors)} errors")
+        for location, message in errors[:args.errors]:
+            print(f"      {location}: {message}")
+
+    print(f"\n⏱️  {entries} entries in {best * 1000:.1f} ms ({entries / best:,.0f} entries/s, best of {args.repeat})")
+    if args.bench:
+        interpreters = {kind: (lambda value, loc, errors, languages, schema=schema:
+                               interpret(schema, value, loc, errors, languages))
+                        for kind, schema in SCHEMAS.items()}
+        reference, slow = run(tasks, interpreters)
+        for _ in range(args.repeat - 1):
+            slow = min(slow, run(tasks, interpreters)[1])
+        print(f"   interpreted  {slow * 1000:.1f} ms ({entries / slow:,.0f} entries/s), "
+              f"compiled is {slow / best:.1f}× faster")
+        mismatches = sum(a != b for a, b in zip(results, reference))
+        print(f"   {'✅' if not mismatches else '❌'} {mismatches} files with different errors")
+
+    failing = sum(1 for errors in results if errors)
+    print("\n" + "=" * 70)
+    if failing:
+        print(f"❌ {failing} of {len(tasks)} files have schema errors ({sum(map(len, results))} errors)")
+        sys.exit(1)
+    print(f"✅ {len(tasks)} files match the schemas")
+
+
+if __name__ == "__main__":
+    main()
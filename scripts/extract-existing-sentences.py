@@ -5,6 +5,8 @@ Extract existing sentences from vocabulary files to see what we have.
 
 import json
 
+import corpus
+
 
 def analyze_vocabulary(file_path: str, name: str):
     """Analyze a vocabulary file."""
@@ -43,7 +45,7 @@ def main():
         (f"{base_dir}/public/data/hassan/ar.json", "Hassan - Arabic C1-C2"),
         (f"{base_dir}/public/data/salman/fr.json", "Salman - French B1-B2"),
         (f"{base_dir}/public/data/jawad/fr.json", "Jawad - French B1-B2"),
-        (f"{base_dir}/public/data/ameeno/it.json", "Ameeno - Italian A1"),
+        (str(corpus.url_to_path(corpus.vocabulary_url("ameeno", "it"))), "Ameeno - Italian A1"),
     ]
 
     for file_path, name in files:
@@ -5,6 +5,7 @@ import fs from 'fs';
 import path from 'path';
 import { fileURLToPath } from 'url';
 import { generateHash, generateFilename } from './hash.js';
+import { resolveProfileFile } from './store-index.js';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
@@ -73,15 +74,16 @@ function extractPolish() {
   const polishWords = new Map(); // word -> sources
 
   for (const filePath of PROFILE_FILES) {
-    const fullPath = path.join(__dirname, '..', filePath);
+    const fullPath = path.join(__dirname, '..', resolveProfileFile(filePath));
 
     if (!fs.existsSync(fullPath)) {
+      console.warn(`⚠️  File not found: ${filePath}`);
       continue;
     }
 
     try {
       const data = JSON.parse(fs.readFileSync(fullPath, 'utf8'));
-      const profile = path.basename(path.dirname(fullPath));
+      const profile = path.basename(path.dirname(filePath));
 
       let foundCount = 0;
 
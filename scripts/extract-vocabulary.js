@@ -6,6 +6,7 @@ import fs from 'fs';
 import path from 'path';
 import crypto from 'crypto';
 import { fileURLToPath } from 'url';
+import { resolveProfileFile } from './store-index.js';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
@@ -106,7 +107,7 @@ function extractVocabulary() {
 
   // Scan all vocabulary files
   for (const filePath of PROFILE_FILES) {
-    const fullPath = path.join(__dirname, '..', filePath);
+    const fullPath = path.join(__dirname, '..', resolveProfileFile(filePath));
 
     if (!fs.existsSync(fullPath)) {
       console.warn(`⚠️  File not found: ${filePath}`);
@@ -116,7 +117,7 @@ function extractVocabulary() {
     try {
       const data = JSON.parse(fs.readFileSync(fullPath, 'utf8'));
       const langCode = getLanguageCode(filePath);
-      const profile = path.basename(path.dirname(fullPath));
+      const profile = path.basename(path.dirname(filePath));
 
       totalFilesScanned++;
       totalEntriesScanned += data.length;
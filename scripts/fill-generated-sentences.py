@@ -2,11 +2,36 @@
 """
 Fill in [GENERATE] placeholders with contextual sentences.
 Uses rule-based templates to create domain-appropriate sentences.
+
+If scripts/requeue.json exists (written by sweep_placeholders.py), the
+sentence files listed there are processed, resolved under the repository
+root, and only the entries queued there are regenerated, in the fields
+listed for them. A new sentence also gets a new target_index, blank and
+vocabulary_used. Filled fields are removed from the queue; entries
+without a template, fields the templates cannot fill and queued
+vocabulary entries stay queued.
+
+Usage:
+    python3 scripts/fill-generated-sentences.py
 """
 
-import json
 import random
 
+import corpus
+from fill_vocabulary_used import entry_vocabulary, sentence_vocabularies, vocabulary_matcher
+from normalize_sentences import find_target_index, make_blank
+
+REQUEUE_PATH = corpus.ROOT / "scripts" / "requeue.json"
+
+# Template domain per sentence file (under public/data/sentences); other files have no templates
+DOMAINS_BY_FILE = {
+    "ar/ar-c1c2-sentences.json": "professional",
+    "fr/fr-b1b2-gastro-sentences.json": "gastronomy",
+    "it/it-a1-sentences.json": "basic",
+}
+
+FALLBACK = ("Example sentence with {word}.", "Translated sentence with {word}.")
+
 
 # Sentence templates by domain
 TEMPLATES = {
@@ -85,77 +110,125 @@ def generate_sentence(word_data, language, domain, translation_lang):
         return sentence, translation
 
     # Fallback
-    return f"Example sentence with {word}.", f"Translated sentence with {word}."
+    return FALLBACK[0].format(word=word), FALLBACK[1].format(word=word)
 
 
-def process_file(filepath, language, domain):
-    """Process a sentence file and fill in [GENERATE] placeholders."""
+def load_requeue():
+    """Queued sentence entries per file URL, or None if there is no requeue file."""
+    if not REQUEUE_PATH.is_file():
+        return None
+    return corpus.load_json(REQUEUE_PATH)
 
-    print(f"\nProcessing: {filepath}")
 
-    with open(filepath, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+def process_file(path, language, domain, vocab_paths, queued=None):
+    """Process a sentence file and fill in [GENERATE] placeholders.
 
-    # Get vocabulary for reference
-    vocab_files = data['metadata']['source_files']
-    vocab_map = {}
+    With queued ({(word, position): broken fields}, from the requeue file),
+    regenerate exactly those entries and only their listed fields. A new
+    sentence also gets its target_index, blank and vocabulary_used rebuilt.
+    Returns {(word, position): fields written} for every entry that was filled.
+    """
+
+    print(f"\nProcessing: {corpus.path_to_url(path)}")
 
-    for vfile in vocab_files:
-        with open(vfile, 'r', encoding='utf-8') as f:
-            vocab = json.load(f)
-            for v in vocab:
-                vocab_map[v['word']] = v
+    data = corpus.load_json(path)
+
+    # Vocabulary for reference: the files fill_vocabulary_used.py matches this file against
+    vocab_map = {}
+    for vocab_path in vocab_paths:
+        for v in corpus.load_json(vocab_path):
+            vocab_map[v['word']] = v
+    matcher, lemmas_by_key = vocabulary_matcher(language, vocab_paths)
 
-    generated_count = 0
+    filled = {}
 
     # Process each word's sentences
     for word, sentences in data['sentences'].items():
-        for sent in sentences:
-            if sent['sentence'] == "[GENERATE]":
+        for position, sent in enumerate(sentences):
+            if queued is not None and (word, position) not in queued:
+                continue
+            fields = ['sentence', 'translation'] if queued is None else queued[(word, position)]
+            if 'sentence' not in fields:
+                # Templates give a sentence with its translation: they cannot
+                # translate a sentence that is already there
+                continue
+            if queued is not None or sent['sentence'].startswith("[GENERATE"):
                 # Generate sentence
                 word_data = vocab_map.get(word, {'word': word, 'translations': {}})
-                translation_lang = sent['translation_language']
+                translation_lang = sent.get('translation_language', 'en')
 
                 sentence, translation = generate_sentence(
                     word_data, language, domain, translation_lang
                 )
+                if queued is not None and sentence == FALLBACK[0].format(word=word):
+                    continue
 
                 sent['sentence'] = sentence
-                sent['translation'] = translation
+                if 'translation' in fields:
+                    sent['translation'] = translation
 
-                # Update target index
-                words_list = sentence.split()
-                for i, w in enumerate(words_list):
-                    clean_w = w.strip('.,!?;:"""()[]').lower()
-                    clean_word = word.strip('.,!?;:"""()[]').lower()
-                    if clean_word in clean_w or clean_w in clean_word:
-                        sent['target_index'] = i
-                        break
+                # Everything derived from the old sentence follows the new one
+                target_word = sent.get('target_word', word)
+                target_index = find_target_index(sentence, target_word)
+                if target_index >= 0:
+                    sent['target_index'] = target_index
+                sent['blank'] = make_blank(sentence, target_word, sent.get('target_index', -1))
+                sent['vocabulary_used'] = entry_vocabulary(
+                    {'sentence': sentence, 'target_word': target_word}, matcher, lemmas_by_key)
 
-                generated_count += 1
+                written = ['sentence', 'target_index', 'blank', 'vocabulary_used']
+                filled[(word, position)] = written + (['translation'] if 'translation' in fields else [])
 
-    # Write back
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    corpus.write_json(path, data)
 
-    print(f"✅ Generated {generated_count} sentences")
+    print(f"✅ Generated {len(filled)} sentences")
+    return filled
 
 
 def main():
     """Main function."""
-    base_dir = "/Users/eldiaploo/Desktop/LingXM-Personal/public/data/sentences"
-
-    files = [
-        (f"{base_dir}/ar/ar-c1c2-sentences.json", "ar", "professional"),
-        (f"{base_dir}/fr/fr-b1b2-gastro-sentences.json", "fr", "gastronomy"),
-        (f"{base_dir}/it/it-a1-sentences.json", "it", "basic"),
-    ]
+    vocabularies = sentence_vocabularies()
+    requeue = load_requeue()
 
     print("🚀 Filling generated sentences...")
+    if requeue is not None:
+        print(f"   Requeue: {sum(len(e) for e in requeue['files'].values())} queued entries")
+        # Every queued sentence file; vocabulary entries (queued by "index") are not filled here
+        files = [corpus.url_to_path(url) for url in requeue['files']
+                 if url.startswith(corpus.path_to_url(corpus.SENTENCES_DIR) + "/")]
+    else:
+        files = [corpus.SENTENCES_DIR / name for name in DOMAINS_BY_FILE]
     print("="*70)
 
-    for filepath, language, domain in files:
-        process_file(filepath, language, domain)
+    for path in files:
+        if path not in vocabularies:
+            print(f"\n⚠️  {corpus.path_to_url(path)}: not a sentence file the app loads, skipped")
+            continue
+        language, vocab_paths = vocabularies[path]
+        domain = DOMAINS_BY_FILE.get(path.relative_to(corpus.SENTENCES_DIR).as_posix())
+
+        if requeue is None:
+            process_file(path, language, domain, vocab_paths)
+            continue
+
+        url = corpus.path_to_url(path)
+        entries = requeue['files'][url]
+        queued = {(e['word'], e['position']): e['fields'] for e in entries}
+        filled = process_file(path, language, domain, vocab_paths, queued)
+        remaining = []
+        for e in entries:
+            # Keep the entry queued for the fields that were not regenerated
+            written = filled.get((e['word'], e['position']), [])
+            fields = [field for field in e['fields'] if field not in written]
+            if fields:
+                remaining.append({**e, 'fields': fields})
+        if remaining:
+            requeue['files'][url] = remaining
+        else:
+            del requeue['files'][url]
+
+    if requeue is not None:
+        corpus.write_json(REQUEUE_PATH, requeue)
 
     print("\n" + "="*70)
     print("✅ All sentences generated!")
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Fill `vocabulary_used` for every sentence with an Aho-Corasick matcher.
+
+Most sentence files have no `vocabulary_used`, and where generators wrote
+one it usually holds only the target word. The i+1 selection then falls
+back to scoring raw tokens. This script compiles every form of every
+vocabulary word into a single Aho-Corasick automaton and scans each
+sentence once, in time linear in its length, whatever the vocabulary size.
+
+Patterns per vocabulary word (forms come from scripts/inflections.py):
+  - single words: every inflected form ("impliziert", "Ambivalenzen")
+  - multi-word entries: the phrase with its head word inflected
+    ("carried out", "Sozialen Wohnungsbau", "plat principal")
+  - article-prefixed entries are matched without the article
+  - hyphenated entries match as a whole ("15-Minuten-Stadt"), and a
+    hyphen counts as a word boundary, so "Kiezblock-Konzepte" contains
+    "Kiezblock"
+
+Matches must start and end on word boundaries. Overlaps resolve
+leftmost-longest. `vocabulary_used` lists the vocabulary words (as written
+in the vocabulary file) in order of appearance. The target word is always
+included.
+
+Vocabulary per sentence file: the profile vocabularies whose language
+resolves to that file in the app, plus specialty vocabularies with the
+same suffix (de-b2-gastro <- */de-gastro.json). Files that no profile
+loads fall back to every vocabulary of their language.
+
+Usage:
+    python3 scripts/fill_vocabulary_used.py            # rewrite public/data/sentences in place
+    python3 scripts/fill_vocabulary_used.py --dry-run  # report only
+"""
+
+import argparse
+from collections import deque
+
+import corpus
+from inflections import InflectionIndex, clean_token, split_lemma
+
+
+class AhoCorasick:
+    """Multi-pattern string matcher (goto/fail/output automaton)."""
+
+    def __init__(self, patterns):
+        """patterns: dict of pattern string -> payload."""
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+
+        for pattern, payload in patterns.items():
+            node = 0
+            for char in pattern:
+                if char not in self.goto[node]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                    self.goto[node][char] = len(self.goto) - 1
+                node = self.goto[node][char]
+            self.output[node].append((len(pattern), payload))
+
+        # Breadth-first pass to set failure links and merge outputs
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self.goto[node].items():
+                queue.append(child)
+                fallback = self.fail[node]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                self.output[child] = self.output[child] + self.output[self.fail[child]]
+
+    def iter_matches(self, text):
+        """Yield (start, end, payload) for every occurrence in text."""
+        node = 0
+        for end, char in enumerate(text, 1):
+            while node and char not in self.goto[node]:
+                node = self.fail[node]
+            node = self.goto[node].get(char, 0)
+            for length, payload in self.output[node]:
+                yield end - length, end, payload
+
+
+def is_boundary(text, position):
+    """True if position is outside text or not inside a word."""
+    return position < 0 or position >= len(text) or not text[position].isalnum()
+
+
+def vocabulary_patterns(index):
+    """Map each lowercase pattern to the vocabulary words it stands for."""
+    forms_by_lemma = {}
+    for form, lemmas in index.forms.items():
+        for lemma in lemmas:
+            forms = forms_by_lemma.setdefault(lemma, [])
+            if form not in forms:
+                forms.append(form)
+
+    patterns = {}
+
+    def add(pattern, lemma):
+        lemmas = patterns.setdefault(pattern, [])
+        if lemma not in lemmas:
+            lemmas.append(lemma)
+
+    for lemma, forms in forms_by_lemma.items():
+        _, _, words = split_lemma(lemma)
+        if len(words) <= 1:
+            for form in forms:
+                add(form, lemma)
+            continue
+
+        # Multi-word entry: inflect the head word, keep the rest as written
+        head = next((i for i, word in enumerate(words) if word in forms), 0)
+        for form in forms + [words[head]]:
+            add(" ".join(words[:head] + [form] + words[head + 1:]), lemma)
+
+    return patterns
+
+
+def match_vocabulary(sentence, matcher):
+    """Vocabulary words in a sentence, leftmost-longest, in order of appearance."""
+    text = sentence.lower()
+    matches = sorted(
+        (start, -(end - start), end, lemmas)
+        for start, end, lemmas in matcher.iter_matches(text)
+        if is_boundary(text, start - 1) and is_boundary(text, end)
+    )
+
+    found = []
+    covered = 0
+    for start, _, end, lemmas in matches:
+        if start < covered:
+            continue
+        covered = end
+        for lemma in lemmas:
+            if lemma not in found:
+                found.append(lemma)
+    return found
+
+
+def sentence_vocabularies():
+    """Sentence file URL -> vocabulary file paths used to fill it."""
+    file_map = corpus.load_sentence_file_map()
+    vocabularies = {}
+    by_code = {}
+    for profile_key, profile in corpus.load_profiles().items():
+        for lang in profile["learningLanguages"]:
+            vocab_path = corpus.url_to_path(corpus.vocabulary_url(profile_key, lang["code"]))
+            if not vocab_path.is_file():
+                continue
+            by_code.setdefault(lang["code"], []).append(vocab_path)
+            url = corpus.resolve_sentence_url(lang["code"], corpus.level_key(lang.get("level")), file_map)
+            if url:
+                vocabularies.setdefault(url, []).append(vocab_path)
+
+    result = {}
+    for path in corpus.iter_sentence_files():
+        url = corpus.path_to_url(path)
+        stem = path.name.removesuffix("-sentences.json")
+        language = stem.split("-", 1)[0]
+        specialty = [code for code in by_code if code.startswith(language + "-") and stem.endswith(code.split("-", 1)[1])]
+
+        paths = list(vocabularies.get(url, []))
+        for code in specialty:
+            paths += by_code[code]
+        if not paths:
+            paths = by_code.get(language, [])
+        result[path] = (language, list(dict.fromkeys(paths)))
+    return result
+
+
+def vocabulary_matcher(language, vocab_paths):
+    """(matcher, vocabulary word by cleaned key) for a set of vocabulary files."""
+    index = InflectionIndex.from_files(vocab_paths, language)
+    return AhoCorasick(vocabulary_patterns(index)), {clean_token(lemma): lemma for lemma in index.lemmas}
+
+
+def entry_vocabulary(entry, matcher, lemmas_by_key):
+    """vocabulary_used of one sentence entry, the target word included."""
+    found = match_vocabulary(entry["sentence"], matcher)
+    target = lemmas_by_key.get(clean_token(entry["target_word"]))
+    if target and target not in found:
+        found.insert(0, target)
+    return found
+
+
+def fill_file(path, language, vocab_paths):
+    """Return (updated document, sentences changed, vocabulary words found)."""
+    matcher, lemmas_by_key = vocabulary_matcher(language, vocab_paths)
+
+    data = corpus.load_json(path)
+    changed = 0
+    total_found = 0
+    for entries in data["sentences"].values():
+        for entry in entries:
+            found = entry_vocabulary(entry, matcher, lemmas_by_key)
+            total_found += len(found)
+
+            if found and found != entry.get("vocabulary_used"):
+                entry["vocabulary_used"] = found
+                changed += 1
+    return data, changed, total_found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fill vocabulary_used in sentence files")
+    parser.add_argument("--dry-run", action="store_true", help="report without writing")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("Filling vocabulary_used" + (" (dry run)" if args.dry_run else ""))
+    print("=" * 70)
+
+    for path, (language, vocab_paths) in sentence_vocabularies().items():
+        if not vocab_paths:
+            print(f"   ⚠️  {path.name}: no vocabulary for '{language}'")
+            continue
+
+        data, changed, found = fill_file(path, language, vocab_paths)
+        if changed and not args.dry_run:
+            corpus.write_json(path, data)
+
+        sentences = data["metadata"]["total_sentences"]
+        sources = ", ".join(sorted({p.parent.name + "/" + p.name for p in vocab_paths}))
+        print(f"   ✅ {path.name}: {changed}/{sentences} updated, "
+              f"{found / max(sentences, 1):.1f} words/sentence ({sources})")
+
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
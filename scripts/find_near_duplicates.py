@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Find near-duplicate sentences across every sentence file with MinHash and
+LSH banding.
+
+Template generators (generate_de_c1_kafel_deterministic.py picks one of five
+templates by word_index % 5, fill-generated-sentences.py fills fixed frames)
+produce sentences that differ only in the inserted word. Comparing all pairs
+is quadratic; here every sentence gets a MinHash signature over its
+character shingles and only sentences that share an LSH band bucket are
+compared, so the run is linear in the corpus size.
+
+    1. shingles     lowercased text, whitespace collapsed, character SHINGLE-grams
+    2. signature    NUM_PERM multiply-shift hashes, min over the shingles
+                    (NumPy, one minimum.reduceat per block of hashes)
+    3. banding      BANDS bands of ROWS rows; sentences with identical rows in
+                    a band share a bucket
+    4. verify       each bucket member is compared to the bucket's first
+                    member; estimated Jaccard >= threshold joins them
+    5. clusters     union-find over the verified links
+
+Reports clusters and duplication rates per file and per generator script
+(scripts that reference the file name, see corpus.sentence_generators).
+The duplication rate is the share of sentences that are not the first of
+their cluster, i.e. how much of the file would go if each cluster kept one
+sentence.
+
+Usage:
+    python3 scripts/find_near_duplicates.py
+    python3 scripts/find_near_duplicates.py --threshold 0.8 --json report.json
+    python3 scripts/find_near_duplicates.py --fail-above 0.25   # build gate
+"""
+
+import argparse
+import re
+import sys
+import time
+import zlib
+
+import numpy as np
+
+import corpus
+
+SHINGLE = 5
+NUM_PERM = 128
+BANDS = 32
+ROWS = NUM_PERM // BANDS
+THRESHOLD = 0.7
+
+# Hash functions are evaluated this many at a time to bound memory
+PERM_BLOCK = 16
+
+SEED = 1
+
+WHITESPACE = re.compile(r"\s+")
+
+
+def normalize(text):
+    """Lowercase and collapse whitespace."""
+    return WHITESPACE.sub(" ", text.lower()).strip()
+
+
+def shingles(text, size=SHINGLE):
+    """CRC32 of every character n-gram (the whole text if shorter)."""
+    text = normalize(text)
+    if len(text) <= size:
+        return {zlib.crc32(text.encode("utf-8"))}
+    return {zlib.crc32(text[i:i + size].encode("utf-8")) for i in range(len(text) - size + 1)}
+
+
+def load_corpus():
+    """Return (records, texts): one (path, word, position) record per sentence."""
+    records, texts = [], []
+    for path in corpus.iter_sentence_files():
+        data = corpus.load_json(path)
+        for word, entries in data["sentences"].items():
+            for position, entry in enumerate(entries):
+                if isinstance(entry, dict) and isinstance(entry.get("sentence"), str):
+                    records.append((path, word, position))
+                    texts.append(entry["sentence"])
+    return records, texts
+
+
+def signatures(texts, num_perm=NUM_PERM, seed=SEED):
+    """MinHash signature matrix (sentences x num_perm, uint32)."""
+    sets = [sorted(shingles(text)) for text in texts]
+    counts = np.fromiter((len(s) for s in sets), dtype=np.int64, count=len(sets))
+    values = np.fromiter((h for s in sets for h in s), dtype=np.uint64, count=int(counts.sum()))
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, 2 ** 63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+    b = rng.integers(0, 2 ** 63, size=num_perm, dtype=np.uint64)
+
+    result = np.empty((len(texts), num_perm), dtype=np.uint32)
+    with np.errstate(over="ignore"):
+        for block in range(0, num_perm, PERM_BLOCK):
+            cols = slice(block, block + PERM_BLOCK)
+            # Multiply-shift hashing: high 32 bits of a*x + b (mod 2^64)
+            hashed = ((values[:, None] * a[cols] + b[cols]) >> np.uint64(32)).astype(np.uint32)
+            result[:, cols] = np.minimum.reduceat(hashed, starts, axis=0)
+    return result
+
+
+def find_parent(parent, i):
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def cluster(sigs, threshold=THRESHOLD, bands=BANDS):
+    """Cluster id per sentence (its union-find root)."""
+    n, num_perm = sigs.shape
+    rows = num_perm // bands
+    parent = list(range(n))
+
+    for band in range(bands):
+        block = np.ascontiguousarray(sigs[:, band * rows:(band + 1) * rows])
+        keys = block.view(np.dtype((np.void, block.dtype.itemsize * rows))).ravel()
+        _, bucket = np.unique(keys, return_inverse=True)
+
+        order = np.argsort(bucket, kind="stable")
+        sorted_bucket = bucket[order]
+        first = np.r_[True, sorted_bucket[1:] != sorted_bucket[:-1]]
+        leaders = order[np.flatnonzero(first)][np.cumsum(first) - 1]
+
+        members = order[~first]
+        member_leaders = leaders[~first]
+        if not len(members):
+            continue
+        similarity = (sigs[members] == sigs[member_leaders]).mean(axis=1)
+        for member, leader in zip(members[similarity >= threshold].tolist(),
+                                  member_leaders[similarity >= threshold].tolist()):
+            root_a, root_b = find_parent(parent, member), find_parent(parent, leader)
+            if root_a != root_b:
+                parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    return np.array([find_parent(parent, i) for i in range(n)], dtype=np.int64)
+
+
+def duplication(labels, mask):
+    """(sentences, duplicates) within mask; duplicates = not first of their cluster."""
+    selected = labels[mask]
+    return len(selected), len(selected) - len(np.unique(selected))
+
+
+def build_report(records, texts, labels, generators, top=5):
+    """Per-file, per-generator and largest-cluster report."""
+    paths = np.array([corpus.path_to_url(path) for path, _, _ in records])
+    sizes = np.bincount(labels, minlength=len(labels))
+
+    files = {}
+    for url in dict.fromkeys(paths.tolist()):
+        total, duplicates = duplication(labels, paths == url)
+        clustered = int((sizes[labels[paths == url]] > 1).sum())
+        files[url] = {
+            "sentences": total,
+            "duplicates": duplicates,
+            "in_clusters": clustered,
+            "rate": round(duplicates / max(total, 1), 4)
+        }
+
+    by_generator = {}
+    for path, scripts in generators.items():
+        for script in scripts:
+            by_generator.setdefault(script, []).append(corpus.path_to_url(path))
+    generator_report = {}
+    for script, urls in sorted(by_generator.items()):
+        total, duplicates = duplication(labels, np.isin(paths, urls))
+        generator_report[script] = {
+            "files": urls,
+            "sentences": total,
+            "duplicates": duplicates,
+            "rate": round(duplicates / max(total, 1), 4)
+        }
+
+    clusters = []
+    roots = np.flatnonzero(sizes > 1)
+    for root in roots[np.argsort(-sizes[roots], kind="stable")][:top]:
+        members = np.flatnonzero(labels == root)
+        clusters.append({
+            "size": int(sizes[root]),
+            "files": sorted(set(paths[members].tolist())),
+            "examples": [texts[i] for i in members[:3]]
+        })
+
+    return {
+        "sentences": len(labels),
+        "clusters": int((sizes > 1).sum()),
+        "duplicates": int(len(labels) - len(np.unique(labels))),
+        "files": files,
+        "generators": generator_report,
+        "largest_clusters": clusters
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find near-duplicate sentences (MinHash + LSH)")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="estimated Jaccard to link two sentences")
+    parser.add_argument("--top", type=int, default=5, help="largest clusters to show")
+    parser.add_argument("--json", help="write the full report to this path")
+    parser.add_argument("--fail-above", type=float, help="exit 1 if any file's duplication rate exceeds this")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("Near-Duplicate Sentence Detection (MinHash + LSH)")
+    print("=" * 70)
+
+    start = time.perf_counter()
+    records, texts = load_corpus()
+    sigs = signatures(texts)
+    labels = cluster(sigs, args.threshold)
+    elapsed = time.perf_counter() - start
+    report = build_report(records, texts, labels, corpus.sentence_generators(), args.top)
+
+    print(f"\n📄 Files (threshold {args.threshold}):")
+    for url, entry in report["files"].items():
+        status = "⚠️ " if args.fail_above is not None and entry["rate"] > args.fail_above else "✅"
+        print(f"   {status} {url.rsplit('/', 1)[-1]:40} {entry['duplicates']:4}/{entry['sentences']:<5} "
+              f"duplicates ({entry['rate']:.1%}), {entry['in_clusters']} in clusters")
+
+    print("\n🛠️  Generators:")
+    for script, entry in sorted(report["generators"].items(), key=lambda item: -item[1]["rate"]):
+        print(f"   {script:48} {entry['rate']:6.1%} of {entry['sentences']} sentences")
+
+    print("\n🔁 Largest clusters:")
+    for entry in report["largest_clusters"]:
+        print(f"   {entry['size']} sentences in {', '.join(url.rsplit('/', 1)[-1] for url in entry['files'])}")
+        for example in entry["examples"]:
+            print(f"      - {example}")
+
+    if args.json:
+        corpus.write_json(args.json, report)
+
+    print("\n" + "=" * 70)
+    print(f"✅ {report['sentences']} sentences, {report['clusters']} clusters, "
+          f"{report['duplicates']} duplicates ({report['duplicates'] / max(report['sentences'], 1):.1%}) "
+          f"in {elapsed:.2f}s")
+
+    if args.fail_above is not None and any(entry["rate"] > args.fail_above for entry in report["files"].values()):
+        print(f"❌ Duplication rate above {args.fail_above:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,8 @@ import json
 from datetime import date
 import os
 
+import corpus
+
 
 def find_word_in_sentence(sentence, word):
     """Find the target word's position in the sentence."""
@@ -211,7 +213,7 @@ def main():
             "language_name": "Italian",
             "level": "A1",
             "source_profiles": ["ameeno"],
-            "source_files": [f"{base_dir}/public/data/ameeno/it.json"],
+            "source_files": [str(corpus.url_to_path(corpus.vocabulary_url("ameeno", "it")))],
             "output_file": f"{base_dir}/public/data/sentences/it/it-a1-sentences.json",
             "translation_langs": ["fa", "en"],
             "gen_lang": "en",
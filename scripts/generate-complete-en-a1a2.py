@@ -8,6 +8,8 @@ import json
 from datetime import date
 from typing import Dict, List, Tuple
 
+from grammar_rules import check_sentence
+
 # CRITICAL: Part-of-speech classifications to prevent catastrophic errors
 ADVERBS_TIME = {'today', 'tomorrow', 'yesterday', 'now', 'later', 'soon', 'early', 'late'}
 ADVERBS_FREQUENCY = {'always', 'never', 'sometimes', 'often'}
@@ -48,28 +50,11 @@ def validate_sentence(sentence: str, target_word: str) -> Tuple[bool, str]:
     """
     sentence_lower = sentence.lower()
 
-    # Check for catastrophic patterns with adverbs
-    catastrophic_patterns = [
-        ("a today", "adverb 'today' used as noun"),
-        ("a tomorrow", "adverb 'tomorrow' used as noun"),
-        ("a yesterday", "adverb 'yesterday' used as noun"),
-        ("a never", "adverb 'never' used as noun"),
-        ("a always", "adverb 'always' used as noun"),
-        ("a sometimes", "adverb 'sometimes' used as noun"),
-        ("a often", "adverb 'often' used as noun"),
-        ("a here", "adverb 'here' used as noun"),
-        ("a there", "adverb 'there' used as noun"),
-        ("the never", "adverb 'never' with article"),
-        ("the always", "adverb 'always' with article"),
-        ("the here", "adverb 'here' with article"),
-        ("the there", "adverb 'there' with article"),
-        ("the because", "conjunction 'because' with article"),
-        ("a because", "conjunction 'because' as noun"),
-    ]
-
-    for pattern, error in catastrophic_patterns:
-        if pattern in sentence_lower:
-            return False, f"CATASTROPHIC: {error} in '{sentence}'"
+    # Check for catastrophic patterns (adverbs/conjunctions used as nouns, scripts/grammar_rules.py)
+    findings = check_sentence(sentence, "en", "a1a2", severity="error")
+    if findings:
+        rule, text = findings[0]
+        return False, f"CATASTROPHIC: {rule.message} ({text!r}) in '{sentence}'"
 
     # Verify target word is present (handle compound words with /)
     if "/" in target_word:
@@ -9,6 +9,8 @@ import json
 from datetime import date
 from typing import Dict, List, Tuple
 
+from grammar_rules import check_sentence, format_findings
+
 # All 180 C1-C2 words from Hassan EN vocabulary
 VOCABULARY = [
     "to scrutinize", "to articulate", "to substantiate", "to advocate", "to encompass",
@@ -86,22 +88,10 @@ def validate_sentence(sentence: str, target_word: str) -> Tuple[bool, str]:
     if word_count < 15 or word_count > 25:
         return False, f"Word count {word_count} outside range 15-25"
 
-    # Catastrophic pattern checks
-    catastrophic_patterns = [
-        ("the inherently", "adverb 'inherently' with article"),
-        ("a predominantly", "adverb 'predominantly' with article"),
-        ("the ostensibly", "adverb 'ostensibly' with article"),
-        ("a inadvertently", "adverb 'inadvertently' with article"),
-        ("the concurrently", "adverb 'concurrently' with article"),
-        # Adjectives must modify nouns, not stand alone as subjects
-        ("the pragmatic is", "adjective as subject"),
-        ("the empirical demonstrates", "adjective as subject"),
-        ("strategic unilateral", "adjective sequence error"),
-    ]
-
-    for pattern, error in catastrophic_patterns:
-        if pattern in sentence_lower:
-            return False, f"CATASTROPHIC: {error} in '{sentence}'"
+    # Catastrophic pattern checks (scripts/grammar_rules.py)
+    findings = check_sentence(sentence, "en", "c1c2")
+    if findings:
+        return False, f"CATASTROPHIC: {format_findings(findings)} in '{sentence}'"
 
     return True, "OK"
 
@@ -13,6 +13,11 @@ from datetime import date
 import time
 import random
 
+from grammar_rules import check_sentence, format_findings
+from inflections import InflectionIndex
+
+INFLECTIONS = InflectionIndex.from_files(["public/data/kafel/de-it.json"], "de")
+
 # Initialize Anthropic client
 client = Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
 
@@ -30,20 +35,10 @@ def normalize_word(word):
     return word_clean
 
 def validate_sentence_quality(sentence, target_word):
-    """Validate sentence doesn't have adjective-as-noun errors."""
-    # Common IT adjectives that should NOT be used as nouns
-    bad_patterns = [
-        r'\bein\s+(skalierbar|robust|effizient|stabil|sicher|flexibel|performant)\b',
-        r'\bder\s+(skalierbar|robust|effizient|stabil|sicher|flexibel|performant)\b',
-        r'\bdie\s+(skalierbar|robust|effizient|stabil|sicher|flexibel|performant)\b',
-        r'\bdas\s+(skalierbar|robust|effizient|stabil|sicher|flexibel|performant)\b',
-        r'\bimplementiere\s+(skalierbar|robust|effizient)\s*$',
-        r'\b(skalierbar|robust|effizient|stabil|sicher|flexibel)\s+ist\s+(wichtig|notwendig)\s*\.',
-    ]
-
-    for pattern in bad_patterns:
-        if re.search(pattern, sentence, re.IGNORECASE):
-            return False, f"Adjective-as-noun error detected: {pattern}"
+    """Validate sentence against the German rules (scripts/grammar_rules.py)."""
+    findings = check_sentence(sentence, "de", "b2")
+    if findings:
+        return False, format_findings(findings)
 
     # Check word count (12-18 words for B2)
     word_count = len(sentence.split())
@@ -144,24 +139,8 @@ Example format:
         return None
 
 def find_word_position(sentence, target_word):
-    """Find the position (index) of the target word in the sentence."""
-    words = sentence.split()
-
-    # Try exact match first (with article)
-    target_lower = target_word.lower()
-    for i, word in enumerate(words):
-        word_clean = word.strip('.,!?;:()[]{}«»"\'').lower()
-        if word_clean == target_lower:
-            return i
-
-    # Try without article
-    target_no_article = re.sub(r'^(der|die|das)\s+', '', target_word, flags=re.IGNORECASE).lower()
-    for i, word in enumerate(words):
-        word_clean = word.strip('.,!?;:()[]{}«»"\'').lower()
-        if word_clean == target_no_article or word_clean.startswith(target_no_article):
-            return i
-
-    return 0  # Fallback
+    """Find the position (index) of the target word or one of its inflections, or -1."""
+    return INFLECTIONS.find(sentence, target_word)
 
 def create_sentence_object(word, sentence_data, index, word_id):
     """Create a sentence object in the required format."""
@@ -203,19 +182,12 @@ def run_quality_check(sentences_data):
         for sent in sentences:
             all_sentences.append(sent["full"])
 
-    # Check for adjective-as-noun errors
+    # Check for grammar rule hits (adjective-as-noun and friends)
     error_count = 0
-    error_patterns = [
-        r'\bein\s+(skalierbar|robust|effizient|stabil|sicher|flexibel|performant)\b',
-        r'\b(skalierbar|robust|effizient|stabil|sicher|flexibel|performant)\s+ist\b',
-        r'\bimplementiere\s+(skalierbar|robust|effizient)\s*$',
-    ]
-
-    for pattern in error_patterns:
-        for sentence in all_sentences:
-            if re.search(pattern, sentence, re.IGNORECASE):
-                error_count += 1
-                print(f"  ❌ Found error: {sentence[:80]}...")
+    for sentence in all_sentences:
+        if check_sentence(sentence, "de", "b2"):
+            error_count += 1
+            print(f"  ❌ Found error: {sentence[:80]}...")
 
     # Check word count distribution
     word_counts = [len(s.split()) for s in all_sentences]
@@ -6,11 +6,12 @@ Date: 2025-11-05
 """
 
 import json
-import re
 from datetime import datetime
 from typing import List, Dict, Any
 import random
 
+from grammar_rules import check_sentence
+
 
 def load_vocabulary(filepath: str) -> List[Dict[str, Any]]:
     """Load vocabulary from JSON file."""
@@ -26,26 +27,10 @@ def extract_word_with_article(word_entry: Dict[str, Any]) -> str:
 
 def validate_german_grammar(sentence: str) -> bool:
     """
-    Validate German sentence for common grammar mistakes.
+    Validate German sentence for common grammar mistakes (scripts/grammar_rules.py).
     Returns True if valid, False if errors found.
     """
-    # Check for adjectives used as standalone nouns (common mistake)
-    # Pattern: "ist wichtig|komplex|strategisch" at end without proper context
-    if re.search(r'\s+(wichtig|komplex|strategisch|umfassend|gründlich)\.$', sentence):
-        # This could be valid in some contexts, need more sophisticated check
-        pass
-
-    # Check for articles with adverbs (should never happen)
-    if re.search(r'\b(ein|eine|der|die|das)\s+(niemals|immer|oft|heute|gestern|morgen)\b', sentence):
-        return False
-
-    # Check for adjectives incorrectly used as subjects
-    if re.search(r'\b(wichtig|komplex|strategisch)\s+(ist|wird|war)\b', sentence):
-        # This might be "Das Wichtige ist..." which is valid, but "wichtig ist" alone is not
-        if not re.search(r'\b(Das|Die|Der)\s+(Wichtige|Komplexe|Strategische)', sentence):
-            return False
-
-    return True
+    return not check_sentence(sentence, "de", "b2c1", severity="error")
 
 
 def generate_sentence_basic(word: str, word_data: Dict, index: int) -> Dict[str, Any]:
@@ -20,6 +20,8 @@ import time
 from pathlib import Path
 from openai import OpenAI
 
+from grammar_rules import check_sentence, format_findings
+
 # Initialize OpenAI client
 client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
 
@@ -122,21 +124,12 @@ def validate_sentences(all_sentences):
 
     issues = []
 
-    # Check for common nonsense patterns
-    nonsense_patterns = [
-        r"Das (raffiniert|exquisit|delikat|aromatisch) (ist|muss)",
-        r"sollte (aromatisch|raffiniert) das",
-        r"die (delikat|exquisit)$",
-        r"bringen das (exquisit|raffiniert)"
-    ]
-
-    import re
-
-    for pattern in nonsense_patterns:
-        for entry in all_sentences:
-            for sent in entry['sentences']:
-                if re.search(pattern, sent):
-                    issues.append(f"Nonsense pattern '{pattern}' in: {sent}")
+    # Check for common nonsense patterns (scripts/grammar_rules.py)
+    for entry in all_sentences:
+        for sent in entry['sentences']:
+            findings = check_sentence(sent, "de", "c1", severity="error")
+            if findings:
+                issues.append(f"Nonsense pattern {format_findings(findings)} in: {sent}")
 
     # Check sentence lengths
     too_short = 0
@@ -19,6 +19,8 @@ import random
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+from grammar_rules import check_sentence, format_findings
+
 def load_vocabulary(file_path: Path) -> List[Dict]:
     """Load German gastronomy vocabulary."""
     with open(file_path, 'r', encoding='utf-8') as f:
@@ -180,17 +182,10 @@ def validate_sentence(sentence: str, word: str) -> Tuple[bool, str]:
     if not any(variant in sentence_lower for variant in word_variants):
         return False, f"Target word '{word}' not found"
 
-    # Check for catastrophic patterns
-    catastrophic_patterns = [
-        r'\bDas (raffiniert|exquisit|delikat|aromatisch) (ist|muss)\b',
-        r'\bsollte (aromatisch|raffiniert) das\b',
-        r'\bdie (delikat|exquisit)\s*\.\s*$',
-    ]
-
-    import re
-    for pattern in catastrophic_patterns:
-        if re.search(pattern, sentence):
-            return False, f"Catastrophic pattern: {pattern}"
+    # Check for catastrophic patterns (scripts/grammar_rules.py)
+    findings = check_sentence(sentence, "de", "c1", severity="error")
+    if findings:
+        return False, f"Catastrophic pattern: {format_findings(findings)}"
 
     # Must start with capital and end with period
     if not sentence[0].isupper():
@@ -11,6 +11,9 @@ import time
 from datetime import datetime
 from anthropic import Anthropic
 
+from grammar_rules import format_findings
+from validation_cache import ValidationCache
+
 # Configuration
 VOCAB_FILE = "public/data/vahiko/de.json"
 OUTPUT_FILE = "public/data/sentences/de-specialized/de-c1-stadtplanung-sentences.json"
@@ -23,13 +26,8 @@ MAX_WORDS = 22
 SENTENCES_PER_WORD = 3
 DIFFICULTY_LEVELS = ["basic", "intermediate", "advanced"]
 
-# Anti-patterns to detect (adjectives used as nouns/verbs)
-BAD_PATTERNS = [
-    r'\bDas (nachhaltig|ganzheitlich|infrastrukturell|urbanisiert)\b',
-    r'\bsollte (nachhaltig|infrastrukturell|ganzheitlich)\b',
-    r'\bdie (urbanisiert|ganzheitlich)\s+(ist|muss|sollte)\b',
-    r'\b(nachhaltig|ganzheitlich|infrastrukturell|urbanisiert) (ist|muss|sollte|wird)\s+(sein|werden)\b',
-]
+# Anti-patterns (adjectives used as nouns/verbs) are German rules in scripts/grammar_rules.py
+LEVEL = "c1"
 
 class SentenceGenerator:
     def __init__(self):
@@ -37,6 +35,7 @@ class SentenceGenerator:
         self.vocab = []
         self.sentences = {}
         self.generated_count = 0
+        self.validation_cache = ValidationCache.load()
 
     def load_vocabulary(self):
         """Load vocabulary from JSON file"""
@@ -53,9 +52,9 @@ class SentenceGenerator:
             return False, f"Word count {len(words)} not in range {MIN_WORDS}-{MAX_WORDS}"
 
         # Check for bad patterns (adjectives as nouns/verbs)
-        for pattern in BAD_PATTERNS:
-            if re.search(pattern, sentence, re.IGNORECASE):
-                return False, f"Bad pattern detected: {pattern}"
+        findings = self.validation_cache.check_sentence(sentence, "de", LEVEL, severity="error")
+        if findings:
+            return False, f"Bad pattern detected: {format_findings(findings)}"
 
         # Check if target word is present
         if word not in sentence:
@@ -262,16 +261,16 @@ Return ONLY valid JSON:
         bad_count = 0
         for word, sentences in self.sentences.items():
             for sentence in sentences:
-                for pattern in BAD_PATTERNS:
-                    if re.search(pattern, sentence['de']['full'], re.IGNORECASE):
-                        print(f"⚠️  Bad pattern in: {sentence['de']['full']}")
-                        bad_count += 1
+                if self.validation_cache.check_sentence(sentence['de']['full'], "de", LEVEL, severity="error"):
+                    print(f"⚠️  Bad pattern in: {sentence['de']['full']}")
+                    bad_count += 1
 
         if bad_count == 0:
             print("✅ No bad patterns detected!")
         else:
             print(f"⚠️  Found {bad_count} potential issues")
 
+        self.validation_cache.save()
         print()
 
     def show_random_examples(self, count=20):
@@ -14,6 +14,8 @@ import json
 import os
 from pathlib import Path
 
+from entry_schema import validate_vocabulary
+
 # Configuration
 API_KEY = os.environ.get("ANTHROPIC_API_KEY")
 if not API_KEY:
@@ -239,23 +241,7 @@ def main():
 
     # Validation
     print("\n🔍 Validating structure...")
-    errors = []
-
-    for idx, word in enumerate(all_vocabulary):
-        if "translations" not in word or not isinstance(word["translations"], dict):
-            errors.append(f"Word {idx}: Missing or invalid 'translations' object")
-        elif "ru" not in word["translations"] or "en" not in word["translations"]:
-            errors.append(f"Word {idx}: Missing 'ru' or 'en' in translations")
-
-        if "explanation" not in word or not isinstance(word["explanation"], dict):
-            errors.append(f"Word {idx}: Missing or invalid 'explanation' object")
-        elif "ru" not in word["explanation"] or "en" not in word["explanation"]:
-            errors.append(f"Word {idx}: Missing 'ru' or 'en' in explanation")
-
-        if "examples" not in word or not isinstance(word["examples"], dict):
-            errors.append(f"Word {idx}: Missing or invalid 'examples' object")
-        elif "ru" not in word["examples"] or "en" not in word["examples"]:
-            errors.append(f"Word {idx}: Missing 'ru' or 'en' in examples")
+    errors = [f"Word {location}: {message}" for location, message in validate_vocabulary(all_vocabulary, ("ru", "en"))]
 
     if errors:
         print(f"❌ Found {len(errors)} validation errors:")
@@ -9,11 +9,13 @@ import json
 import os
 from anthropic import Anthropic
 
+import corpus
+
 # Initialize Anthropic client
 client = Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
 
 # Load Hassan vocabulary
-with open('public/data/hassan/en.json', 'r', encoding='utf-8') as f:
+with open(corpus.url_to_path(corpus.vocabulary_url("hassan", "en")), 'r', encoding='utf-8') as f:
     vocab_data = json.load(f)
 
 print(f"📚 Loaded {len(vocab_data)} vocabulary entries")
@@ -7,8 +7,10 @@ Target: 1,080 sentences (6 per word × 180 words)
 import json
 import sys
 
+import corpus
+
 # Load Hassan vocabulary
-with open('public/data/hassan/en.json', 'r', encoding='utf-8') as f:
+with open(corpus.url_to_path(corpus.vocabulary_url("hassan", "en")), 'r', encoding='utf-8') as f:
     vocab_data = json.load(f)
 
 print(f"📚 Loaded {len(vocab_data)} vocabulary entries")
@@ -10,6 +10,8 @@ import json
 import os
 from anthropic import Anthropic
 
+from grammar_rules import check_sentence
+
 # Initialize API
 client = Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
 
@@ -125,17 +127,6 @@ def validate_grammar(sentences):
 
     errors = []
 
-    # Patterns to avoid
-    bad_patterns = [
-        (r"Je vois un (jamais|toujours|souvent|hier|aujourd'hui|maintenant)", "Adverb used as noun"),
-        (r"C'est mon (parce que|jamais|toujours|quand|si)", "Conjunction/adverb used as noun"),
-        (r"J'aime le (bleu|rouge|vert|délicieux|bon)$", "Adjective without noun"),
-        (r"un (jamais|toujours|souvent)", "Adverb as noun"),
-        (r"le (jamais|toujours|souvent|hier)", "Adverb as noun"),
-    ]
-
-    import re
-
     for idx, item in enumerate(sentences):
         sentence = item['sentence']
 
@@ -144,10 +135,9 @@ def validate_grammar(sentences):
         if word_count < 10 or word_count > 16:
             errors.append(f"Sentence {idx+1}: Word count {word_count} (should be 10-16)")
 
-        # Check grammar patterns
-        for pattern, description in bad_patterns:
-            if re.search(pattern, sentence, re.IGNORECASE):
-                errors.append(f"Sentence {idx+1}: {description} - '{sentence}'")
+        # Check grammar rules (scripts/grammar_rules.py)
+        for rule, _ in check_sentence(sentence, "fr", "b1b2"):
+            errors.append(f"Sentence {idx+1}: {rule.message} - '{sentence}'")
 
     return errors
 
@@ -6,7 +6,8 @@ Based on proven A1-A2 methodology with C1-C2 complexity.
 
 import json
 from typing import Dict, List, Tuple
-import re
+
+from grammar_rules import check_sentence, format_findings
 
 # Load Hassan's vocabulary with Arabic translations
 with open('/tmp/hassan-vocab-extracted.json', 'r', encoding='utf-8') as f:
@@ -106,16 +107,10 @@ def validate_sentence(sentence: str, target_word: str) -> Tuple[bool, str]:
         if target_base not in sentence_lower:
             return False, f"Target word '{target_word}' not found in sentence"
 
-    # Check for catastrophic patterns
-    catastrophic_patterns = [
-        r'\b(a|an|the)\s+(inherently|predominantly|ostensibly|inadvertently|concurrently)\b',  # article + adverb
-        r'\bI think (viable|tangible|robust|lucrative|resilient|volatile|static|dynamic) is\b',  # adjective as noun
-        r'\bThe (empirical|pragmatic|intricate|comprehensive|substantial) (paradox|dilemma|threshold) is\b'  # weird combinations
-    ]
-
-    for pattern in catastrophic_patterns:
-        if re.search(pattern, sentence, re.IGNORECASE):
-            return False, f"Catastrophic pattern detected: {pattern}"
+    # Check for catastrophic patterns (scripts/grammar_rules.py)
+    findings = check_sentence(sentence, "en", "c1c2")
+    if findings:
+        return False, f"Catastrophic pattern detected: {format_findings(findings)}"
 
     # Must start with capital letter
     if not sentence[0].isupper():
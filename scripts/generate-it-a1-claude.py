@@ -7,6 +7,8 @@ Generated by Claude Code with strict Italian grammar validation.
 import json
 import os
 
+import corpus
+
 def load_vocabulary(file_path):
     """Load Italian vocabulary words."""
     with open(file_path, 'r', encoding='utf-8') as f:
@@ -125,7 +127,7 @@ def generate_all_sentences():
     print("=" * 50)
 
     # Load vocabulary
-    vocab_file = '/Users/eldiaploo/Desktop/LingXM-Personal/public/data/ameeno/it.json'
+    vocab_file = str(corpus.url_to_path(corpus.vocabulary_url("ameeno", "it")))
     print(f"\n📖 Loading vocabulary from {vocab_file}...")
     vocabulary = load_vocabulary(vocab_file)
     print(f"   ✅ Loaded {len(vocabulary)} Italian words")
@@ -9,6 +9,8 @@ import json
 import os
 import random
 
+import corpus
+
 def load_vocabulary(file_path):
     """Load Italian vocabulary words."""
     with open(file_path, 'r', encoding='utf-8') as f:
@@ -228,7 +230,7 @@ def main():
     print("=" * 50)
 
     # Load vocabulary
-    vocab_file = '/Users/eldiaploo/Desktop/LingXM-Personal/public/data/ameeno/it.json'
+    vocab_file = str(corpus.url_to_path(corpus.vocabulary_url("ameeno", "it")))
     print(f"\n📖 Loading vocabulary from {vocab_file}...")
     vocabulary = load_vocabulary(vocab_file)
     print(f"   ✅ Loaded {len(vocabulary)} Italian words")
@@ -6,10 +6,12 @@ Generate 540 perfect Italian A1 sentences for Ameeno (complete beginner).
 
 import json
 import os
-import re
 import time
 import anthropic
 
+import corpus
+from grammar_rules import check_sentence, format_findings
+
 def load_vocabulary(file_path):
     """Load Italian vocabulary words."""
     with open(file_path, 'r', encoding='utf-8') as f:
@@ -21,16 +23,10 @@ def validate_italian_grammar(sentence):
     Validate Italian grammar rules to avoid common mistakes.
     Returns (is_valid, error_message)
     """
-    # Check for adverbs used as nouns (CRITICAL ERROR)
-    adverb_as_noun_patterns = [
-        r'\b(un|il|lo|la|i|gli|le)\s+(mai|sempre|spesso|raramente|ieri|oggi|domani|presto|tardi|bene|male|molto|poco)\b',
-        r'\bmio\s+(perché|quando|dove|come|mai|sempre)\b',
-        r'\bmi piace il\s+(blu|rosso|verde|giallo|felice|triste|grande|piccolo)\s*[.,!?]?\s*$'
-    ]
-
-    for pattern in adverb_as_noun_patterns:
-        if re.search(pattern, sentence, re.IGNORECASE):
-            return False, f"Adverb/adjective used as noun: {pattern}"
+    # Check for adverbs/adjectives used as nouns (scripts/grammar_rules.py)
+    findings = check_sentence(sentence, "it", "a1")
+    if findings:
+        return False, f"Adverb/adjective used as noun: {format_findings(findings)}"
 
     # Check for reasonable sentence length (5-10 words)
     words = sentence.split()
@@ -195,7 +191,7 @@ def main():
     print("✅ Anthropic client initialized")
 
     # Load vocabulary
-    vocab_file = '/Users/eldiaploo/Desktop/LingXM-Personal/public/data/ameeno/it.json'
+    vocab_file = str(corpus.url_to_path(corpus.vocabulary_url("ameeno", "it")))
     print(f"\n📖 Loading vocabulary from {vocab_file}...")
     vocabulary = load_vocabulary(vocab_file)
     print(f"   ✅ Loaded {len(vocabulary)} Italian words")
@@ -7,12 +7,14 @@ Includes Italian-specific grammar checks to avoid common errors.
 
 import json
 import os
-import re
 from datetime import date
 from typing import Dict, List, Any
 import anthropic
 import time
 
+import corpus
+from grammar_rules import check_sentence
+
 
 def load_vocabulary(file_paths: List[str]) -> List[Dict[str, Any]]:
     """Load and merge vocabulary from JSON files."""
@@ -27,35 +29,12 @@ def load_vocabulary(file_paths: List[str]) -> List[Dict[str, Any]]:
 def validate_italian_grammar(sentence: str, word: str) -> List[str]:
     """
     Validate Italian sentence for common grammar errors.
-    Returns list of errors found.
+    Returns list of errors found (rules in scripts/grammar_rules.py).
     """
-    errors = []
-
-    # Check for adverbs/time words used as nouns after articles
-    # e.g., "Vedo un mai" (I see a never) - WRONG!
-    adverb_pattern = r'\b(un|una|il|lo|la|i|gli|le)\s+(mai|sempre|spesso|raramente|ieri|oggi|domani|presto|tardi)\b'
-    if re.search(adverb_pattern, sentence, re.IGNORECASE):
-        errors.append(f"Adverb/time word used as noun: {sentence}")
-
-    # Check for conjunctions used as nouns
-    # e.g., "Questo è mio perché" (This is my because) - WRONG!
-    conjunction_pattern = r'\b(un|una|il|lo|la|mio|tuo|suo)\s+(perché|quando|dove|come|se|ma|quindi)\b'
-    if re.search(conjunction_pattern, sentence, re.IGNORECASE):
-        errors.append(f"Conjunction used as noun: {sentence}")
-
-    # Check for adjectives used as standalone nouns without context
-    # e.g., "Mi piace il blu" without "colore" - potentially WRONG (context-dependent)
-    # This is a softer check - we'll flag it but not fail
-    color_pattern = r'\b(il|lo|la)\s+(blu|rosso|verde|giallo|bianco|nero|rosa)\s*[.!?]?\s*$'
-    if re.search(color_pattern, sentence, re.IGNORECASE):
-        errors.append(f"WARNING: Color adjective might need noun: {sentence}")
-
-    # Check for adjectives like "buono", "bello" used as standalone nouns
-    adjective_standalone = r'\b(il|lo|la)\s+(buono|bello|brutto|grande|piccolo|felice|triste)\s*[.!?]?\s*$'
-    if re.search(adjective_standalone, sentence, re.IGNORECASE):
-        errors.append(f"WARNING: Adjective might need noun: {sentence}")
-
-    return errors
+    return [
+        f"{'WARNING: ' if rule.severity == 'warning' else ''}{rule.message}: {sentence}"
+        for rule, _ in check_sentence(sentence, "it", "a1")
+    ]
 
 
 def validate_sentence_length(sentence: str, min_words: int = 5, max_words: int = 10) -> bool:
@@ -247,7 +226,7 @@ def generate_italian_a1_sentences(client: anthropic.Anthropic) -> None:
         "language_name": "Italian",
         "level": "A1",
         "source_profiles": ["ameeno"],
-        "source_files": [f"{base_dir}/public/data/ameeno/it.json"],
+        "source_files": [str(corpus.url_to_path(corpus.vocabulary_url("ameeno", "it")))],
         "output_file": f"{base_dir}/public/data/sentences/it/it-a1-sentences.json",
         "translation_langs": ["fa", "en"],  # Extract from these
         "gen_translation_lang": "en",  # Generate with this
@@ -11,6 +11,8 @@ from typing import Dict, List, Any
 import anthropic
 import time
 
+import corpus
+
 
 def load_vocabulary(file_paths: List[str]) -> List[Dict[str, Any]]:
     """Load and merge vocabulary from JSON files."""
@@ -282,7 +284,7 @@ def main():
             "language_name": "Italian",
             "level": "A1",
             "source_profiles": ["ameeno"],
-            "source_files": [f"{base_dir}/public/data/ameeno/it.json"],
+            "source_files": [str(corpus.url_to_path(corpus.vocabulary_url("ameeno", "it")))],
             "output_file": f"{base_dir}/public/data/sentences/it/it-a1-sentences.json",
             "translation_langs": ["fa", "en"],  # Extract from these
             "gen_translation_lang": "en",  # Generate with this
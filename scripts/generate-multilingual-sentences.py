@@ -9,6 +9,8 @@ from datetime import date
 from typing import Dict, List, Any
 import anthropic
 
+import corpus
+
 
 def load_vocabulary(file_path: str) -> List[Dict[str, Any]]:
     """Load vocabulary from JSON file."""
@@ -268,7 +270,7 @@ def main():
             "language_name": "Italian",
             "level": "A1",
             "source_profiles": ["ameeno"],
-            "source_files": [f"{base_dir}/public/data/ameeno/it.json"],
+            "source_files": [str(corpus.url_to_path(corpus.vocabulary_url("ameeno", "it")))],
             "output_file": f"{base_dir}/public/data/sentences/it/it-a1-sentences.json",
             "translation_langs": ["fa", "en"],
             "domain": "basic Italian, greetings, simple phrases",
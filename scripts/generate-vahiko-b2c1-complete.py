@@ -15,6 +15,8 @@ import re
 from datetime import datetime
 from typing import List, Dict, Any, Tuple
 
+from grammar_rules import check_sentence, format_findings
+
 
 class GermanB2C1Generator:
     """Generator for German B2-C1 sentences with strict grammar validation."""
@@ -195,23 +197,10 @@ class GermanB2C1Generator:
         return templates[idx]
 
     def validate_grammar(self, sentence: str) -> Tuple[bool, str]:
-        """Validate German grammar rules. Returns (is_valid, error_message)."""
-
-        # Rule 1: No articles with adverbs
-        if re.search(r'\b(ein|eine|einer|einem|einen|der|die|das|des|dem|den)\s+(niemals|immer|oft|heute|gestern|morgen|bereits|schon)\b', sentence, re.IGNORECASE):
-            return False, "Article used with adverb"
-
-        # Rule 2: Check for adjectives incorrectly used as standalone nouns
-        # Pattern: adjective followed by verb without proper noun structure
-        if re.search(r'\b(wichtig|komplex|strategisch|umfassend|gründlich)\s+(ist|wird|war|hat|haben)\b', sentence):
-            # Check if it's part of a proper structure like "das Wichtige ist"
-            if not re.search(r'\b(das|die|der)\s+(Wichtige|Komplexe|Strategische|Umfassende|Gründliche)', sentence, re.IGNORECASE):
-                return False, "Adjective used incorrectly as noun"
-
-        # Rule 3: Check sentence ends properly
-        if not re.search(r'[.?!]$', sentence):
-            return False, "Sentence doesn't end with punctuation"
-
+        """Validate German grammar rules (scripts/grammar_rules.py). Returns (is_valid, error_message)."""
+        findings = check_sentence(sentence, "de", "b2c1", severity="error")
+        if findings:
+            return False, format_findings(findings)
         return True, ""
 
     def generate_sentences_for_word(self, word: str, word_data: Dict, word_index: int) -> List[Dict[str, Any]]:
@@ -12,6 +12,8 @@ from datetime import datetime
 from typing import List, Dict, Any, Tuple, Optional
 import random
 
+from grammar_rules import check_sentence, format_findings
+
 
 class GermanB2C1GeneratorFixed:
     """Generator for German B2-C1 sentences with automatic article detection."""
@@ -218,15 +220,10 @@ class GermanB2C1GeneratorFixed:
         return templates[idx]
 
     def validate_grammar(self, sentence: str) -> Tuple[bool, str]:
-        """Validate German grammar."""
-        # Check for articles with adverbs
-        if re.search(r'\b(ein|eine|der|die|das)\s+(niemals|immer|oft|heute|gestern|morgen)\b', sentence, re.IGNORECASE):
-            return False, "Article with adverb"
-
-        # Check sentence ends properly
-        if not re.search(r'[.?!]$', sentence):
-            return False, "No punctuation"
-
+        """Validate German grammar (scripts/grammar_rules.py)."""
+        findings = check_sentence(sentence, "de", "b2c1", severity="error")
+        if findings:
+            return False, format_findings(findings)
         return True, ""
 
     def generate_sentences_for_word(self, word: str, word_data: Dict, word_index: int) -> List[Dict[str, Any]]:
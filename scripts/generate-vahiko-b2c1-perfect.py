@@ -6,10 +6,11 @@ Generate perfect German B2-C1 sentences for Vahiko (urban planning professional)
 
 import json
 import os
-import re
 from typing import List, Dict
 from openai import OpenAI
 
+from grammar_rules import check_sentence, format_findings
+
 # Configuration
 VOCAB_FILE = "public/data/vahiko/de.json"
 OUTPUT_FILE = "public/data/sentences/de/de-b2c1-sentences.json"
@@ -22,25 +23,12 @@ client = OpenAI(api_key=API_KEY)
 
 def validate_grammar(sentence: str) -> tuple[bool, str]:
     """
-    Validate German grammar to catch common errors.
+    Validate German grammar to catch common errors (scripts/grammar_rules.py).
     Returns (is_valid, error_message)
     """
-    # Check for article + adverb errors (ein niemals, der heute, etc.)
-    adverbs = r'\b(niemals|immer|oft|selten|manchmal|gestern|heute|morgen|jetzt|bald|früher|später)\b'
-    if re.search(rf'\b(ein|eine|der|die|das)\s+{adverbs}', sentence, re.IGNORECASE):
-        return False, f"Article with adverb error: {sentence}"
-
-    # Check for adjective as noun errors (ist wichtig., denke komplex ist, etc.)
-    adjectives = r'\b(wichtig|komplex|strategisch|umfassend|gründlich|effektiv|nachhaltig|innovativ|modern|traditionell)\b'
-    if re.search(rf'(ist|war|wird|denke|finde|meine)\s+{adjectives}\s*(ist|war|wird|\.)', sentence, re.IGNORECASE):
-        return False, f"Adjective as noun error: {sentence}"
-
-    # Check for standalone adjective at end (sentence ending with adjective only)
-    if re.search(rf'{adjectives}\s*\.$', sentence, re.IGNORECASE):
-        # Make sure it's not "Das Projekt ist wichtig." which is valid
-        if not re.search(r'\b(ist|war|wird|sind|waren|werden)\s+\w+\s*\.$', sentence, re.IGNORECASE):
-            return False, f"Standalone adjective error: {sentence}"
-
+    findings = check_sentence(sentence, "de", "b2c1", severity="error")
+    if findings:
+        return False, f"{format_findings(findings)}: {sentence}"
     return True, ""
 
 def generate_sentences_batch(words: List[Dict], start_idx: int) -> List[Dict]:
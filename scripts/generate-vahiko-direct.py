@@ -5,23 +5,16 @@ This script validates and formats the sentences
 """
 
 import json
-import re
 import os
 from typing import List, Dict
 
-def validate_grammar(sentence: str) -> tuple[bool, str]:
-    """Validate German grammar to catch common errors"""
-
-    # Check for article + adverb errors
-    adverbs = r'\b(niemals|immer|oft|selten|manchmal|gestern|heute|morgen|jetzt|bald|früher|später)\b'
-    if re.search(rf'\b(ein|eine|der|die|das)\s+{adverbs}', sentence, re.IGNORECASE):
-        return False, f"Article with adverb error: {sentence}"
-
-    # Check for adjective as noun errors
-    adjectives = r'\b(wichtig|komplex|strategisch|umfassend|gründlich|effektiv|nachhaltig|innovativ)\b'
-    if re.search(rf'(ist|war|wird|denke|finde)\s+{adjectives}\s+(ist|war|wird|\.)', sentence, re.IGNORECASE):
-        return False, f"Adjective as noun error: {sentence}"
+from grammar_rules import check_sentence, format_findings
 
+def validate_grammar(sentence: str) -> tuple[bool, str]:
+    """Validate German grammar to catch common errors (scripts/grammar_rules.py)"""
+    findings = check_sentence(sentence, "de", "b2c1", severity="error")
+    if findings:
+        return False, f"{format_findings(findings)}: {sentence}"
     return True, ""
 
 def validate_and_save(sentences: List[Dict], output_file: str):
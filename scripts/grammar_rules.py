@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+Per-language grammar rule registry, compiled into one regex per language
+and level.
+
+The generators each carried their own checks: validate_italian_grammar
+(it-a1), BAD_PATTERNS (de-c1-stadtplanung), catastrophic_patterns
+(en-a1a2, en-c1c2, hassan-c1c2, de-c1-gastro), nonsense_patterns
+(de-c1-gastro), validate_grammar (vahiko scripts), validate_german_sentence
+and the quality reports (kafel) and bad_patterns (fr-b1b2-gastro,
+de-b2-it). Each looped over its patterns and ran re.search once per
+pattern; all of them now call check_sentence. Here rules are declared
+once, below, and every (language, level) gets a RuleSet that
+evaluates all of its rules in one pass per sentence:
+
+    triggers  each rule names its rarest words; one alternation of all
+              trigger words scans the lowercased sentence once and picks
+              the candidate rules (usually none)
+    combined  the candidates are evaluated by one anchored match made of an
+              optional lookahead per rule,
+              (?=(?:.*?(?P<r0>rule 0))?)(?=(?:.*?(?P<r1>rule 1))?)...,
+              which captures the first hit of every rule at once
+
+Structural rules (final punctuation) are plain functions run on every
+sentence. Rules keep their own case sensitivity through scoped inline
+flags, (?i:...).
+Each RuleSet counts hits per rule. RULESET_VERSION is a hash of the rule
+definitions and RuleSet.version the hash of the rules it applies, so
+caches (scripts/validation_cache.py) can tell when rules changed.
+
+Changes from the original checks:
+  - substring checks ("a today") became word-bounded regexes, so "data
+    today" no longer trips the English rule
+  - "ist wichtig." is no longer an error (the vahiko prompt itself lists
+    "Das Projekt ist wichtig" as correct)
+  - article + temporal adverb ("die bereits erwähnte", "die heute
+    geltenden") is a warning; "ein niemals" stays an error
+
+Usage:
+    python3 scripts/grammar_rules.py check      # hits per rule over the corpus
+    python3 scripts/grammar_rules.py bench      # combined vs one-by-one timing
+"""
+
+import argparse
+import inspect
+import re
+import time
+from collections import Counter, namedtuple
+
+import corpus
+from build_sentence_manifest import parse_stem
+
+Rule = namedtuple("Rule", "name language pattern message severity levels ignore_case triggers test")
+
+LEVEL = re.compile(r"[abc][12]")
+
+# Sentence end, optionally after punctuation: for rules on the last words of a sentence
+END = r"\s*[.!?]?\s*\Z"
+
+FINAL_PUNCTUATION = set(""".?!…:;"'»«“”‘’)]؟。""")
+
+
+def rule(name, *slots, message, severity="error", levels=None, end=False, test=None, ignore_case=True):
+    """Declare a rule; the language is the name prefix ("de.", "it.", "*." for all).
+
+    slots are consecutive words, each "a|b|c". The pattern is the slots
+    joined by whitespace between word boundaries, and the rule is only
+    evaluated on sentences containing a word of its slot with the longest
+    words (articles and pronouns are too common to be useful triggers).
+    Structural rules pass test instead: a function of the sentence that
+    returns the offending text or None, run on every sentence.
+    """
+    pattern = None
+    triggers = None
+    if slots:
+        pattern = r"\b" + r"\s+".join(f"(?:{slot})" for slot in slots) + (END if end else r"\b")
+        # Longer words are rarer: trigger on the slot with the longest alternatives
+        rarest = max(slots, key=lambda slot: sum(map(len, slot.split("|"))) / len(slot.split("|")))
+        triggers = frozenset(alt.lower() for alt in rarest.split("|"))
+    return Rule(name, name.split(".", 1)[0], pattern, message, severity,
+                frozenset(levels) if levels else None, ignore_case, triggers, test)
+
+
+def missing_final_punctuation(sentence):
+    """Last character if the sentence does not end with punctuation."""
+    last = sentence.rstrip()[-1:]
+    return last if last and last not in FINAL_PUNCTUATION else None
+
+
+DE_ADJECTIVES = (
+    "strategisch|umfassend|wesentlich|zeitgenössisch|entscheidend|nachhaltig|ganzheitlich|"
+    "infrastrukturell|urbanisiert|raffiniert|exquisit|delikat|aromatisch|wichtig|komplex|gründlich|"
+    "effektiv|innovativ|modern|traditionell"
+)
+
+DE_IT_ADJECTIVES = "skalierbar|robust|effizient|stabil|sicher|flexibel|performant"
+
+RULES = [
+    rule("*.final-punctuation", test=missing_final_punctuation, message="sentence does not end with punctuation"),
+
+    # German
+    rule("de.indefinite-article-adverb", "ein|eine|einer|einem|einen", "niemals|immer|oft|selten|manchmal|weil|obwohl",
+         message="indefinite article before an adverb or conjunction"),
+    rule("de.definite-article-adverb", "der|die|das|des|dem|den",
+         "niemals|immer|oft|selten|manchmal|gestern|heute|morgen|jetzt|bald|früher|später|bereits|schon",
+         message="definite article before an adverb", severity="warning"),
+    rule("de.adjective-as-noun", "das|die|der|ein|eine", DE_ADJECTIVES + "|niemals|immer", "ist|muss|sollte|kann|wird",
+         message="uninflected adjective used as a noun"),
+    rule("de.adjective-as-verb", "sollte|könnte|würde|müsste|muss|kann",
+         "strategisch|umfassend|wesentlich|zeitgenössisch|nachhaltig|infrastrukturell|ganzheitlich|aromatisch|raffiniert|"
+         "delikat|exquisit", "das|die|der", message="adjective used as a verb"),
+    rule("de.adjective-as-object", "bringen", "das", "exquisit|raffiniert",
+         message="uninflected adjective used as the object of a verb"),
+    rule("de.adjective-copula-article", "aromatisch|raffiniert|delikat", "ist|muss", "das|die",
+         message="adjective used as the subject of a clause", severity="warning"),
+    rule("de.adjective-copula-chain", "nachhaltig|ganzheitlich|infrastrukturell|urbanisiert", "ist|muss|sollte|wird", "sein|werden",
+         message="adjective followed by a doubled copula"),
+    rule("de.adjective-as-subject", "ist|war|wird|denke|finde|meine", DE_ADJECTIVES, "ist|war|wird",
+         message="adjective used as the subject of a clause"),
+    rule("de.trailing-article-adjective", "die", "delikat|exquisit|aromatisch", end=True,
+         message="sentence ends on article + uninflected adjective"),
+    rule("de.it-adjective-as-noun", "ein|der|die|das", DE_IT_ADJECTIVES,
+         message="uninflected IT adjective used as a noun", severity="warning"),
+    rule("de.it-adjective-object", "implementiere", "skalierbar|robust|effizient", end=True,
+         message="adjective used as the object of a verb"),
+    rule("de.it-adjective-copula", DE_IT_ADJECTIVES, "ist", "wichtig|notwendig", end=True,
+         message="adjective used as the subject of a clause"),
+
+    # English
+    rule("en.article-adverb", "a", "today|tomorrow|yesterday|never|always|sometimes|often|here|there",
+         message="adverb used as a noun"),
+    rule("en.definite-article-adverb", "the", "never|always|here|there", message="adverb used with an article"),
+    rule("en.article-conjunction", "a|the", "because", message="conjunction used as a noun"),
+    rule("en.article-sentence-adverb", "a|an|the", "inherently|predominantly|ostensibly|inadvertently|concurrently",
+         message="sentence adverb right after an article", severity="warning", levels=("c1", "c2")),
+    rule("en.adjective-as-subject", "the", "pragmatic|empirical", "is|demonstrates",
+         message="adjective used as the subject of a clause"),
+    rule("en.adjective-as-noun", "think", "viable|tangible|robust|lucrative|resilient|volatile|static|dynamic", "is",
+         message="adjective used as a noun"),
+    rule("en.adjective-sequence", "strategic", "unilateral", message="adjective sequence error",
+         severity="warning", levels=("c1", "c2")),
+    rule("en.abstract-collocation", "the", "empirical|pragmatic|intricate|comprehensive|substantial",
+         "paradox|dilemma|threshold", "is", message="unidiomatic adjective + abstract noun subject",
+         severity="warning", levels=("c1", "c2")),
+
+    # French
+    rule("fr.article-adverb", "un|le", "jamais|toujours|souvent|hier|aujourd'hui|maintenant",
+         message="adverb used as a noun"),
+    rule("fr.possessive-conjunction", "c'est", "mon", "parce que|jamais|toujours|quand|si",
+         message="conjunction or adverb used as a noun"),
+    rule("fr.adjective-without-noun", "j'aime", "le", "bleu|rouge|vert|délicieux|bon", end=True,
+         message="adjective without a noun", severity="warning", levels=("a1", "a2", "b1")),
+
+    # Italian
+    rule("it.article-adverb", "un|una|il|lo|la|i|gli|le", "mai|sempre|spesso|raramente|ieri|oggi|domani|presto|tardi",
+         message="adverb or time word used as a noun"),
+    rule("it.article-conjunction", "un|una|il|lo|la|mio|tuo|suo", "perché|quando|dove|come|se|ma|quindi",
+         message="conjunction used as a noun"),
+    rule("it.possessive-adverb", "mio|tuo|suo", "mai|sempre", message="adverb used as a noun"),
+    rule("it.article-degree-adverb", "un|il|lo|la|i|gli|le", "bene|male|molto|poco",
+         message="adverb might be used as a noun", severity="warning", levels=("a1", "a2")),
+    rule("it.color-without-noun", "il|lo|la", "blu|rosso|verde|giallo|bianco|nero|rosa", end=True,
+         message="color adjective might need a noun", severity="warning", levels=("a1", "a2")),
+    rule("it.adjective-without-noun", "il|lo|la", "buono|bello|brutto|grande|piccolo|felice|triste", end=True,
+         message="adjective might need a noun", severity="warning", levels=("a1", "a2")),
+]
+
+
+def test_source(test):
+    """Source of a structural rule's test plus the module constants it reads."""
+    source = inspect.getsource(test)
+    for name in test.__code__.co_names:
+        value = test.__globals__.get(name)
+        if isinstance(value, (set, frozenset)):
+            source += f"\n{name} = {sorted(value)!r}"
+        elif isinstance(value, (str, tuple, list, dict)):
+            source += f"\n{name} = {value!r}"
+    return source
+
+
+def rules_version(rules):
+    """Hash of rule definitions; changes whenever one of the rules does.
+
+    Structural rules contribute their test's source, so editing the function
+    or a constant it uses (FINAL_PUNCTUATION) invalidates cached results too.
+    """
+    return corpus.content_hash(corpus.dump_json(
+        [[r.name, r.pattern or test_source(r.test), r.message, r.severity, sorted(r.levels or []), r.ignore_case]
+         for r in rules]), 12)
+
+
+RULESET_VERSION = rules_version(RULES)
+
+
+def levels_of(level):
+    """'a1a2' -> {'a1', 'a2'}; None or unparsable -> None (every level)."""
+    found = set(LEVEL.findall((level or "").lower()))
+    return found or None
+
+
+def applies(rule_, language, level):
+    """True if a rule covers this language and level."""
+    if rule_.language not in ("*", language):
+        return False
+    levels = levels_of(level)
+    return rule_.levels is None or levels is None or bool(rule_.levels & levels)
+
+
+def combined_pattern(rules):
+    """One regex capturing the first hit of every rule: an optional lookahead per rule."""
+    parts = [f"(?{'i' if r.ignore_case else '-i'}:{r.pattern})" for r in rules]
+    return re.compile("".join(f"(?=(?:.*?(?P<r{i}>{part}))?)" for i, part in enumerate(parts)), re.S)
+
+
+class RuleSet:
+    """All rules for one language and level.
+
+    One scan of the lowercased sentence with the trigger regex (every
+    trigger word of every rule, a single alternation) selects the candidate
+    rules. One combined regex, compiled per candidate set and cached, then
+    evaluates all of them in a single match. Most sentences trigger nothing
+    and never reach a rule pattern.
+    """
+
+    def __init__(self, rules):
+        self.rules = list(rules)
+        self.version = rules_version(self.rules)
+        self.by_name = {r.name: r for r in self.rules}
+        self.tests = [r for r in self.rules if r.test]
+        self.trigger_index = {}
+        for i, r in enumerate(self.rules):
+            for word in r.triggers or ():
+                self.trigger_index.setdefault(word, []).append(i)
+        words = sorted(self.trigger_index, key=len, reverse=True)
+        self.trigger_pattern = re.compile(r"\b(?:" + "|".join(map(re.escape, words)) + r")\b") if words else None
+        self.patterns = {}
+        self.hits = Counter()
+
+    def candidates(self, sentence):
+        """Indexes of the regex rules whose trigger words occur in the sentence."""
+        if self.trigger_pattern is None:
+            return ()
+        words = set(self.trigger_pattern.findall(sentence.lower()))
+        if not words:
+            return ()
+        return tuple(sorted({i for word in words for i in self.trigger_index[word]}))
+
+    def check(self, sentence):
+        """Return [(rule, matched text)] for every rule that hits the sentence."""
+        found = []
+        for r in self.tests:
+            text = r.test(sentence)
+            if text is not None:
+                found.append((r, text))
+
+        candidates = self.candidates(sentence)
+        if candidates:
+            pattern = self.patterns.get(candidates)
+            if pattern is None:
+                pattern = self.patterns[candidates] = combined_pattern([self.rules[i] for i in candidates])
+            match = pattern.match(sentence)
+            for position, i in enumerate(candidates):
+                text = match.group(f"r{position}")
+                if text is not None:
+                    found.append((self.rules[i], text))
+
+        for r, _ in found:
+            self.hits[r.name] += 1
+        return found
+
+
+class RuleEngine:
+    """Compiles and caches one RuleSet per (language, level)."""
+
+    def __init__(self, rules=RULES):
+        self.rules = rules
+        self.rule_sets = {}
+
+    def rule_set(self, language, level=None):
+        rule_set = self.rule_sets.get((language, level))
+        if rule_set is None:
+            rule_set = self.rule_sets[language, level] = RuleSet(r for r in self.rules if applies(r, language, level))
+        return rule_set
+
+    def check(self, sentence, language, level=None):
+        return self.rule_set(language, level).check(sentence)
+
+    @property
+    def hits(self):
+        total = Counter()
+        for rule_set in self.rule_sets.values():
+            total.update(rule_set.hits)
+        return total
+
+
+ENGINE = RuleEngine()
+
+
+def check_sentence(sentence, language, level=None, severity=None):
+    """Findings for one sentence; severity="error" drops warnings."""
+    return [(r, text) for r, text in ENGINE.check(sentence, language, level)
+            if severity is None or r.severity == severity]
+
+
+def format_findings(findings):
+    """'rule-name: message ("matched text"); ...' for generator log lines."""
+    return "; ".join(f"{r.name}: {r.message} ({text.strip()!r})" for r, text in findings)
+
+
+def iter_corpus_sentences():
+    """Yield (path, language, level, sentence) for every sentence in the corpus."""
+    for path in corpus.iter_sentence_files():
+        language, level, _ = parse_stem(path)
+        data = corpus.load_json(path)
+        for entries in data["sentences"].values():
+            for entry in entries:
+                yield path, language, level, entry["sentence"]
+
+
+def naive_check(rules, sentence):
+    """Reference: run each compiled rule separately, the way the generators did."""
+    found = []
+    for r, pattern in rules:
+        text = r.test(sentence) if r.test else (m := pattern.search(sentence)) and m.group(0)
+        if text:
+            found.append((r, text))
+    return found
+
+
+def run_check(args):
+    engine = RuleEngine()
+    per_file = Counter()
+    examples = {}
+    items = list(iter_corpus_sentences())
+    for path, language, level, sentence in items:
+        for r, _ in engine.check(sentence, language, level):
+            per_file[path.name] += 1
+            examples.setdefault(r.name, []).append(sentence)
+
+    print(f"\n📏 Rules (version {RULESET_VERSION}):")
+    hits = engine.hits
+    for r in RULES:
+        icon = "✅" if not hits[r.name] else ("⚠️ " if r.severity == "warning" else "❌")
+        print(f"   {icon} {r.name:34} {hits[r.name]:5} hits  {r.message}")
+        for sentence in examples.get(r.name, [])[:args.examples]:
+            print(f"         - {sentence}")
+
+    print("\n📄 Files:")
+    for path in corpus.iter_sentence_files():
+        print(f"   {path.name:40} {per_file[path.name]:5} findings")
+    return len(items)
+
+
+def run_bench(args):
+    items = list(iter_corpus_sentences())
+    engine = RuleEngine()
+    compiled = {}
+
+    def naive_rules(language, level):
+        key = (language, level)
+        if key not in compiled:
+            compiled[key] = [(r, r.pattern and re.compile(r.pattern, re.I if r.ignore_case else 0))
+                             for r in RULES if applies(r, language, level)]
+        return compiled[key]
+
+    for _, language, level, sentence in items:  # compile outside the timed loops
+        engine.rule_set(language, level)
+        naive_rules(language, level)
+
+    timings = {}
+    results = {}
+    for name, check in (("one-by-one", lambda s, lang, lvl: naive_check(naive_rules(lang, lvl), s)),
+                        ("combined", lambda s, lang, lvl: engine.check(s, lang, lvl))):
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            found = [sorted(r.name for r, _ in check(sentence, language, level))
+                     for _, language, level, sentence in items]
+            best = min(best, time.perf_counter() - start)
+        timings[name] = best
+        results[name] = found
+
+    mismatches = sum(a != b for a, b in zip(results["one-by-one"], results["combined"]))
+    print(f"\n⏱️  {len(items)} sentences, {len(RULES)} rules, best of {args.repeat}:")
+    for name, seconds in timings.items():
+        print(f"   {name:12} {seconds * 1000:8.1f} ms  ({len(items) / seconds:,.0f} sentences/s)")
+    print(f"   speedup      {timings['one-by-one'] / timings['combined']:.1f}×")
+    print(f"   {'✅' if not mismatches else '❌'} {mismatches} sentences with different findings")
+    return len(items)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compiled grammar rule engine")
+    sub = parser.add_subparsers(dest="command", required=True)
+    check = sub.add_parser("check", help="hits per rule over the sentence corpus")
+    check.add_argument("--examples", type=int, default=2, help="example sentences per rule")
+    bench = sub.add_parser("bench", help="compare against running rules one by one")
+    bench.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("Grammar Rule Engine" + (" Benchmark" if args.command == "bench" else ""))
+    print("=" * 70)
+
+    total = run_check(args) if args.command == "check" else run_bench(args)
+
+    print("\n" + "=" * 70)
+    print(f"✅ {total} sentences checked")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+Lemma/inflection index compiled from the vocabulary files.
+
+The sentence generators located the target word with bidirectional
+substring matching (find_word_position). That misses inflected forms
+("impliziert" for "implizieren", "Ambivalenzen" for "die Ambivalenz") and
+matches short substrings by accident ("Plan" inside "Bebauungsplan",
+"ist" inside "Liste").
+
+InflectionIndex maps every surface form to its lemma(s):
+  - the vocabulary word itself, with and without its article
+  - every form in its `conjugations` table (Präsens ich, Präteritum,
+    Perfekt, Présent je, Past, ...), with pronouns and auxiliaries dropped
+  - rule-based endings for nouns, verbs and adjectives (not for words
+    shorter than three letters, function words or articles, which are
+    indexed only as written)
+
+Locating the target is then one dict lookup per token.
+
+Usage (report how the index compares to substring matching on the
+current corpus):
+    python3 scripts/inflections.py
+"""
+
+import corpus
+
+TOKEN_STRIP = '.,!?;:"“”„«»()[]{}\'’'
+
+ARTICLES = {"der", "die", "das", "le", "la", "les", "il", "lo", "gli", "the", "a", "an"}
+ELIDED = ("l'", "l’")
+
+# Words in conjugation values that are not the inflected verb itself
+FUNCTION_WORDS = {
+    "de": {"ich", "du", "er", "sie", "es", "wir", "ihr", "man", "sich", "mich", "dich", "uns", "euch",
+           "habe", "hast", "hat", "haben", "habt", "bin", "bist", "ist", "sind", "seid", "zu"},
+    "fr": {"je", "j'", "tu", "il", "elle", "on", "nous", "vous", "ils", "elles", "me", "te", "se", "s'",
+           "ai", "as", "a", "avons", "avez", "ont", "suis", "es", "est", "sommes", "êtes", "sont"},
+    "it": {"io", "tu", "lui", "lei", "noi", "voi", "loro", "mi", "ti", "si", "ci", "vi",
+           "ho", "hai", "ha", "abbiamo", "avete", "hanno", "sono", "sei", "è", "siamo", "siete"},
+    "en": {"i", "you", "he", "she", "it", "we", "they", "to", "have", "has", "had"},
+}
+
+INSEPARABLE_PREFIXES = ("be", "ge", "er", "ver", "zer", "ent", "emp", "miss")
+
+# Shorter heads get no rule-based endings: "o" would yield "a", "e", "i"
+MIN_INFLECTED_LENGTH = 3
+
+NOUN_ENDINGS = {
+    "de": ("s", "es", "e", "en", "n", "er", "ern", "nen"),
+    "en": ("s", "es"),
+    "fr": ("s", "x"),
+}
+
+ADJECTIVE_ENDINGS = {
+    "de": ("e", "er", "es", "en", "em", "ere", "eren", "erer", "ste", "sten", "ster"),
+    "fr": ("e", "s", "es"),
+    "en": ("ly", "er", "est"),
+}
+
+# Regular verb endings by infinitive ending (stem = infinitive minus that ending)
+VERB_ENDINGS = {
+    "fr": {
+        "er": ("e", "es", "ons", "ez", "ent", "é", "ée", "és", "ées", "ais", "ait", "era", "erai"),
+        "ir": ("is", "it", "issons", "issez", "issent", "i", "ie", "is", "ira"),
+        "re": ("s", "ons", "ez", "ent", "u", "ue"),
+    },
+    "it": {
+        "are": ("o", "i", "a", "iamo", "ate", "ano", "ato", "ata", "ati", "ava", "erò", "erà"),
+        "ere": ("o", "i", "e", "iamo", "ete", "ono", "uto", "uta", "eva", "erò", "erà"),
+        "ire": ("o", "i", "e", "iamo", "ite", "ono", "ito", "ita", "isco", "isce", "iva"),
+    },
+    "ru": {
+        "ать": ("аю", "аешь", "ает", "аем", "аете", "ают", "ал", "ала", "ало", "али"),
+        "ять": ("яю", "яешь", "яет", "яем", "яете", "яют", "ял", "яла", "яло", "яли"),
+        "еть": ("ю", "ишь", "ит", "им", "ите", "ят", "ел", "ела", "ело", "ели"),
+        "ить": ("ю", "у", "ишь", "ит", "им", "ите", "ят", "ат", "ил", "ила", "ило", "или"),
+        "ть": ("ю", "ешь", "ет", "ем", "ете", "ют", "л", "ла", "ло", "ли"),
+    },
+}
+
+# Russian case endings: (lemma ending, replacement endings)
+RUSSIAN_ENDINGS = (
+    ("ый", ("ая", "ое", "ые", "ого", "ому", "ым", "ом", "ой", "ую", "ых", "ыми")),
+    ("ий", ("ая", "яя", "ое", "ее", "ие", "его", "ого", "ему", "ому", "им", "ем", "ой", "ей", "ую", "юю", "их", "ими")),
+    ("ой", ("ая", "ое", "ые", "ого", "ому", "ым", "ом", "ую", "ых", "ыми")),
+    ("а", ("ы", "и", "е", "у", "ой", "ей", "ам", "ами", "ах")),
+    ("я", ("и", "е", "ю", "ей", "ям", "ями", "ях")),
+    ("о", ("а", "у", "ом", "е", "ам", "ами", "ах")),
+    ("е", ("я", "ю", "ем", "и", "ям", "ями", "ях")),
+    ("ь", ("я", "и", "ю", "ем", "ём", "ей", "ям", "ями", "ях")),
+    ("", ("а", "у", "ом", "е", "ы", "и", "ов", "ев", "ей", "ам", "ами", "ах")),
+)
+
+# Arabic proclitics (conjunction/preposition + article) written onto the word
+ARABIC_PREFIXES = ("ال", "وال", "بال", "فال", "كال", "لل", "و", "ب", "ل", "ف", "ك")
+
+
+def clean_token(token):
+    return token.strip(TOKEN_STRIP).lower()
+
+
+def split_lemma(word):
+    """Return (article, marker, head words) for a vocabulary word.
+
+    'die Ambivalenz' -> ('die', None, ['ambivalenz'])
+    'to carry out'   -> (None, 'to', ['carry', 'out'])
+    "l'entrée"       -> ("l'", None, ['entrée'])
+    """
+    words = word.strip().lower().split()
+    article = marker = None
+    if words and words[0].startswith(ELIDED) and len(words[0]) > 2:
+        article, words[0] = "l'", words[0][2:]
+    elif len(words) > 1 and words[0] in ARTICLES:
+        article, words = words[0], words[1:]
+    if len(words) > 1 and words[0] in ("to", "sich", "se"):
+        marker, words = words[0], words[1:]
+    return article, marker, [w.strip(TOKEN_STRIP) for w in words]
+
+
+def german_verb_forms(infinitive):
+    """Regular present, past and participle forms of a German verb."""
+    if infinitive.endswith(("eln", "ern")):
+        stem = infinitive[:-1]
+    elif infinitive.endswith("en"):
+        stem = infinitive[:-2]
+    elif infinitive.endswith("n"):
+        stem = infinitive[:-1]
+    else:
+        return set()
+
+    linking = "e" if stem.endswith(("t", "d")) or (stem.endswith(("m", "n")) and stem[-2:-1] not in "aeiouhlr") else ""
+    forms = {stem + "e", stem + linking + "st", stem + linking + "t", stem + "en", stem + "n"}
+    forms |= {stem + linking + "te" + ending for ending in ("", "st", "n", "t")}
+
+    if infinitive.endswith("ieren") or infinitive.startswith(INSEPARABLE_PREFIXES):
+        participle = stem + linking + "t"
+    else:
+        participle = "ge" + stem + linking + "t"
+    forms |= {participle} | {participle + ending for ending in ADJECTIVE_ENDINGS["de"]}
+    forms.add("zu" + infinitive)
+    return forms
+
+
+def english_verb_forms(verb):
+    """Regular -s, -ed and -ing forms of an English verb."""
+    if verb.endswith("e"):
+        return {verb + "s", verb + "d", verb[:-1] + "ing"}
+    if verb.endswith("y") and verb[-2:-1] not in "aeiou":
+        return {verb[:-1] + "ies", verb[:-1] + "ied", verb + "ing"}
+    if verb.endswith(("s", "sh", "ch", "x", "z")):
+        return {verb + "es", verb + "ed", verb + "ing"}
+    return {verb + "s", verb + "ed", verb + "ing"}
+
+
+def stem_forms(word, endings):
+    """Apply the first matching (infinitive ending -> endings) rule.
+
+    Stems shorter than two letters are left alone ("mare" is not m + -are).
+    """
+    for ending, replacements in endings.items():
+        if word.endswith(ending) and len(word) > len(ending) + 1:
+            stem = word[:-len(ending)]
+            return {stem + replacement for replacement in replacements}
+    return set()
+
+
+def russian_forms(word):
+    """Case forms of a Russian noun or adjective."""
+    for ending, replacements in RUSSIAN_ENDINGS:
+        if word.endswith(ending) and len(word) > len(ending) + 1:
+            stem = word[:-len(ending)] if ending else word
+            return {stem + replacement for replacement in replacements}
+    return set()
+
+
+def arabic_forms(word):
+    """Proclitic, sound feminine plural and tanwin variants of an Arabic word."""
+    stem = word[:-1] if word.endswith("ة") else word
+    bases = {word, stem + "ات"}
+    forms = {word + "اً", word + "ًا", stem + "ته", stem + "تها"}
+    for base in bases:
+        forms |= {prefix + base for prefix in ARABIC_PREFIXES}
+        if base.startswith("ال"):
+            forms |= {prefix + base for prefix in ("و", "ب", "ف", "ك")} | {"لل" + base[2:]}
+    return forms | bases
+
+
+def italian_noun_forms(noun):
+    """Singular/plural of regular -o, -a, -e nouns and adjectives."""
+    plurals = {"o": "i", "a": "e", "e": "i"}
+    forms = {noun[:-1] + plurals[noun[-1]]} if noun[-1:] in plurals else set()
+    if noun.endswith("o"):
+        forms |= {noun[:-1] + "a", noun[:-1] + "e"}
+    return forms
+
+
+def is_verb(entry, article, marker, head, language):
+    if article:
+        return False
+    if entry.get("conjugations") or marker in ("to", "sich", "se"):
+        return True
+    if language == "de":
+        return head[-1].endswith(("en", "eln", "ern")) and not entry["word"].strip()[:1].isupper()
+    if language == "fr":
+        return len(head) == 1 and head[0].endswith(("er", "ir", "re"))
+    if language == "it":
+        return len(head) == 1 and head[0].endswith(("are", "ere", "ire"))
+    if language == "ru":
+        return len(head) == 1 and head[0].endswith(("ть", "ться"))
+    return False
+
+
+def conjugation_values(conjugations):
+    """Flatten a conjugations list of strings or {"form", "value"} objects."""
+    for item in conjugations or []:
+        value = item.get("value") if isinstance(item, dict) else item
+        if isinstance(value, str):
+            yield value
+
+
+class InflectionIndex:
+    """Surface form -> lemmas, built from vocabulary entries."""
+
+    def __init__(self, language="de"):
+        self.language = language
+        self.forms = {}
+        self.lemmas = set()
+
+    @classmethod
+    def from_files(cls, paths, language="de"):
+        """Build an index from one or more vocabulary JSON files."""
+        index = cls(language)
+        for path in paths:
+            for entry in corpus.load_json(path):
+                index.add(entry)
+        return index
+
+    def _add_form(self, form, lemma):
+        form = clean_token(form)
+        if form:
+            lemmas = self.forms.setdefault(form, [])
+            if lemma not in lemmas:
+                lemmas.append(lemma)
+
+    def add(self, entry):
+        """Add a vocabulary entry ({"word", "conjugations"}) or a bare word."""
+        if isinstance(entry, str):
+            entry = {"word": entry}
+        lemma = entry.get("word")
+        if not isinstance(lemma, str) or not lemma.strip() or lemma in self.lemmas:
+            return
+        self.lemmas.add(lemma)
+
+        language = self.language
+        article, marker, words = split_lemma(lemma)
+        if not words:
+            return
+        verb = is_verb(entry, article, marker, words, language)
+
+        # German phrasal verbs put the verb last ("bar zahlen"); elsewhere the head comes first
+        head = words[-1] if language == "de" and verb else words[0]
+        forms = {head}
+
+        # Very short words and function words ("o", "e", "mi", "io") are indexed
+        # as written: endings on them only produce other common words
+        if len(head) < MIN_INFLECTED_LENGTH or head in FUNCTION_WORDS.get(language, ()) or head in ARTICLES:
+            self._add_form(head, lemma)
+            return
+
+        # "Sozialer Wohnungsbau", "Graue Energie": the declined adjective comes first
+        if language == "de" and not verb and len(words) > 1 and head.endswith(("er", "e", "es")):
+            base = head[:-2] if head.endswith(("er", "es")) else head[:-1]
+            forms |= {base} | {base + ending for ending in ADJECTIVE_ENDINGS["de"]}
+
+        function_words = FUNCTION_WORDS.get(language, set())
+        for value in conjugation_values(entry.get("conjugations")):
+            tokens = [clean_token(t) for t in value.replace("/", " ").split()]
+            content = [t for t in tokens if t and t not in function_words and not t.startswith(ELIDED)]
+            # Separated particles ("differenziere aus") are not forms of the word on their own
+            content = [t for t in content if t == head or not head.startswith(t)]
+            forms.update(content)
+            if language == "de" and content and content[-1].endswith("te"):
+                forms |= {content[-1] + "n", content[-1] + "st", content[-1] + "t"}
+
+        if verb:
+            if language == "de":
+                forms |= german_verb_forms(head)
+            elif language == "en":
+                forms |= english_verb_forms(head)
+            else:
+                forms |= stem_forms(head, VERB_ENDINGS.get(language, {}))
+        elif article or (language == "de" and lemma.strip()[:1].isupper()):
+            forms |= {head + ending for ending in NOUN_ENDINGS.get(language, ())}
+            if language == "de" and head.endswith("in"):
+                forms.add(head + "nen")
+        else:
+            forms |= {head + ending for ending in ADJECTIVE_ENDINGS.get(language, ())}
+            if language == "en":
+                forms |= {head + ending for ending in NOUN_ENDINGS["en"]}
+
+        if language == "it" and not verb:
+            forms |= italian_noun_forms(head)
+        elif language == "ru" and not verb:
+            forms |= russian_forms(head)
+        elif language == "ar":
+            forms |= arabic_forms(head)
+
+        # Sorted: set order depends on hash randomization, and lemma order per form is output
+        for form in sorted(forms):
+            self._add_form(form, lemma)
+
+    def lemmas_for(self, token):
+        """Lemmas a (raw) token can be an inflection of.
+
+        Besides the token itself this tries the word after an elided
+        article ("all'università") and the hyphenated prefixes of a compound
+        ("Kiezblock-Konzepte" -> "kiezblock"), one lookup each.
+        """
+        token = clean_token(token)
+        candidates = [token]
+        for apostrophe in ("'", "’"):
+            if apostrophe in token:
+                candidates.append(token.rsplit(apostrophe, 1)[1])
+        if "-" in token:
+            parts = token.split("-")
+            candidates += ["-".join(parts[:n]) for n in range(len(parts) - 1, 0, -1)]
+
+        lemmas = []
+        for candidate in candidates:
+            for lemma in self.forms.get(candidate, ()):
+                if lemma not in lemmas:
+                    lemmas.append(lemma)
+        return lemmas
+
+    def find(self, sentence, lemma):
+        """Index of the first token that is an inflection of lemma, or -1."""
+        if lemma not in self.lemmas:
+            self.add(lemma)
+        for i, token in enumerate(sentence.split()):
+            if lemma in self.lemmas_for(token):
+                return i
+        return -1
+
+
+def substring_position(sentence, target_word):
+    """The old find_word_position (combine_all_batches.py), for comparison."""
+    target_clean = target_word.replace('die ', '').replace('der ', '').replace('das ', '').lower()
+    for i, word in enumerate(sentence.split()):
+        word_clean = word.strip('.,!?;:()[]{}«»"\'').lower()
+        if target_clean in word_clean or word_clean in target_clean:
+            return i
+    return -1
+
+
+def main():
+    print("=" * 70)
+    print("Inflection Index vs Substring Matching")
+    print("=" * 70)
+    print(f"{'vocabulary':<22} {'forms':>6} {'sentences':>9} {'index':>6} {'substr':>6} {'differ':>6}")
+
+    file_map = corpus.load_sentence_file_map()
+    seen = set()
+    for profile_key, profile in corpus.load_profiles().items():
+        for lang in profile["learningLanguages"]:
+            vocab_path = corpus.url_to_path(corpus.vocabulary_url(profile_key, lang["code"]))
+            sentences_url = corpus.resolve_sentence_url(lang["code"], corpus.level_key(lang.get("level")), file_map)
+            if not vocab_path.is_file() or not sentences_url or (vocab_path, sentences_url) in seen:
+                continue
+            seen.add((vocab_path, sentences_url))
+
+            index = InflectionIndex.from_files([vocab_path], lang["code"].split("-", 1)[0])
+            data = corpus.load_json(corpus.url_to_path(sentences_url))
+
+            total = by_index = by_substring = differ = 0
+            for entries in data["sentences"].values():
+                for entry in entries:
+                    if entry["target_word"] not in index.lemmas:
+                        continue
+                    total += 1
+                    a = index.find(entry["sentence"], entry["target_word"])
+                    b = substring_position(entry["sentence"], entry["target_word"])
+                    by_index += a >= 0
+                    by_substring += b >= 0
+                    differ += a >= 0 and b >= 0 and a != b
+
+            print(f"{profile_key + '/' + lang['code']:<22} {len(index.forms):>6} {total:>9} "
+                  f"{by_index:>6} {by_substring:>6} {differ:>6}")
+
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Lint every sentence and vocabulary file in one command, across a process
+pool, with per-rule and per-file timings.
+
+Until now checks only ran inside individual generators
+(run_quality_checks, run_validation_checkpoint) on the file being
+written. This streams every file under public/data through all
+applicable checks:
+
+    sentence files     grammar rules (scripts/grammar_rules.py) for the
+                       file's language and level, plus entry checks
+                       (required keys, repeated sentences)
+    vocabulary files   entry checks (word, translations, repeated words)
+                       and grammar rules on the examples written in the
+                       file's language, at the profile's level
+
+One task per file goes to a ProcessPoolExecutor. Results come back in
+file order, so the report is the same for any --jobs.
+
+Grammar rules run the way RuleSet selects them (one trigger scan per
+sentence picks the candidate rules), but each candidate is then matched
+with its own regex instead of the combined pattern, so the time of every
+rule can be measured. The findings are the same (grammar_rules.py bench
+checks that one-by-one and combined agree).
+
+Results are cached (scripts/validation_cache.py): a file whose content and
+lint version are unchanged is not parsed again, and in a changed file only
+sentences that are new, edited or under changed rules are evaluated.
+--no-cache lints everything.
+
+Report (--json):
+    {
+      "ruleset": "<RULESET_VERSION>",
+      "findings": [{"file": "/data/...", "location": "sentences.Bebauungsplan[0]",
+                    "rule": "de.adjective-as-noun", "severity": "error",
+                    "message": "...", "text": "..."}, ...],
+      "files": {"/data/...": {"kind": "sentences", "items": 540, "findings": 0, "seconds": 0.01}},
+      "rules": {"de.adjective-as-noun": {"calls": 12, "hits": 0, "seconds": 0.0001}, ...}
+    }
+
+Usage:
+    python3 scripts/lint_corpus.py
+    python3 scripts/lint_corpus.py --jobs 4 --json lint-report.json
+    python3 scripts/lint_corpus.py --fail-on warning
+    python3 scripts/lint_corpus.py --no-cache
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import corpus
+from build_sentence_manifest import parse_stem
+from grammar_rules import ENGINE, RULESET_VERSION, RuleEngine
+from normalize_sentences import REQUIRED_KEYS
+from validation_cache import ValidationCache, sentence_key
+
+# Pseudo-rules for the trigger scan shared by all grammar rules of a sentence,
+# and for grammar results read from the cache
+TRIGGERS = "grammar.triggers"
+CACHED = "grammar.cached"
+
+CHECKS = {
+    # name: (severity, message)
+    "sentence.required-keys": ("error", "entry is missing required keys"),
+    "sentence.repeated": ("warning", "sentence repeated in this file"),
+    "vocabulary.word": ("error", "entry has no word"),
+    "vocabulary.translations": ("warning", "entry has no translations"),
+    "vocabulary.repeated": ("warning", "word repeated in this file"),
+}
+
+SEVERITY_RANK = {"warning": 1, "error": 2}
+
+
+def vocabulary_levels():
+    """Profile vocabulary URL -> level key of the profile that learns it."""
+    levels = {}
+    for profile_key, profile in corpus.load_profiles().items():
+        for lang in profile["learningLanguages"]:
+            levels[corpus.vocabulary_url(profile_key, lang["code"])] = corpus.level_key(lang.get("level"))
+    return levels
+
+
+# Cached file results are reused only while the rules, this script, the
+# required sentence keys and the profile levels (src/config.js) are unchanged
+LINT_VERSION = corpus.content_hash(
+    RULESET_VERSION + Path(__file__).read_text(encoding="utf-8")
+    + corpus.dump_json([list(REQUIRED_KEYS), sorted(vocabulary_levels().items())]), 12)
+
+
+class FileLinter:
+    """Runs the checks for one file and records findings and per-rule time."""
+
+    def __init__(self, url, language, level, cached=None):
+        self.url = url
+        self.language = language
+        self.rule_set = RuleEngine().rule_set(language, level)
+        self.cached = cached or {}
+        self.cache = {}
+        self.patterns = {}
+        self.findings = []
+        self.timings = {}
+
+    def clock(self, name, start, hit=False):
+        entry = self.timings.setdefault(name, [0, 0, 0.0])
+        entry[0] += 1
+        entry[1] += hit
+        entry[2] += time.perf_counter() - start
+
+    def report(self, location, name, text, severity=None, message=None):
+        if severity is None:
+            severity, message = CHECKS[name]
+        self.findings.append({
+            "file": self.url,
+            "location": location,
+            "rule": name,
+            "severity": severity,
+            "message": message,
+            "text": text
+        })
+
+    def pattern(self, i):
+        if i not in self.patterns:
+            r = self.rule_set.rules[i]
+            self.patterns[i] = re.compile(r.pattern, re.I if r.ignore_case else 0)
+        return self.patterns[i]
+
+    def grammar(self, location, sentence):
+        start = time.perf_counter()
+        key = sentence_key(self.rule_set.version, sentence)
+        cached = self.cached.get(key)
+        if cached is not None:
+            self.clock(CACHED, start, bool(cached))
+            self.cache[key] = cached
+            for name, text in cached:
+                r = self.rule_set.by_name[name]
+                self.report(location, r.name, text, r.severity, r.message)
+            return
+
+        found = self.cache[key] = []
+        for r in self.rule_set.tests:
+            start = time.perf_counter()
+            text = r.test(sentence)
+            self.clock(r.name, start, text is not None)
+            if text is not None:
+                found.append([r.name, text])
+                self.report(location, r.name, text, r.severity, r.message)
+
+        start = time.perf_counter()
+        candidates = self.rule_set.candidates(sentence)
+        self.clock(TRIGGERS, start, bool(candidates))
+        for i in candidates:
+            r = self.rule_set.rules[i]
+            start = time.perf_counter()
+            match = self.pattern(i).search(sentence)
+            self.clock(r.name, start, match is not None)
+            if match:
+                found.append([r.name, match.group(0)])
+                self.report(location, r.name, match.group(0), r.severity, r.message)
+
+    def check(self, name, location, failed, text):
+        """Record a structural check; failed is computed by the caller inside the timing."""
+        if failed:
+            self.report(location, name, text)
+
+    def lint_sentences(self, data):
+        seen = set()
+        items = 0
+        for word, entries in data["sentences"].items():
+            for position, entry in enumerate(entries):
+                items += 1
+                location = f"sentences.{word}[{position}]"
+
+                start = time.perf_counter()
+                missing = [key for key in REQUIRED_KEYS if key not in entry]
+                self.clock("sentence.required-keys", start, bool(missing))
+                self.check("sentence.required-keys", location, missing, ", ".join(missing))
+
+                sentence = entry.get("sentence")
+                if not isinstance(sentence, str):
+                    continue
+
+                start = time.perf_counter()
+                key = sentence.strip().lower()
+                repeated = key in seen
+                seen.add(key)
+                self.clock("sentence.repeated", start, repeated)
+                self.check("sentence.repeated", location, repeated, sentence)
+
+                self.grammar(location, sentence)
+        return items
+
+    def lint_vocabulary(self, data):
+        seen = set()
+        for position, entry in enumerate(data):
+            location = f"[{position}]"
+
+            start = time.perf_counter()
+            word = entry.get("word") if isinstance(entry, dict) else None
+            missing = not isinstance(word, str) or not word.strip()
+            self.clock("vocabulary.word", start, missing)
+            self.check("vocabulary.word", location, missing, str(word))
+            if missing:
+                continue
+            location = f"[{position}] {word}"
+
+            start = time.perf_counter()
+            translations = entry.get("translations")
+            untranslated = not isinstance(translations, dict) or not any(translations.values())
+            self.clock("vocabulary.translations", start, untranslated)
+            self.check("vocabulary.translations", location, untranslated, word)
+
+            start = time.perf_counter()
+            key = word.strip().lower()
+            repeated = key in seen
+            seen.add(key)
+            self.clock("vocabulary.repeated", start, repeated)
+            self.check("vocabulary.repeated", location, repeated, word)
+
+            examples = (entry.get("examples") or {}).get(self.language) or []
+            for index, example in enumerate([examples] if isinstance(examples, str) else examples):
+                if isinstance(example, str):
+                    self.grammar(f"{location} examples.{self.language}[{index}]", example)
+        return len(data)
+
+
+def lint_file(task):
+    """Lint one file (runs in a worker process); returns its partial report."""
+    path, kind, language, level, cached = task
+    start = time.perf_counter()
+    linter = FileLinter(corpus.path_to_url(path), language, level, cached)
+    data = corpus.load_json(path)
+    items = linter.lint_sentences(data) if kind == "sentences" else linter.lint_vocabulary(data)
+    return {
+        "url": linter.url,
+        "kind": kind,
+        "language": language,
+        "level": level,
+        "items": items,
+        "seconds": time.perf_counter() - start,
+        "findings": linter.findings,
+        "timings": linter.timings,
+        "cache": linter.cache
+    }
+
+
+def lint_tasks():
+    """(path, kind, language, level) for every sentence and vocabulary file."""
+    tasks = []
+    for path in corpus.iter_sentence_files():
+        language, level, _ = parse_stem(path)
+        tasks.append((path, "sentences", language, level))
+
+    levels = vocabulary_levels()
+    for path in corpus.iter_data_files():
+        if path.is_relative_to(corpus.SENTENCES_DIR):
+            continue
+        tasks.append((path, "vocabulary", path.stem.split("-")[0], levels.get(corpus.path_to_url(path))))
+    return tasks
+
+
+def run_lint(tasks, jobs, cache=None):
+    """Yield (result, cached) per file in task order, linting up to jobs files at once.
+
+    Files unchanged since the cached run are not linted; the others get the
+    cached grammar results of their rule set.
+    """
+    pending = []
+    plan = []
+    for path, kind, language, level in tasks:
+        digest = corpus.content_hash(path.read_bytes(), 16)
+        result = cache and cache.file_result(corpus.path_to_url(path), digest, LINT_VERSION)
+        if not result:
+            version = ENGINE.rule_set(language, level).version
+            pending.append((path, kind, language, level, cache.entries(version) if cache else None))
+        plan.append((digest, result))
+
+    if jobs <= 1 or len(pending) <= 1:
+        results = map(lint_file, pending)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(max_workers=jobs)
+        results = pool.map(lint_file, pending)
+    try:
+        for digest, result in plan:
+            if result:
+                yield result, True
+                continue
+            result = next(results)
+            entries = result.pop("cache")
+            if cache:
+                cache.update(entries)
+                cache.store_file(result["url"], digest, LINT_VERSION, result, entries)
+            yield result, False
+    finally:
+        if pool:
+            pool.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Lint every sentence and vocabulary file")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--json", help="write the machine-readable report to this path")
+    parser.add_argument("--top", type=int, default=10, help="slowest rules to show")
+    parser.add_argument("--fail-on", choices=("error", "warning", "never"), default="error",
+                        help="exit 1 if any finding has at least this severity")
+    parser.add_argument("--no-cache", action="store_true", help="lint every file and sentence again")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print(f"Corpus Lint (rules {RULESET_VERSION}, {args.jobs} jobs)")
+    print("=" * 70)
+
+    start = time.perf_counter()
+    cache = None if args.no_cache else ValidationCache.load()
+    tasks = lint_tasks()
+    findings = []
+    files = {}
+    rules = {}
+    reused = 0
+    print("\n📄 Files:")
+    for result, cached in run_lint(tasks, args.jobs, cache):
+        findings.extend(result["findings"])
+        severities = Counter(f["severity"] for f in result["findings"])
+        files[result["url"]] = {
+            "kind": result["kind"],
+            "language": result["language"],
+            "level": result["level"],
+            "items": result["items"],
+            "findings": len(result["findings"]),
+            "seconds": round(result["seconds"], 6),
+            "cached": cached
+        }
+        icon = "❌" if severities["error"] else ("⚠️ " if severities["warning"] else "✅")
+        timing = "cached" if cached else f"{result['seconds'] * 1000:.1f} ms"
+        print(f"   {icon} {result['url']:52} {result['items']:5} items {timing:>10}  "
+              f"{severities['error']} errors, {severities['warning']} warnings")
+        if cached:
+            reused += 1
+            continue
+        for name, (calls, hits, seconds) in result["timings"].items():
+            entry = rules.setdefault(name, {"calls": 0, "hits": 0, "seconds": 0.0})
+            entry["calls"] += calls
+            entry["hits"] += hits
+            entry["seconds"] += seconds
+
+    if cache:
+        cache.prune(files)
+        cache.save()
+    elapsed = time.perf_counter() - start
+
+    if rules:
+        print("\n⏱️  Slowest rules (total time over the files linted in this run):")
+        for name, entry in sorted(rules.items(), key=lambda item: -item[1]["seconds"])[:args.top]:
+            print(f"   {name:34} {entry['seconds'] * 1000:8.1f} ms  {entry['calls']:7} calls  {entry['hits']:5} hits")
+    if cache:
+        cached_sentences = rules.get(CACHED, {}).get("calls", 0)
+        print(f"\n💾 Cache: {reused}/{len(files)} files unchanged, "
+              f"{cached_sentences} grammar results reused in the changed files")
+
+    counts = Counter(f["rule"] for f in findings)
+    if counts:
+        print("\n📏 Findings by rule:")
+        for name, count in counts.most_common():
+            example = next(f for f in findings if f["rule"] == name)
+            print(f"   {name:34} {count:5}  e.g. {example['file'].rsplit('/', 1)[-1]} {example['location']}")
+
+    if args.json:
+        for entry in rules.values():
+            entry["seconds"] = round(entry["seconds"], 6)
+        corpus.write_json(args.json, {
+            "ruleset": RULESET_VERSION,
+            "findings": findings,
+            "files": files,
+            "rules": dict(sorted(rules.items()))
+        })
+
+    severities = Counter(f["severity"] for f in findings)
+    print("\n" + "=" * 70)
+    print(f"✅ {len(files)} files, {sum(f['items'] for f in files.values())} items in {elapsed:.2f}s: "
+          f"{severities['error']} errors, {severities['warning']} warnings")
+
+    threshold = SEVERITY_RANK.get(args.fail_on)
+    if threshold and any(SEVERITY_RANK[f["severity"]] >= threshold for f in findings):
+        print(f"❌ Findings at or above {args.fail_on}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Normalize every sentence file to one canonical schema in a single pass.
+
+Generators have written at least four entry shapes over time:
+  - "full"/"blank" pairs (de-c1, de-b2-it)
+  - "sentence"/"translation"/"translation_language" (multilingual files)
+  - nested language objects {"de": {"full", "blank", "target_word", ...},
+    "pl": {...}} or plain "de"/"en" strings with "blank_de" (de-c1-stadtsverwaltung,
+    de-b1b2, de-b2c1)
+  - plain string lists per word (phase_2b_sentences.json)
+  - a bare list of {"word", "sentence", ...} entries instead of an object
+    (generate_de_c1_kafel_deterministic.py)
+
+The canonical entry keeps only what the app reads:
+
+    {"id", "sentence", "blank", "target_word", "target_index", "translation",
+     "translation_language"?, "difficulty"?, "domain"?, "context"?, "vocabulary_used"?}
+
+Optional keys are omitted when empty. Metadata gets recounted totals, a
+real language code/name and "schema": SCHEMA_VERSION.
+
+Usage:
+    python3 scripts/normalize_sentences.py              # rewrite public/data/sentences in place
+    python3 scripts/normalize_sentences.py --check      # exit 1 if any file is not canonical
+    python3 scripts/normalize_sentences.py FILE --out DIR
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import corpus
+
+SCHEMA_VERSION = "lingxm-sentences/1"
+BLANK = "_____"
+
+ARTICLES = {
+    "der", "die", "das", "den", "dem", "des", "ein", "eine",
+    "le", "la", "les", "l'", "un", "une",
+    "il", "lo", "gli", "i", "l’",
+    "the", "a", "an", "to"
+}
+
+TOKEN_STRIP = '.,!?;:"“”„«»()[]{}\'’'
+
+# camelCase metadata keys written by some generators
+METADATA_ALIASES = {
+    "totalWords": "total_words",
+    "totalSentences": "total_sentences",
+    "generatedBy": "generator",
+    "generatedDate": "generated_date",
+}
+
+REQUIRED_KEYS = ("id", "sentence", "blank", "target_word", "target_index", "translation")
+OPTIONAL_KEYS = ("translation_language", "difficulty", "domain", "context", "vocabulary_used")
+
+
+def strip_article(word):
+    """'die Ambivalenz' -> 'Ambivalenz', 'to scrutinize' -> 'scrutinize'."""
+    parts = word.split(" ", 1)
+    if len(parts) == 2 and parts[0].lower() in ARTICLES:
+        return parts[1]
+    return word
+
+
+def clean_token(token):
+    return token.strip(TOKEN_STRIP).lower()
+
+
+def find_target_index(sentence, target_word):
+    """Index of the first token that contains the (article-less) target."""
+    target = clean_token(strip_article(target_word).split(" ")[0])
+    if not target:
+        return -1
+    for i, token in enumerate(sentence.split()):
+        if target in clean_token(token):
+            return i
+    return -1
+
+
+def make_blank(sentence, target_word, target_index):
+    """Mask the target word; returns "" when it cannot be located."""
+    for candidate in (target_word, strip_article(target_word)):
+        if candidate and candidate in sentence:
+            return sentence.replace(candidate, BLANK, 1)
+    lowered = sentence.lower()
+    for candidate in (target_word, strip_article(target_word)):
+        pos = lowered.find(candidate.lower()) if candidate else -1
+        if pos >= 0:
+            return sentence[:pos] + BLANK + sentence[pos + len(candidate):]
+
+    tokens = sentence.split()
+    if 0 <= target_index < len(tokens):
+        token = tokens[target_index]
+        core = token.strip(TOKEN_STRIP)
+        tokens[target_index] = token.replace(core, BLANK, 1) if core else BLANK
+        return " ".join(tokens)
+    return ""
+
+
+def _text(value):
+    return value.strip() if isinstance(value, str) else ""
+
+
+def _nested(entry, language):
+    """Nested per-language object such as entry["de"] = {"full": ..., "blank": ...}."""
+    value = entry.get(language)
+    return value if isinstance(value, dict) else {}
+
+
+def normalize_entry(raw, word, language, position, id_prefix, languages=()):
+    """Convert one sentence entry of any known shape into the canonical dict.
+
+    `languages` are the codes that may appear as sibling translations
+    (LANGUAGE_NAMES keys in src/config.js).
+    """
+    if isinstance(raw, str):
+        raw = {"sentence": raw}
+    if not isinstance(raw, dict):
+        return None
+
+    own = _nested(raw, language)
+    if not own and isinstance(raw.get("sentence"), dict):
+        own = raw["sentence"]
+
+    sentence = (
+        _text(raw.get("sentence"))
+        or _text(raw.get("full"))
+        or _text(raw.get("text"))
+        or _text(own.get("full"))
+        or _text(own.get("sentence"))
+        or _text(raw.get(language))
+    )
+    if not sentence:
+        return None
+
+    target_word = _text(raw.get("target_word")) or _text(own.get("target_word")) or word
+
+    target_index = raw.get("target_index", own.get("target_index"))
+    tokens = sentence.split()
+    if not isinstance(target_index, int) or not 0 <= target_index < len(tokens):
+        target_index = find_target_index(sentence, target_word)
+
+    blank = (
+        _text(raw.get("blank"))
+        or _text(own.get("blank"))
+        or _text(raw.get(f"blank_{language}"))
+    )
+    if BLANK not in blank:
+        blank = make_blank(sentence, target_word, target_index)
+
+    translation = _text(raw.get("translation"))
+    translation_language = _text(raw.get("translation_language")) or None
+    if not translation:
+        # Fall back to a sibling language version of the same sentence
+        for key, value in raw.items():
+            if key == language or key not in languages:
+                continue
+            text = _text(value.get("full")) if isinstance(value, dict) else _text(value)
+            if text:
+                translation, translation_language = text, key
+                break
+
+    entry = {
+        "id": _text(raw.get("id")) or f"{id_prefix}-{position:04d}",
+        "sentence": sentence,
+        "blank": blank,
+        "target_word": target_word,
+        "target_index": target_index,
+        "translation": translation,
+        "translation_language": translation_language,
+        "difficulty": _text(raw.get("difficulty")) or None,
+        "domain": _text(raw.get("domain")) or None,
+        "context": _text(raw.get("context")) or None,
+        "vocabulary_used": [w for w in raw.get("vocabulary_used") or [] if isinstance(w, str)] or None,
+    }
+    return {key: value for key, value in entry.items() if key in REQUIRED_KEYS or value}
+
+
+def resolve_language(metadata, path, language_names):
+    """Language code from metadata, else from the filename ('de-c1-...' -> 'de')."""
+    language = metadata.get("language")
+    if language and language != "unknown":
+        return language
+    prefix = Path(path).name.split("-", 1)[0]
+    return prefix if prefix in language_names else "unknown"
+
+
+def normalize_metadata(metadata, language, total_words, total_sentences, language_names):
+    meta = {}
+    for key, value in (metadata or {}).items():
+        key = METADATA_ALIASES.get(key, key)
+        if key not in meta:
+            meta[key] = value
+
+    meta["language"] = language
+    if not meta.get("language_name") or meta["language_name"] == "Unknown":
+        meta["language_name"] = language_names.get(language, {}).get("local", language)
+
+    meta["total_words"] = total_words
+    meta["total_sentences"] = total_sentences
+    meta["schema"] = SCHEMA_VERSION
+    return meta
+
+
+def as_document(data, path):
+    """A loaded sentence file as {"metadata", "sentences"}; bare entry lists are grouped by word."""
+    if isinstance(data, dict):
+        return data
+    if isinstance(data, list) and all(isinstance(item, dict) and isinstance(item.get("word"), str) for item in data):
+        sentences = {}
+        for item in data:
+            sentences.setdefault(item["word"], []).append(item)
+        return {"metadata": {}, "sentences": sentences}
+    raise ValueError(f"{Path(path).name}: expected an object with \"sentences\" "
+                     f"or a list of entries with a \"word\"")
+
+
+def normalize_document(data, path, language_names, language=None):
+    """Normalize a whole sentence file (metadata + sentences)."""
+    data = as_document(data, path)
+    metadata = data.get("metadata") or {}
+    language = language or resolve_language(metadata, path, language_names)
+    id_prefix = Path(path).name.removesuffix("-sentences.json").removesuffix(".json")
+
+    sentences = {}
+    position = 0
+    dropped = 0
+    for word, entries in (data.get("sentences") or {}).items():
+        if not isinstance(entries, list):
+            dropped += 1
+            continue
+        normalized = []
+        for raw in entries:
+            position += 1
+            entry = normalize_entry(raw, word, language, position, id_prefix, language_names)
+            if entry is None:
+                dropped += 1
+            else:
+                normalized.append(entry)
+        if normalized:
+            sentences[word] = normalized
+
+    total = sum(len(entries) for entries in sentences.values())
+    return {
+        "metadata": normalize_metadata(metadata, language, len(sentences), total, language_names),
+        "sentences": sentences
+    }, dropped
+
+
+def is_canonical(data):
+    """True when a loaded file already follows the canonical schema."""
+    if not isinstance(data, dict) or (data.get("metadata") or {}).get("schema") != SCHEMA_VERSION:
+        return False
+    allowed = set(REQUIRED_KEYS) | set(OPTIONAL_KEYS)
+    for entries in data.get("sentences", {}).values():
+        for entry in entries:
+            if not isinstance(entry, dict) or not set(REQUIRED_KEYS) <= entry.keys() <= allowed:
+                return False
+            if not isinstance(entry["sentence"], str):
+                return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Normalize sentence files to the canonical schema")
+    parser.add_argument("files", nargs="*", type=Path, help="sentence files (default: public/data/sentences)")
+    parser.add_argument("--out", type=Path, help="write to this directory instead of in place")
+    parser.add_argument("--check", action="store_true", help="only report files that are not canonical")
+    parser.add_argument("--compact", action="store_true", help="write compact JSON")
+    parser.add_argument("--language", help="language code when metadata and filename lack one")
+    args = parser.parse_args()
+
+    files = args.files or list(corpus.iter_sentence_files())
+    language_names = corpus.read_js_const(corpus.CONFIG_JS, "LANGUAGE_NAMES")
+
+    print("=" * 70)
+    print("Normalizing Sentence Files" + (" (check only)" if args.check else ""))
+    print("=" * 70)
+
+    pending = []
+    failed = []
+    for path in files:
+        data = corpus.load_json(path)
+        if args.check:
+            if not is_canonical(data):
+                pending.append(path)
+                print(f"   ❌ {path.name}")
+            continue
+
+        try:
+            normalized, dropped = normalize_document(data, path, language_names, args.language)
+        except ValueError as e:
+            failed.append(path)
+            print(f"   ❌ {e}")
+            continue
+        target = args.out / path.name if args.out else path
+        before = path.stat().st_size
+        after = len(corpus.write_json(target, normalized, compact=args.compact))
+        note = f", {dropped} dropped" if dropped else ""
+        print(f"   ✅ {path.name}: {normalized['metadata']['total_sentences']} sentences, "
+              f"{before / 1024:.0f} KB → {after / 1024:.0f} KB{note}")
+
+    print("=" * 70)
+    if failed:
+        print(f"❌ {len(failed)} file(s) are not sentence files")
+        sys.exit(1)
+    if args.check:
+        if pending:
+            print(f"❌ {len(pending)} file(s) need normalizing: python3 scripts/normalize_sentences.py")
+            sys.exit(1)
+        print(f"✅ All {len(files)} files are canonical")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Pack words into as few TTSMaker batches as the character limits allow.
+
+Every batch is pasted into TTSMaker, converted and downloaded by hand, so
+the number of batches is the cost of an audio run. scripts/prepare-batches.js
+fills batches in manifest order and starts a new one as soon as the next
+word does not fit, which can leave room in every batch. Here the batches of
+each language (one TTSMaker voice per language) are a bin-packing problem:
+
+    items      words, sized as they appear in the batch text ("word\\n\\n")
+    capacity   CHAR_LIMITS[lang] x SAFETY_MARGIN (as prepare-batches.js)
+    bound      ceil(total size / capacity), no packing can do better
+
+1. first-fit decreasing (longest words first, each into the first batch
+   with room)
+2. while above the bound, try to empty the lightest batch: its words go to
+   the best-fitting other batch, or replace a shorter word there, which is
+   then placed in turn
+3. for up to EXACT_ITEMS words, a branch-and-bound search over the
+   remaining batch counts proves the minimum or finds it
+
+Words are listed alphabetically within a batch, and batches are numbered
+by their first word. The outputs are those of prepare-batches.js:
+audio-raw/batches/batch-<lang>-NNN.txt (words separated by blank lines)
+and the batch-<lang>-NNN.mp3 entries of audio-raw/batch-mapping.json.
+Other languages' entries are kept.
+
+Repacking a language moves words between batches, so recordings made from
+the old batches no longer match; nothing is written unless the languages
+are named with --write.
+
+Usage:
+    python3 scripts/pack_tts_batches.py                # compare with prepare-batches.js
+    python3 scripts/pack_tts_batches.py --write de fr  # regenerate de and fr batches
+"""
+
+import argparse
+import math
+import re
+import sys
+
+import corpus
+from audio_hash import audio_filename, generate_hash
+
+MANIFEST_PATH = corpus.ROOT / "scripts" / "batch-manifest.json"
+BATCHES_DIR = corpus.ROOT / "audio-raw" / "batches"
+BATCH_MAPPING = corpus.ROOT / "audio-raw" / "batch-mapping.json"
+
+# TTSMaker character limits and safety margin (as in prepare-batches.js)
+CHAR_LIMITS = {"de": 1000, "en": 1000, "ar": 3000, "fr": 1000, "it": 3000, "pl": 3000}
+SAFETY_MARGIN = 0.9
+SEPARATOR = "\n\n"
+
+EXACT_ITEMS = 60
+EXACT_NODES = 200_000
+
+
+def word_size(word):
+    """Characters a word takes in a batch, with its separator."""
+    return len(word) + len(SEPARATOR)
+
+
+def batch_capacity(language):
+    """Size budget of a batch: the text may reach the limit, and the last word has no separator."""
+    return math.floor(CHAR_LIMITS.get(language, 1000) * SAFETY_MARGIN) + len(SEPARATOR)
+
+
+def greedy_batches(sizes, capacity):
+    """Batch count of prepare-batches.js (createSmartBatches, sizes in order)."""
+    count, load = 0, 0
+    for size in sizes:
+        if load and load + size > capacity - len(SEPARATOR):
+            count, load = count + 1, 0
+        load += size
+    return count + (1 if load else 0)
+
+
+def lower_bound(sizes, capacity):
+    """No packing uses fewer batches."""
+    return max(math.ceil(sum(sizes) / capacity), 1 if sizes else 0)
+
+
+def first_fit_decreasing(sizes, capacity):
+    """Batches (lists of item indexes), longest items first into the first batch with room."""
+    bins, loads = [], []
+    for item in sorted(range(len(sizes)), key=lambda i: -sizes[i]):
+        for b, load in enumerate(loads):
+            if load + sizes[item] <= capacity:
+                bins[b].append(item)
+                loads[b] += sizes[item]
+                break
+        else:
+            bins.append([item])
+            loads.append(sizes[item])
+    return bins
+
+
+def empty_lightest(bins, sizes, capacity):
+    """Batches without the lightest one, its items moved or swapped into the others; None if stuck."""
+    bins = sorted(([*b] for b in bins), key=lambda b: sum(sizes[i] for i in b))
+    pending = sorted(bins.pop(0), key=lambda i: -sizes[i])
+    loads = [sum(sizes[i] for i in b) for b in bins]
+
+    for _ in range(10 * len(sizes)):
+        if not pending:
+            return bins
+        item = pending.pop(0)
+        fits = [b for b in range(len(bins)) if loads[b] + sizes[item] <= capacity]
+        if fits:
+            b = min(fits, key=lambda b: capacity - loads[b] - sizes[item])
+            bins[b].append(item)
+            loads[b] += sizes[item]
+            continue
+
+        # Swap with the largest shorter item that makes room
+        swaps = [(sizes[other], b, other) for b in range(len(bins)) for other in bins[b]
+                 if sizes[other] < sizes[item] and loads[b] - sizes[other] + sizes[item] <= capacity]
+        if not swaps:
+            return None
+        _, b, other = max(swaps)
+        bins[b].remove(other)
+        bins[b].append(item)
+        loads[b] += sizes[item] - sizes[other]
+        pending.append(other)
+        pending.sort(key=lambda i: -sizes[i])
+    return None
+
+
+def exact_packing(sizes, capacity, count):
+    """(batches, complete) for at most count batches by branch and bound.
+
+    batches is None if no packing was found; complete is False if the
+    search gave up after EXACT_NODES nodes, so none may still exist.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: -sizes[i])
+    bins, loads = [], []
+    nodes = 0
+
+    def place(k):
+        nonlocal nodes
+        nodes += 1
+        if k == len(order):
+            return True
+        if nodes > EXACT_NODES or sum(sizes[i] for i in order[k:]) > count * capacity - sum(loads):
+            return False
+        item = order[k]
+        tried = set()
+        for b in range(len(bins)):
+            if loads[b] + sizes[item] <= capacity and loads[b] not in tried:
+                tried.add(loads[b])
+                bins[b].append(item)
+                loads[b] += sizes[item]
+                if place(k + 1):
+                    return True
+                bins[b].pop()
+                loads[b] -= sizes[item]
+        if len(bins) < count:
+            bins.append([item])
+            loads.append(sizes[item])
+            if place(k + 1):
+                return True
+            bins.pop()
+            loads.pop()
+        return False
+
+    found = place(0)
+    return ([list(b) for b in bins] if found else None), nodes <= EXACT_NODES
+
+
+def pack(sizes, capacity):
+    """(batches of item indexes, lower bound, proven optimal)."""
+    bound = lower_bound(sizes, capacity)
+    bins = first_fit_decreasing(sizes, capacity)
+    while len(bins) > bound:
+        fewer = empty_lightest(bins, sizes, capacity)
+        if fewer is None:
+            break
+        bins = fewer
+
+    optimal = len(bins) == bound
+    if not optimal and len(sizes) <= EXACT_ITEMS:
+        # Smallest count first: the first packing found is a minimum if every smaller count was ruled out
+        optimal = True
+        for count in range(bound, len(bins)):
+            found, complete = exact_packing(sizes, capacity, count)
+            if found is not None:
+                bins = found
+                break
+            optimal = optimal and complete
+    return bins, bound, optimal
+
+
+def language_words(data):
+    """Words of one manifest language, in manifest order."""
+    return [entry["word"] for batch in data["batches"] for entry in batch["words"]]
+
+
+def ordered_batches(words, bins):
+    """Word lists per batch, alphabetical within a batch, batches by first word."""
+    batches = [sorted((words[i] for i in b), key=str.casefold) for b in bins]
+    return sorted(batches, key=lambda batch: batch[0].casefold())
+
+
+def write_language(language, batches, mapping):
+    """Replace a language's batch text files and mapping entries."""
+    pattern = re.compile(rf"^batch-{re.escape(language)}-\d+\.txt$")
+    for path in BATCHES_DIR.glob(f"batch-{language}-*.txt"):
+        if pattern.match(path.name):
+            path.unlink()
+    for key in [key for key in mapping if key.startswith(f"batch-{language}-")]:
+        del mapping[key]
+
+    BATCHES_DIR.mkdir(parents=True, exist_ok=True)
+    for number, batch in enumerate(batches, 1):
+        name = f"batch-{language}-{number:03d}"
+        (BATCHES_DIR / f"{name}.txt").write_text(SEPARATOR.join(batch), encoding="utf-8")
+        mapping[f"{name}.mp3"] = [{"word": word, "hash": generate_hash(word), "filename": audio_filename(word, language)}
+                                  for word in batch]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack words into the fewest TTSMaker batches")
+    parser.add_argument("--write", nargs="+", metavar="LANG", default=[], help="languages to regenerate")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("TTS Batch Packing")
+    print("=" * 70)
+
+    if not MANIFEST_PATH.is_file():
+        print("❌ scripts/batch-manifest.json not found (run: node scripts/extract-vocabulary.js)")
+        sys.exit(1)
+    manifest = corpus.load_json(MANIFEST_PATH)
+    unknown = set(args.write) - set(manifest)
+    if unknown:
+        print(f"❌ Not in the manifest: {', '.join(sorted(unknown))}")
+        sys.exit(1)
+
+    mapping = corpus.load_json(BATCH_MAPPING) if BATCH_MAPPING.is_file() else {}
+    saved = 0
+    for language, data in manifest.items():
+        words = language_words(data)
+        sizes = [word_size(word) for word in words]
+        capacity = batch_capacity(language)
+        bins, bound, optimal = pack(sizes, capacity)
+        greedy = greedy_batches(sizes, capacity)
+        recorded = sum(1 for key in mapping if key.startswith(f"batch-{language}-"))
+        saved += greedy - len(bins)
+
+        icon = "✅" if optimal else "⚠️ "
+        print(f"\n{icon} {data['languageName']} ({data['voiceName']}, {CHAR_LIMITS.get(language, 1000)} chars)")
+        print(f"   {len(words)} words, {sum(sizes) - len(SEPARATOR) * bool(words)} chars, "
+              f"{capacity - len(SEPARATOR)} per batch")
+        print(f"   {len(bins)} batches packed (bound {bound}{', optimal' if optimal else ''}), "
+              f"{greedy} greedy, {recorded} in batch-mapping.json")
+        longest = max((sum(sizes[i] for i in b) - len(SEPARATOR) for b in bins), default=0)
+        print(f"   fullest batch {longest} chars")
+
+        if language in args.write:
+            write_language(language, ordered_batches(words, bins), mapping)
+            print(f"   📝 Wrote {len(bins)} batch files")
+
+    if args.write:
+        corpus.write_json(BATCH_MAPPING, mapping)
+
+    print("\n" + "=" * 70)
+    print(f"✅ {saved} batches fewer than prepare-batches.js")
+    if args.write:
+        print(f"   Updated {BATCH_MAPPING.relative_to(corpus.ROOT)} ({', '.join(args.write)}); "
+              f"record the new batches and run: npm run split-audio")
+
+
+if __name__ == "__main__":
+    main()
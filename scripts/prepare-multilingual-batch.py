@@ -7,6 +7,8 @@ Creates batches of 30 words for efficient processing.
 import json
 import os
 
+import corpus
+
 
 def load_vocabulary(file_paths):
     """Load and merge vocabulary from multiple files."""
@@ -56,7 +58,7 @@ def main():
         },
         {
             "name": "Italian A1",
-            "files": [f"{base_dir}/public/data/ameeno/it.json"],
+            "files": [str(corpus.url_to_path(corpus.vocabulary_url("ameeno", "it")))],
             "output_dir": f"{base_dir}/temp/batches/it",
             "prefix": "it-a1"
         }
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Numeric difficulty features for every sentence, computed with NumPy across
+the whole corpus at once.
+
+The `difficulty` label ("basic"/"intermediate"/"advanced") is assigned by
+position in the generators and says little about the sentence itself. The
+features here are measured:
+
+    word_count            tokens in the sentence
+    mean_word_length      average characters per token
+    rare_word_ratio       share of tokens seen at most RARE_MAX times in all
+                          sentence files of the language
+    subordinate_markers   subordinating conjunctions / relative pronouns
+    known_vocab_ratio     share of tokens that are (inflected) vocabulary
+                          words of the profiles using the file
+    difficulty_score      0..1 percentile within the language of the
+                          combined z-scores (longer, rarer, more clauses,
+                          less vocabulary = harder)
+
+All tokens of all files are flattened into parallel arrays (sentence id,
+term id, length, flags). Every per-sentence feature is then a single
+np.bincount over those arrays, with no Python loop per sentence.
+
+build_sentence_index.py stores the columns in the index artifacts, aligned
+with the index's sentence ids.
+"""
+
+import numpy as np
+
+from fill_vocabulary_used import sentence_vocabularies
+from inflections import InflectionIndex, clean_token
+
+# A token seen this many times or fewer in the language corpus is rare
+RARE_MAX = 2
+
+FEATURE_NAMES = (
+    "word_count", "mean_word_length", "rare_word_ratio",
+    "subordinate_markers", "known_vocab_ratio", "difficulty_score"
+)
+
+SUBORDINATE_MARKERS = {
+    "de": {"dass", "weil", "obwohl", "wenn", "als", "ob", "während", "nachdem", "bevor", "damit",
+           "da", "sodass", "falls", "indem", "sofern", "seitdem", "bis", "wodurch", "weshalb",
+           "welche", "welcher", "welches", "deren", "dessen"},
+    "en": {"that", "because", "although", "though", "which", "who", "whom", "whose", "when",
+           "while", "if", "since", "unless", "whereas", "whether", "until", "once"},
+    "fr": {"que", "qu", "qui", "parce", "quand", "lorsque", "si", "bien", "dont", "où",
+           "puisque", "tandis", "afin", "avant", "pendant"},
+    "it": {"che", "perché", "quando", "se", "mentre", "benché", "sebbene", "dove", "cui",
+           "poiché", "affinché", "finché", "quale"},
+    "ru": {"что", "потому", "когда", "если", "который", "которая", "которое", "которые",
+           "чтобы", "хотя", "где", "пока", "так"},
+    "ar": {"الذي", "التي", "الذين", "لأن", "عندما", "إذا", "حيث", "بينما", "أن", "كي", "لكي", "لو"},
+}
+
+# Weight of each z-scored feature in difficulty_score
+SCORE_WEIGHTS = {
+    "word_count": 1.0,
+    "mean_word_length": 1.0,
+    "rare_word_ratio": 1.0,
+    "subordinate_markers": 0.5,
+    "known_vocab_ratio": -1.0,
+}
+
+
+def _zscore(values):
+    std = values.std()
+    return (values - values.mean()) / std if std > 0 else np.zeros_like(values)
+
+
+def _percentile(values):
+    """Rank-based percentile in 0..1 (ties share the lower rank)."""
+    if len(values) < 2:
+        return np.zeros_like(values)
+    ranks = np.searchsorted(np.sort(values), values, side="left")
+    return ranks / (len(values) - 1)
+
+
+def language_features(files, language):
+    """Feature columns for all files of one language.
+
+    files: list of (sentence texts, vocabulary forms) per file
+    Returns one dict of NumPy columns per file, in the same order.
+    """
+    markers = SUBORDINATE_MARKERS.get(language, set())
+    term_ids = {}
+    sentence_ids, term_col, length_col, marker_col, vocab_col = [], [], [], [], []
+    offsets = [0]
+
+    sentence_id = 0
+    for texts, vocab_forms in files:
+        for text in texts:
+            for raw in text.split():
+                token = clean_token(raw)
+                if not token:
+                    continue
+                sentence_ids.append(sentence_id)
+                term_col.append(term_ids.setdefault(token, len(term_ids)))
+                length_col.append(len(token))
+                marker_col.append(token in markers)
+                vocab_col.append(token in vocab_forms)
+            sentence_id += 1
+        offsets.append(sentence_id)
+
+    n = sentence_id
+    sentence_ids = np.asarray(sentence_ids, dtype=np.int64)
+    terms = np.asarray(term_col, dtype=np.int64)
+
+    word_count = np.bincount(sentence_ids, minlength=n).astype(np.float64)
+    denominator = np.maximum(word_count, 1)
+    frequency = np.bincount(terms, minlength=len(term_ids))
+    rare = frequency[terms] <= RARE_MAX
+
+    columns = {
+        "word_count": word_count,
+        "mean_word_length": np.bincount(sentence_ids, weights=np.asarray(length_col, dtype=np.float64), minlength=n) / denominator,
+        "rare_word_ratio": np.bincount(sentence_ids, weights=rare.astype(np.float64), minlength=n) / denominator,
+        "subordinate_markers": np.bincount(sentence_ids, weights=np.asarray(marker_col, dtype=np.float64), minlength=n),
+        "known_vocab_ratio": np.bincount(sentence_ids, weights=np.asarray(vocab_col, dtype=np.float64), minlength=n) / denominator,
+    }
+    combined = sum(weight * _zscore(columns[name]) for name, weight in SCORE_WEIGHTS.items())
+    columns["difficulty_score"] = _percentile(combined)
+
+    return [
+        {name: columns[name][start:end] for name in FEATURE_NAMES}
+        for start, end in zip(offsets, offsets[1:])
+    ]
+
+
+def corpus_features(items):
+    """Compute features for every indexed sentence file.
+
+    items: dict of sentence file path -> (loaded data, index "sentences" list)
+    Returns dict of path -> {feature name: list of values aligned with the index}.
+    """
+    vocabularies = sentence_vocabularies()
+    by_language = {}
+    for path, (data, entries) in items.items():
+        language, vocab_paths = vocabularies.get(path, (path.name.split("-", 1)[0], []))
+        forms = set(InflectionIndex.from_files(vocab_paths, language).forms) if vocab_paths else set()
+        texts = [data["sentences"][word][position]["sentence"] for word, position in entries]
+        by_language.setdefault(language, []).append((path, texts, forms))
+
+    result = {}
+    for language, files in by_language.items():
+        columns = language_features([(texts, forms) for _, texts, forms in files], language)
+        for (path, _, _), file_columns in zip(files, columns):
+            result[path] = {
+                name: (values.astype(int).tolist() if name in ("word_count", "subordinate_markers")
+                       else np.round(values, 3).tolist())
+                for name, values in file_columns.items()
+            }
+    return result
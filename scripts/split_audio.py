@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Split the TTSMaker batch recordings into one MP3 per word, batches in
+parallel.
+
+The former serial splitter (split-audio.js, removed) handled one batch at a
+time and ran ffmpeg 2 + N times per batch: silencedetect, a second decode
+to grep the duration, and one process per word segment. Here each batch
+takes two ffmpeg runs:
+
+    decode    the batch as 16 kHz mono PCM, read into NumPy
+    extract   a single invocation of the segment muxer, cutting the stream
+              (-c:a copy) at every segment start and end, so the batch is
+              read once however many words it holds
+
+Silence detection works on the decoded samples. The RMS level of every
+10 ms frame gives an envelope in dB. A silence is a run of frames below a
+threshold that lasts at least a minimum gap; the sounds between
+silences are the words, and sounds shorter than MIN_SEGMENT are noise.
+A fixed -40 dB / 0.3 s (the former default) splits too often for fast voices
+and too rarely for breathy ones, so the mapping's word count drives a
+search instead. (threshold, gap) pairs are tried nearest the defaults
+first, and the first pair that yields exactly one segment per word wins.
+Each attempt is a few NumPy passes over the envelope, with no new ffmpeg
+run. If no pair matches, the closest count is used. --silencedetect
+restores the fixed ffmpeg detection.
+
+Batches are spread over a pool of --jobs workers. The work happens in the
+ffmpeg processes, so the workers are threads that wait on them. Results
+are reported in batch order.
+
+Inputs and outputs are the same as the former split-audio.js:
+    audio-raw/<lang>/batch-<lang>-NNN.mp3   recordings
+    audio-raw/batch-mapping.json            "batch-de-001.mp3" -> [{word, hash, filename}]
+    public/audio/<lang>/<hash>.mp3          one file per word (filename from the mapping)
+    audio-raw/split-report.json, audio-raw/errors.log
+
+Segments are matched to words in order. A batch whose segment count is
+still more than MAX_MISMATCH off is skipped, as before.
+
+Usage:
+    python3 scripts/split_audio.py
+    python3 scripts/split_audio.py --jobs 8 batch-de-003.mp3
+    python3 scripts/split_audio.py --output-dir /tmp/audio     # leave public/audio alone
+    python3 scripts/split_audio.py --silencedetect             # fixed -40dB / 0.3s
+    FFMPEG=/opt/ffmpeg/bin/ffmpeg python3 scripts/split_audio.py
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from itertools import product
+from pathlib import Path
+
+import numpy as np
+
+import corpus
+
+AUDIO_RAW_DIR = corpus.ROOT / "audio-raw"
+AUDIO_DIR = corpus.PUBLIC_DIR / "audio"
+BATCH_MAPPING = AUDIO_RAW_DIR / "batch-mapping.json"
+ERRORS_LOG = AUDIO_RAW_DIR / "errors.log"
+REPORT_PATH = AUDIO_RAW_DIR / "split-report.json"
+
+LANGUAGES = ("de", "en", "ar", "fr", "it", "pl")
+FFMPEG = os.environ.get("FFMPEG", "ffmpeg")
+
+# Silence detection defaults (as in the former split-audio.js)
+SILENCE_THRESHOLD = "-40dB"
+SILENCE_DURATION = 0.3
+MIN_SEGMENT = 0.1
+MAX_MISMATCH = 7
+
+# Envelope detection: search grid (dB, seconds) around the defaults above
+SAMPLE_RATE = 16000
+FRAME = 0.01
+THRESHOLDS = tuple(range(-60, -18, 2))
+GAPS = tuple(round(0.1 + 0.05 * i, 2) for i in range(15))
+PADDING = 0.04
+
+DURATION = re.compile(r"Duration: (\d+):(\d{2}):(\d{2}(?:\.\d+)?)")
+SILENCE_START = re.compile(r"silence_start: (-?[\d.]+)")
+SILENCE_END = re.compile(r"silence_end: (-?[\d.]+)")
+
+
+def find_batches(names=None):
+    """(path, language) of every batch recording, sorted by file name."""
+    batches = []
+    for language in LANGUAGES:
+        directory = AUDIO_RAW_DIR / language
+        if directory.is_dir():
+            batches += [(path, language) for path in directory.glob("batch-*.mp3")
+                        if not names or path.name in names]
+    return sorted(batches, key=lambda batch: batch[0].name)
+
+
+def run_ffmpeg(args):
+    """Run ffmpeg and return (stdout bytes, stderr text); raise on failure."""
+    result = subprocess.run([FFMPEG, "-hide_banner", "-nostdin", *args], capture_output=True)
+    log = result.stderr.decode("utf-8", errors="replace")
+    if result.returncode != 0:
+        lines = log.strip().splitlines()
+        raise RuntimeError(lines[-1] if lines else f"ffmpeg exited with {result.returncode}")
+    return result.stdout, log
+
+
+def detect_silence(path):
+    """(duration, silence starts, silence ends) in seconds, from one ffmpeg run."""
+    _, log = run_ffmpeg(["-i", str(path), "-af", f"silencedetect=n={SILENCE_THRESHOLD}:d={SILENCE_DURATION}",
+                         "-f", "null", "-"])
+    match = DURATION.search(log)
+    duration = int(match[1]) * 3600 + int(match[2]) * 60 + float(match[3]) if match else 0.0
+    starts = [float(value) for value in SILENCE_START.findall(log)]
+    ends = [float(value) for value in SILENCE_END.findall(log)]
+    return duration, starts, ends
+
+
+def segments_from_silence(starts, ends, duration):
+    """[(start, end)] of the sounds between silences (AudioSplitter.calculateSegments)."""
+    if not starts and not ends:
+        return [(0.0, duration)]
+
+    segments = []
+    current = 0.0
+    for i, start in enumerate(starts):
+        end = ends[i] if i < len(ends) else start + SILENCE_DURATION
+        if start > current + MIN_SEGMENT:
+            segments.append((current, start))
+        current = end
+
+    if current < duration - MIN_SEGMENT:
+        segments.append((current, duration))
+    return segments
+
+
+def decode_levels(path):
+    """(duration, level in dB of every FRAME) of a recording, from one ffmpeg run."""
+    pcm, _ = run_ffmpeg(["-i", str(path), "-map", "0:a", "-ac", "1", "-ar", str(SAMPLE_RATE), "-f", "s16le", "-"])
+    samples = np.frombuffer(pcm, dtype="<i2")
+    size = int(SAMPLE_RATE * FRAME)
+    frames = samples[:len(samples) // size * size].astype(np.float32).reshape(-1, size) / 32768
+    rms = np.sqrt(np.mean(frames * frames, axis=1))
+    return len(samples) / SAMPLE_RATE, 20 * np.log10(np.maximum(rms, 1e-10))
+
+
+def envelope_segments(levels, threshold, gap):
+    """(starts, ends) in frames of the sounds separated by silences of at least gap frames."""
+    silent = np.concatenate(([True], levels < threshold, [True]))
+    edges = np.flatnonzero(np.diff(silent.view(np.int8)))
+    starts, ends = edges[0::2], edges[1::2]
+    if not len(starts):
+        return starts, ends
+    split = starts[1:] - ends[:-1] >= gap
+    starts = np.concatenate((starts[:1], starts[1:][split]))
+    ends = np.concatenate((ends[:-1][split], ends[-1:]))
+    long = ends - starts >= round(MIN_SEGMENT / FRAME)
+    return starts[long], ends[long]
+
+
+def search_segments(duration, levels, expected):
+    """([(start, end)] in seconds, threshold, gap) whose count is closest to expected.
+
+    Pairs are tried in order of distance from the default parameters,
+    so an exact match keeps the most conventional parameters.
+    """
+    default = float(SILENCE_THRESHOLD.removesuffix("dB"))
+    pairs = sorted(product(THRESHOLDS, GAPS),
+                   key=lambda pair: abs(pair[0] - default) / 10 + abs(pair[1] - SILENCE_DURATION) / 0.1)
+    best = None
+    for threshold, gap in pairs:
+        starts, ends = envelope_segments(levels, threshold, round(gap / FRAME))
+        if best is None or abs(len(starts) - expected) < abs(len(best[0]) - expected):
+            best = starts, ends, threshold, gap
+            if len(starts) == expected:
+                break
+
+    starts, ends, threshold, gap = best
+    segments = [(max(start * FRAME - PADDING, 0.0), min(end * FRAME + PADDING, duration))
+                for start, end in zip(starts.tolist(), ends.tolist())]
+    return segments, threshold, gap
+
+
+def extract_segments(path, cuts, scratch):
+    """Write every (start, end, output path) of a batch with one ffmpeg run.
+
+    The segment muxer cuts the stream at every segment start and end; the
+    pieces between an end and the next start are silence and are dropped.
+    The pieces are written to a temporary directory under scratch and
+    moved into place.
+    """
+    times = sorted({round(t, 3) for start, end, _ in cuts for t in (start, end)} - {0.0})
+    with tempfile.TemporaryDirectory(prefix=".split-", dir=scratch) as pieces:
+        run_ffmpeg(["-y", "-i", str(path), "-map", "0:a", "-c:a", "copy", "-f", "segment",
+                    "-segment_times", ",".join(f"{t:.3f}" for t in times), "-reset_timestamps", "1",
+                    os.path.join(pieces, "%05d.mp3")])
+        for start, _, output in cuts:
+            output.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(os.path.join(pieces, f"{bisect_right(times, round(start, 3)):05d}.mp3"), output)
+
+
+def split_batch(task):
+    """Split one batch; returns its result (error set if it was skipped)."""
+    path, language, words, output_dir, silencedetect = task
+    clock = time.perf_counter()
+    result = {"batch": path.name, "language": language, "expected": len(words) if words else 0,
+              "segments": 0, "extracted": 0, "duration": 0.0, "threshold": None, "gap": None, "error": None}
+
+    try:
+        if not words:
+            raise RuntimeError("No mapping found")
+        if silencedetect:
+            duration, starts, ends = detect_silence(path)
+            segments = segments_from_silence(starts, ends, duration)
+        else:
+            duration, levels = decode_levels(path)
+            segments, result["threshold"], result["gap"] = search_segments(duration, levels, len(words))
+        result["duration"] = round(duration, 2)
+        result["segments"] = len(segments)
+
+        if abs(len(segments) - len(words)) > MAX_MISMATCH:
+            raise RuntimeError(f"Large mismatch: {len(segments)} segments vs {len(words)} words")
+
+        cuts = [(start, end, output_dir / word["filename"]) for (start, end), word in zip(segments, words)]
+        output_dir.mkdir(parents=True, exist_ok=True)
+        extract_segments(path, cuts, output_dir)
+        result["extracted"] = len(cuts)
+    except (OSError, RuntimeError) as error:
+        result["error"] = str(error)
+
+    result["seconds"] = round(time.perf_counter() - clock, 2)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Split batch recordings into per-word MP3s")
+    parser.add_argument("batches", nargs="*", help="batch file names to split (default: all)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="batches split at once")
+    parser.add_argument("--output-dir", type=Path, default=AUDIO_DIR, help="root of the <lang>/<hash>.mp3 tree")
+    parser.add_argument("--silencedetect", action="store_true", help="fixed ffmpeg silencedetect instead of the search")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print(f"Audio Splitting ({args.jobs} jobs)")
+    print("=" * 70)
+
+    if not BATCH_MAPPING.is_file():
+        print(f"❌ {BATCH_MAPPING.relative_to(corpus.ROOT)} not found (run: npm run prepare-batches)")
+        sys.exit(1)
+    mapping = corpus.load_json(BATCH_MAPPING)
+
+    batches = find_batches(set(args.batches))
+    if not batches:
+        print("❌ No batch MP3 files found (expected audio-raw/<lang>/batch-<lang>-NNN.mp3)")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    tasks = [(path, language, mapping.get(path.name), args.output_dir, args.silencedetect)
+             for path, language in batches]
+    with ThreadPoolExecutor(max_workers=max(args.jobs, 1)) as pool:
+        results = list(pool.map(split_batch, tasks))
+    elapsed = time.perf_counter() - start
+
+    for result in results:
+        if result["error"]:
+            print(f"   ❌ {result['batch']:22} {result['error']}")
+            continue
+        icon = "✅" if result["segments"] == result["expected"] else "⚠️ "
+        found = f"{result['threshold']:4}dB {result['gap']:.2f}s" if result["threshold"] is not None else ""
+        print(f"   {icon} {result['batch']:22} {result['extracted']:4}/{result['expected']:<4} words  "
+              f"{result['segments']:4} segments  {found:12} {result['duration']:7.1f}s audio  ({result['seconds']:.2f}s)")
+
+    failed = [r for r in results if r["error"]]
+    now = datetime.now(timezone.utc).isoformat()
+    ERRORS_LOG.unlink(missing_ok=True)
+    if failed:
+        ERRORS_LOG.write_text("".join(f"{now} | {r['batch']} | {r['error']}\n" for r in failed), encoding="utf-8")
+
+    statistics = {
+        "total": len(results),
+        "processed": len(results) - len(failed),
+        "failed": len(failed),
+        "filesCreated": sum(r["extracted"] for r in results),
+        "mismatched": sum(1 for r in results if not r["error"] and r["segments"] != r["expected"]),
+    }
+    corpus.write_json(REPORT_PATH, {
+        "timestamp": now,
+        "duration": f"{elapsed:.1f}s",
+        "statistics": statistics,
+        "batches": results,
+        "errors": [{"filename": r["batch"], "reason": r["error"], "timestamp": now} for r in failed],
+    })
+
+    print("\n" + "=" * 70)
+    print(f"{'✅' if not failed else '❌'} {statistics['filesCreated']} files from "
+          f"{statistics['processed']}/{statistics['total']} batches in {elapsed:.1f}s "
+          f"({statistics['mismatched']} with a segment/word mismatch)")
+    print(f"   Report: {REPORT_PATH.relative_to(corpus.ROOT)}")
+
+    if failed:
+        print(f"   Errors: {ERRORS_LOG.relative_to(corpus.ROOT)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env node
+// Profile vocabulary paths resolved through the content store
+// Matches corpus.vocabulary_url (Python) and App.vocabularyUrl (browser)
+
+import fs from 'fs';
+import path from 'path';
+import { fileURLToPath } from 'url';
+import { PROFILES } from '../src/config.js';
+
+const ROOT = path.join(path.dirname(fileURLToPath(import.meta.url)), '..');
+const STORE_INDEX_PATH = path.join(ROOT, 'public/data/store/index.json');
+
+let storeIndex = null;
+
+/**
+ * Load public/data/store/index.json once (written by scripts/content_store.py)
+ * @returns {Object} - Profile vocabulary URL -> shared store URL
+ */
+export function loadStoreIndex() {
+  if (!storeIndex) {
+    storeIndex = fs.existsSync(STORE_INDEX_PATH)
+      ? JSON.parse(fs.readFileSync(STORE_INDEX_PATH, 'utf8'))
+      : {};
+  }
+  return storeIndex;
+}
+
+/**
+ * Resolve a profile vocabulary path through the store index
+ * @param {string} filePath - Path relative to the repo root: public/data/hassan/en.json
+ * @returns {string} - Path of the file holding it: public/data/store/<hash>/en.json when stored
+ */
+export function resolveProfileFile(filePath) {
+  const stored = loadStoreIndex()['/' + path.posix.relative('public', filePath)];
+  return stored ? `public${stored}` : filePath;
+}
+
+/**
+ * Vocabulary file of every profile language in src/config.js
+ * @returns {Array<Object>} - Array of {profile, language, file, path} (path is resolved and absolute)
+ */
+export function profileVocabularyFiles() {
+  const files = [];
+  for (const [profile, config] of Object.entries(PROFILES)) {
+    for (const lang of config.learningLanguages) {
+      const file = `public/data/${profile}/${lang.code}.json`;
+      files.push({
+        profile,
+        language: lang.code,
+        file,
+        path: path.join(ROOT, resolveProfileFile(file))
+      });
+    }
+  }
+  return files;
+}
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Sweep the corpus for placeholders and error markers left by the
+generators, and write the broken entries to a requeue file.
+
+Several generation steps fall back to a marker instead of failing:
+
+    placeholder        "[GENERATE: word]" / "[GENERATE]" (build-sentence-file.py)
+    error-marker       "[ERROR] <source text>" (batch_transform_vahiko.batch_translate)
+    fallback           "Example sentence with {word}." / "Translated sentence with
+                       {word}." (fill-generated-sentences.generate_sentence)
+    empty-translation  a "translation" field, or a value of "translations",
+                       that is empty (opt-in: many vocabulary entries leave
+                       translations they do not need empty on purpose)
+
+All markers are compiled into one Aho-Corasick automaton
+(fill_vocabulary_used.AhoCorasick), so every string of every vocabulary
+and sentence file is scanned once, whatever the number of markers.
+
+The requeue file lists the broken entries per file, with the fields and
+reasons that made them broken:
+
+    {"files": {"/data/sentences/it/it-a1-sentences.json": [
+        {"word": "ciao", "position": 2, "id": "it_001_003",
+         "fields": ["sentence", "translation"], "reasons": ["placeholder"]}, ...]}}
+
+Vocabulary entries carry "index" instead of "position".
+fill-generated-sentences.py regenerates only the queued sentence entries
+and removes them from the file once they are filled.
+
+The sweep covers the sentence files and the profile vocabularies, the
+same files the app loads.
+
+Usage:
+    python3 scripts/sweep_placeholders.py
+    python3 scripts/sweep_placeholders.py --only placeholder error-marker
+    python3 scripts/sweep_placeholders.py --only placeholder error-marker fallback empty-translation
+    python3 scripts/sweep_placeholders.py --strict      # exit 1 if anything is found
+"""
+
+import argparse
+import os
+import sys
+
+import corpus
+from fill_vocabulary_used import AhoCorasick
+
+REQUEUE_PATH = corpus.ROOT / "scripts" / "requeue.json"
+
+# Lowercase marker -> reason
+MARKERS = {
+    "[generate": "placeholder",
+    "[error]": "error-marker",
+    "example sentence with ": "fallback",
+    "translated sentence with ": "fallback",
+}
+
+REASONS = ("placeholder", "error-marker", "fallback", "empty-translation")
+
+# Reasons swept unless --only says otherwise
+DEFAULT_REASONS = ("placeholder", "error-marker", "fallback")
+
+MATCHER = AhoCorasick(MARKERS)
+
+
+def iter_strings(value, field=""):
+    """Yield (field path, key, string) for every string inside value."""
+    if isinstance(value, str):
+        yield field, field.rsplit(".", 1)[-1], value
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            yield from iter_strings(item, f"{field}.{key}" if field else key)
+    elif isinstance(value, list):
+        for i, item in enumerate(value):
+            yield from iter_strings(item, f"{field}[{i}]")
+
+
+def string_reasons(field, key, text):
+    """Reasons a single string is broken."""
+    reasons = {payload for _, _, payload in MATCHER.iter_matches(text.lower())}
+    if not text.strip() and (key == "translation" or field.startswith("translations.")):
+        reasons.add("empty-translation")
+    return reasons
+
+
+def sweep_entry(entry):
+    """(broken fields, reasons) of one vocabulary or sentence entry."""
+    fields, reasons = [], set()
+    for field, key, text in iter_strings(entry):
+        found = string_reasons(field, key, text)
+        if found:
+            fields.append(field)
+            reasons |= found
+    return fields, reasons
+
+
+def iter_entries(data):
+    """Yield (location, entry) for the entries of a sentence or vocabulary file."""
+    if isinstance(data, dict) and isinstance(data.get("sentences"), dict):
+        for word, entries in data["sentences"].items():
+            for position, entry in enumerate(entries):
+                yield {"word": word, "position": position, "id": entry.get("id", "")}, entry
+    elif isinstance(data, list):
+        for index, entry in enumerate(data):
+            if isinstance(entry, dict):
+                yield {"word": entry.get("word", ""), "index": index}, entry
+
+
+def sweep_paths():
+    """Sentence files and profile vocabularies, each once."""
+    vocabularies = {corpus.url_to_path(corpus.vocabulary_url(profile_key, lang["code"]))
+                    for profile_key, profile in corpus.load_profiles().items()
+                    for lang in profile["learningLanguages"]}
+    return list(corpus.iter_sentence_files()) + sorted(path for path in vocabularies if path.is_file())
+
+
+def sweep(paths, only=DEFAULT_REASONS):
+    """{url: [requeue entry]} for every file with broken entries."""
+    queued = {}
+    for path in paths:
+        for location, entry in iter_entries(corpus.load_json(path)):
+            fields, reasons = sweep_entry(entry)
+            reasons &= set(only)
+            if reasons:
+                queued.setdefault(corpus.path_to_url(path), []).append(
+                    {**location, "fields": fields, "reasons": sorted(reasons)})
+    return queued
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find placeholders and error markers and write a requeue file")
+    parser.add_argument("--only", nargs="+", choices=REASONS, default=DEFAULT_REASONS,
+                        help="reasons to requeue (default: all but empty-translation)")
+    parser.add_argument("--output", default=REQUEUE_PATH, help="requeue file to write")
+    parser.add_argument("--strict", action="store_true", help="exit 1 if any entry is broken")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("Placeholder Sweep")
+    print("=" * 70)
+
+    paths = sweep_paths()
+    queued = sweep(paths, args.only)
+
+    totals = dict.fromkeys(args.only, 0)
+    for url, entries in queued.items():
+        counts = dict.fromkeys(args.only, 0)
+        for entry in entries:
+            for reason in entry["reasons"]:
+                counts[reason] += 1
+                totals[reason] += 1
+        detail = ", ".join(f"{reason} {n}" for reason, n in counts.items() if n)
+        print(f"   ⚠️  {url:60} {len(entries):5} entries  ({detail})")
+
+    corpus.write_json(args.output, {"reasons": list(args.only), "files": queued})
+
+    total = sum(len(entries) for entries in queued.values())
+    print("\n" + "=" * 70)
+    for reason, n in totals.items():
+        print(f"   {'✅' if not n else '⚠️ '} {reason:18} {n:5}")
+    print(f"{'✅' if not total else '⚠️ '} {len(paths)} files swept, {total} entries queued in "
+          f"{os.path.relpath(args.output, corpus.ROOT)}")
+
+    if args.strict and total:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Group sentences by template skeleton and report overused skeletons.
+
+A skeleton is a sentence with its target word masked out, lowercased and
+with whitespace collapsed:
+
+    "Le chef utilise le fouet pour préparer ce plat spécial."
+    -> "le chef utilise _____ pour préparer ce plat spécial."
+
+The article right before the blank is masked with it, so "das _____" and
+"die _____" are the same template. Each skeleton is hashed to 8 bytes
+(BLAKE2b) and counted per file in one pass over the corpus.
+
+The report lists, per file, the number of distinct skeletons, the diversity
+ratio (distinct skeletons / sentences) and the skeletons reused more than
+--max-reuse times. Those skeletons are written to the blocklist, which
+generators load through TemplateBlocklist to steer away from templates the
+corpus already has too many of:
+
+    from template_skeletons import TemplateBlocklist
+    blocklist = TemplateBlocklist.load()
+    if blocklist.allows(sentence, target):
+        blocklist.record(sentence, target)
+
+allows() also caps a skeleton at max_reuse uses per run. A generator whose
+template pool is used up falls back to the least used template that is not
+blocked (TemplateBlocklist.fallback), never to a blocked one.
+
+Usage:
+    python3 scripts/template_skeletons.py                  # report + blocklist
+    python3 scripts/template_skeletons.py --max-reuse 5
+    python3 scripts/template_skeletons.py --min-diversity 0.5   # build gate
+"""
+
+import argparse
+import hashlib
+import re
+import sys
+from collections import Counter
+
+import corpus
+
+BLOCKLIST_PATH = corpus.ROOT / "scripts/template-blocklist.json"
+
+BLANK = "_____"
+
+# A skeleton used more often than this in one file is overused
+MAX_REUSE = 3
+
+BLANK_RUN = re.compile(r"_{3,}")
+WHITESPACE = re.compile(r"\s+")
+
+ARTICLES = {
+    "der", "die", "das", "den", "dem", "des", "ein", "eine", "einen", "einem", "einer",
+    "le", "la", "les", "un", "une", "du", "des", "il", "lo", "gli", "i", "uno",
+    "a", "an", "the",
+}
+ELIDED_ARTICLE = re.compile(r"\b(?:l|d|dell|all|nell|un)['’]\s*" + BLANK)
+
+
+def mask_target(sentence, target):
+    """Replace the target word in a sentence with the blank."""
+    words = [w for w in target.split() if w.lower() not in ARTICLES] or target.split()
+    if not words:
+        return sentence
+    pattern = r"\s+".join(re.escape(w) for w in words)
+    masked, count = re.subn(r"(?<!\w)" + pattern + r"\w*", BLANK, sentence, count=1, flags=re.IGNORECASE)
+    return masked if count else sentence
+
+
+def skeleton(masked):
+    """Normalize a masked sentence into its skeleton string."""
+    text = WHITESPACE.sub(" ", BLANK_RUN.sub(BLANK, masked.lower())).strip()
+    text = ELIDED_ARTICLE.sub(BLANK, text)
+    tokens = text.split(" ")
+    result = []
+    for token in tokens:
+        if token.startswith(BLANK) and result and result[-1] in ARTICLES:
+            result.pop()
+        result.append(token)
+    return " ".join(result)
+
+
+def skeleton_hash(text):
+    """8-byte hex digest of a skeleton."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def entry_skeleton(entry):
+    """Skeleton of a sentence file entry (its blank, or the sentence with the target masked)."""
+    blank = entry.get("blank") or ""
+    if BLANK_RUN.search(blank):
+        return skeleton(blank)
+    return skeleton(mask_target(entry["sentence"], entry.get("target_word", "")))
+
+
+def file_skeletons(path):
+    """Counter of skeleton hash -> uses, and one example skeleton per hash."""
+    counts = Counter()
+    examples = {}
+    data = corpus.load_json(path)
+    for entries in data["sentences"].values():
+        for entry in entries:
+            text = entry_skeleton(entry)
+            digest = skeleton_hash(text)
+            counts[digest] += 1
+            examples.setdefault(digest, text)
+    return counts, examples
+
+
+def build_report(max_reuse=MAX_REUSE, top=5):
+    """Per-file skeleton statistics and the blocklist entries."""
+    files = {}
+    blocklist = {}
+    for path in corpus.iter_sentence_files():
+        counts, examples = file_skeletons(path)
+        total = sum(counts.values())
+        overused = [(digest, uses) for digest, uses in counts.most_common() if uses > max_reuse]
+        url = corpus.path_to_url(path)
+        files[url] = {
+            "sentences": total,
+            "skeletons": len(counts),
+            "diversity": round(len(counts) / max(total, 1), 4),
+            "overused": len(overused),
+            "sentences_in_overused": sum(uses for _, uses in overused),
+            "top": [{"skeleton": examples[d], "uses": uses} for d, uses in counts.most_common(top)]
+        }
+        for digest, uses in overused:
+            entry = blocklist.setdefault(digest, {"skeleton": examples[digest], "uses": 0, "files": []})
+            entry["uses"] += uses
+            entry["files"].append(url)
+    return files, blocklist
+
+
+class TemplateBlocklist:
+    """Overused skeletons for generators, plus a per-run reuse budget."""
+
+    def __init__(self, blocked=None, max_reuse=MAX_REUSE):
+        self.blocked = set(blocked or ())
+        self.max_reuse = max_reuse
+        self.used = Counter()
+
+    @classmethod
+    def load(cls, path=BLOCKLIST_PATH):
+        """Load the blocklist written by this script (empty if it was never built)."""
+        if not path.is_file():
+            return cls()
+        data = corpus.load_json(path)
+        return cls(data["skeletons"], data.get("max_reuse", MAX_REUSE))
+
+    def key(self, sentence, target):
+        return skeleton_hash(skeleton(mask_target(sentence, target)))
+
+    def allows(self, sentence, target):
+        """False if the skeleton is blocked or already used max_reuse times in this run."""
+        digest = self.key(sentence, target)
+        return digest not in self.blocked and self.used[digest] < self.max_reuse
+
+    def fallback(self, sentences, target):
+        """Least used of sentences whose skeleton is not blocked, for when none is allowed.
+
+        Past max_reuse the run spreads over the unblocked templates; only if
+        every one is blocked does it take the least used blocked one.
+        """
+        unblocked = [sentence for sentence in sentences if self.key(sentence, target) not in self.blocked]
+        return min(unblocked or sentences, key=lambda sentence: self.used[self.key(sentence, target)])
+
+    def record(self, sentence, target):
+        """Count one use of the sentence's skeleton."""
+        self.used[self.key(sentence, target)] += 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Template skeleton clustering and overuse report")
+    parser.add_argument("--max-reuse", type=int, default=MAX_REUSE, help="uses per file before a skeleton is overused")
+    parser.add_argument("--top", type=int, default=3, help="most used skeletons to show per file")
+    parser.add_argument("--json", help="write the per-file report to this path")
+    parser.add_argument("--min-diversity", type=float, help="exit 1 if any file's diversity is below this")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("Template Skeleton Report")
+    print("=" * 70)
+
+    files, blocklist = build_report(args.max_reuse, args.top)
+
+    failing = []
+    for url, entry in files.items():
+        low = args.min_diversity is not None and entry["diversity"] < args.min_diversity
+        if low:
+            failing.append(url)
+        print(f"\n   {'⚠️ ' if low else '✅'} {url.rsplit('/', 1)[-1]}: {entry['skeletons']} skeletons / "
+              f"{entry['sentences']} sentences (diversity {entry['diversity']:.2f}), "
+              f"{entry['overused']} overused covering {entry['sentences_in_overused']} sentences")
+        for item in entry["top"]:
+            if item["uses"] > 1:
+                print(f"      {item['uses']:4}×  {item['skeleton']}")
+
+    corpus.write_json(BLOCKLIST_PATH, {
+        "max_reuse": args.max_reuse,
+        "skeletons": sorted(blocklist),
+        "examples": {digest: entry for digest, entry in sorted(blocklist.items())}
+    })
+    if args.json:
+        corpus.write_json(args.json, files)
+
+    print("\n" + "=" * 70)
+    print(f"✅ {len(blocklist)} overused skeletons written to {BLOCKLIST_PATH.relative_to(corpus.ROOT)}")
+
+    if failing:
+        print(f"❌ {len(failing)} files below diversity {args.min_diversity}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
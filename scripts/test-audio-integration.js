@@ -15,11 +15,11 @@ import fs from 'fs';
 import path from 'path';
 import { fileURLToPath } from 'url';
 import { generateHash } from './hash.js';
+import { profileVocabularyFiles } from './store-index.js';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
 
-const DATA_DIR = path.join(__dirname, '../data');
 const AUDIO_DIR = path.join(__dirname, '../public/audio');
 const SAMPLE_SIZE = 10; // Test 10 words per language
 
@@ -35,29 +35,11 @@ class AudioIntegrationTester {
   }
 
   /**
-   * Find all vocabulary JSON files
+   * Find the vocabulary file of every profile language
+   * (shared vocabularies resolve to public/data/store/, see scripts/content_store.py)
    */
   findVocabularyFiles() {
-    const vocabFiles = [];
-    const profiles = fs.readdirSync(DATA_DIR).filter(f => {
-      const fullPath = path.join(DATA_DIR, f);
-      return fs.statSync(fullPath).isDirectory();
-    });
-
-    for (const profile of profiles) {
-      const profileDir = path.join(DATA_DIR, profile);
-      const files = fs.readdirSync(profileDir)
-        .filter(f => f.endsWith('.json') && f !== 'progress.json')
-        .map(f => ({
-          path: path.join(profileDir, f),
-          language: f.replace('.json', ''),
-          profile
-        }));
-
-      vocabFiles.push(...files);
-    }
-
-    return vocabFiles;
+    return profileVocabularyFiles().filter(vocabFile => fs.existsSync(vocabFile.path));
   }
 
   /**
@@ -195,7 +177,7 @@ class AudioIntegrationTester {
     console.log(`📚 Found ${vocabFiles.length} vocabulary files\n`);
 
     if (vocabFiles.length === 0) {
-      console.error('❌ No vocabulary files found in data/');
+      console.error('❌ No vocabulary files found in public/data/');
       process.exit(1);
     }
 
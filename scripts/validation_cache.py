@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Cache of grammar rule results per (sentence hash, rule-set version).
+
+Validators re-ran every rule over thousands of unchanged sentences on each
+run. Here a sentence is only evaluated if its text or the rules that apply
+to it changed:
+
+    key     "<RuleSet.version>:<BLAKE2b-64 of the sentence>"
+            RuleSet.version hashes only the rules of that language and
+            level, so changing an Italian rule leaves German entries valid
+    value   [[rule name, matched text], ...] (severity and message come
+            from the current rule, which the version guarantees is the same)
+
+Files linted by scripts/lint_corpus.py are also cached whole, keyed by the
+file's content hash and the lint version, so an unchanged corpus is
+hashed but not parsed.
+
+Generators use it in place of grammar_rules.check_sentence:
+
+    from validation_cache import ValidationCache
+    cache = ValidationCache.load()
+    findings = cache.check_sentence(sentence, "de", "c1", severity="error")
+    ...
+    cache.save()
+
+Usage:
+    python3 scripts/validation_cache.py          # entries and size
+    python3 scripts/validation_cache.py --clear
+"""
+
+import argparse
+import hashlib
+
+import corpus
+from grammar_rules import ENGINE
+
+CACHE_PATH = corpus.ROOT / ".validation-cache.json"
+
+# Bump when the layout of the cache file changes
+CACHE_FORMAT = 1
+
+
+def sentence_key(version, sentence):
+    """Cache key of a sentence under a rule-set version."""
+    return f"{version}:{hashlib.blake2b(sentence.encode('utf-8'), digest_size=8).hexdigest()}"
+
+
+class ValidationCache:
+    """Grammar findings per sentence and lint results per file, persisted as JSON."""
+
+    def __init__(self, sentences=None, files=None, path=CACHE_PATH):
+        self.path = path
+        self.sentences = sentences or {}
+        self.files = files or {}
+        self.used = set()
+        self.hits = 0
+        self.misses = 0
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path=CACHE_PATH):
+        """Load the cache (empty if missing, unreadable or another format)."""
+        try:
+            data = corpus.load_json(path)
+        except (OSError, ValueError):
+            return cls(path=path)
+        if data.get("format") != CACHE_FORMAT:
+            return cls(path=path)
+        return cls(data["sentences"], data["files"], path)
+
+    def check(self, sentence, language, level=None, engine=ENGINE):
+        """[(rule, matched text)] like RuleEngine.check, evaluated only on a cache miss."""
+        rule_set = engine.rule_set(language, level)
+        key = sentence_key(rule_set.version, sentence)
+        self.used.add(key)
+        cached = self.sentences.get(key)
+        if cached is not None:
+            self.hits += 1
+            return [(rule_set.by_name[name], text) for name, text in cached]
+        self.misses += 1
+        found = rule_set.check(sentence)
+        self.sentences[key] = [[r.name, text] for r, text in found]
+        self.dirty = True
+        return found
+
+    def check_sentence(self, sentence, language, level=None, severity=None):
+        """Cached grammar_rules.check_sentence."""
+        return [(r, text) for r, text in self.check(sentence, language, level)
+                if severity is None or r.severity == severity]
+
+    def entries(self, version):
+        """Sentence entries of one rule-set version (to hand to a worker process)."""
+        prefix = f"{version}:"
+        return {key: value for key, value in self.sentences.items() if key.startswith(prefix)}
+
+    def update(self, entries):
+        """Merge entries computed elsewhere and mark them used."""
+        self.used.update(entries)
+        for key, value in entries.items():
+            if self.sentences.get(key) != value:
+                self.sentences[key] = value
+                self.dirty = True
+
+    def file_result(self, url, digest, version):
+        """Cached lint result of a file, or None if its content or the lint changed."""
+        entry = self.files.get(url)
+        if entry and entry["hash"] == digest and entry["version"] == version:
+            self.used.update(entry["keys"])
+            return entry["result"]
+        return None
+
+    def store_file(self, url, digest, version, result, keys):
+        """Cache a file's lint result; keys are its sentence entries, kept alive while it is cached."""
+        self.files[url] = {"hash": digest, "version": version, "result": result, "keys": sorted(keys)}
+        self.dirty = True
+
+    def prune(self, urls):
+        """Keep only the sentences used in this run and the given files (after a full run)."""
+        stale = set(self.sentences) - self.used
+        for key in stale:
+            del self.sentences[key]
+        for url in set(self.files) - set(urls):
+            del self.files[url]
+            stale.add(url)
+        self.dirty = self.dirty or bool(stale)
+        return len(stale)
+
+    def save(self):
+        """Write the cache if anything changed."""
+        if self.dirty:
+            corpus.write_json(self.path, {"format": CACHE_FORMAT, "sentences": self.sentences, "files": self.files},
+                              compact=True)
+            self.dirty = False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Grammar validation cache")
+    parser.add_argument("--clear", action="store_true", help="delete the cache file")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("Validation Cache")
+    print("=" * 70)
+
+    if args.clear:
+        CACHE_PATH.unlink(missing_ok=True)
+        print(f"✅ Removed {CACHE_PATH.relative_to(corpus.ROOT)}")
+        return
+
+    if not CACHE_PATH.is_file():
+        print(f"   ⚠️  No cache at {CACHE_PATH.relative_to(corpus.ROOT)}")
+        return
+    cache = ValidationCache.load()
+    versions = {key.split(":", 1)[0] for key in cache.sentences}
+    print(f"   {len(cache.sentences)} sentences under {len(versions)} rule-set versions")
+    print(f"   {len(cache.files)} files")
+    print("=" * 70)
+    print(f"✅ {CACHE_PATH.relative_to(corpus.ROOT)} ({CACHE_PATH.stat().st_size / 1024:.0f} KB)")
+
+
+if __name__ == "__main__":
+    main()
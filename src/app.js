@@ -29,6 +29,7 @@ class LingXMApp {
     this.currentLanguageIndex = 0;
     this.currentWordIndex = 0;
     this.wordData = {};
+    this.storeIndex = null; // Profile vocabulary URL -> shared store URL (scripts/content_store.py)
     this.savedWords = this.loadSavedWords();
     this.progressTracker = null;
     this.achievementManager = null;
@@ -418,6 +419,7 @@ class LingXMApp {
 
     this.currentProfile = PROFILES[profileKey];
     this.profileKey = profileKey;
+    this.speechManager.audioManager.setProfile(profileKey);
     this.progressTracker = new ProgressTracker(profileKey);
     this.achievementManager = new AchievementManager(profileKey);
 
@@ -477,9 +479,20 @@ class LingXMApp {
   async loadWordData() {
     console.log('[VOCAB] Starting vocabulary load for profile:', this.profileKey);
     this.wordData = {};
+    await this.loadStoreIndex();
+
+    // Prefer the prebuilt profile bundle (scripts/build_profile_bundles.py)
+    const bundleFiles = await this.loadProfileBundle();
 
     for (const lang of this.currentProfile.learningLanguages) {
-      const path = `/data/${this.profileKey}/${lang.code}.json`;
+      const path = this.vocabularyUrl(lang.code);
+
+      if (bundleFiles[path]) {
+        this.wordData[lang.code] = bundleFiles[path];
+        console.log(`[VOCAB] ✓ Loaded ${this.wordData[lang.code].length} words for ${lang.code} (bundle)`);
+        continue;
+      }
+
       console.log(`[VOCAB] Fetching: ${path}`);
 
       try {
@@ -500,9 +513,74 @@ class LingXMApp {
       }
     }
 
+    // Precomputed word-bank distractors (scripts/build_distractor_tables.py)
+    await Promise.all(this.currentProfile.learningLanguages.map(lang =>
+      sentenceManager.loadDistractorTable(this.vocabularyUrl(lang.code))
+    ));
+
     console.log('[VOCAB] Total languages loaded:', Object.keys(this.wordData));
   }
 
+  /**
+   * Load the content store index once. Vocabularies shared by several
+   * profiles are published once under /data/store/ (scripts/content_store.py).
+   */
+  async loadStoreIndex() {
+    if (this.storeIndex) {
+      return;
+    }
+    try {
+      const response = await fetch('/data/store/index.json');
+      this.storeIndex = response.ok ? await response.json() : {};
+    } catch (error) {
+      console.warn('[VOCAB] Store index unavailable, using profile paths:', error);
+      this.storeIndex = {};
+    }
+  }
+
+  /**
+   * Vocabulary URL of a profile language (corpus.vocabulary_url)
+   * @param {string} languageCode - Language code (e.g. 'de-gastro')
+   * @returns {string} - Shared store URL, or the profile's own path
+   */
+  vocabularyUrl(languageCode) {
+    const path = `/data/${this.profileKey}/${languageCode}.json`;
+    return (this.storeIndex && this.storeIndex[path]) || path;
+  }
+
+  /**
+   * Load the content bundle for the current profile, if one was built.
+   * Sentence files in the bundle are handed to sentenceManager so they are
+   * not fetched again.
+   * @returns {Object} - Map of data URL -> parsed JSON (empty if no bundle)
+   */
+  async loadProfileBundle() {
+    try {
+      const indexResponse = await fetch('/data/bundles/index.json');
+      if (!indexResponse.ok) {
+        return {};
+      }
+
+      const entry = (await indexResponse.json())[this.profileKey];
+      if (!entry) {
+        return {};
+      }
+
+      const response = await fetch(entry.file);
+      if (!response.ok) {
+        throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+      }
+
+      const bundle = await response.json();
+      sentenceManager.registerPreloadedFiles(bundle.files);
+      console.log(`[VOCAB] ✓ Loaded bundle ${entry.file} (${Object.keys(bundle.files).length} files)`);
+      return bundle.files;
+    } catch (error) {
+      console.warn('[VOCAB] Bundle unavailable, loading files individually:', error);
+      return {};
+    }
+  }
+
   createPlaceholderData(lang) {
     const words = [];
     for (let i = 0; i < lang.dailyWords; i++) {
@@ -3343,6 +3421,8 @@ class LingXMApp {
     // ============================================================
     // EXTRACT SENTENCE TEXT SAFELY
     // ============================================================
+    // Canonical files have `sentence` (scripts/normalize_sentences.py); older
+    // generators still write `full`/`text` until they are updated
     const fullSentenceText = sentence.sentence || sentence.full || sentence.text || '';
 
     // Safety check: Ensure we have text
@@ -3397,7 +3477,11 @@ class LingXMApp {
 
     // Generate word bank (1 correct + 3 distractors)
     const allWords = this.wordData[session.language]?.map(w => w.word || w) || [];
-    const wordBank = sentenceManager.generateWordBank(sentence, allWords);
+    const wordBank = sentenceManager.generateWordBank(
+      sentence,
+      allWords,
+      this.vocabularyUrl(session.language)
+    );
 
     // Safety check: Ensure we have word bank
     if (!wordBank || wordBank.length === 0) {
@@ -3557,7 +3641,7 @@ class LingXMApp {
       feedbackContent.classList.remove('success');
     }
 
-    feedbackSentence.textContent = sentence.full;
+    feedbackSentence.textContent = sentence.sentence;
 
     // Update live stats
     document.getElementById('sentence-correct-live').textContent = session.correctCount;
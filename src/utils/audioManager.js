@@ -2,8 +2,10 @@
  * Audio Manager - Hybrid Audio System
  *
  * Manages audio playback with intelligent fallback:
- * 1. Try to load pre-recorded MP3 files (high quality)
- * 2. Fall back to Web Speech API if file unavailable
+ * 1. Play the word from its daily audio sprite (one MP3 per block of daily words)
+ * 2. Try to load the word's own pre-recorded MP3 file (words no sprite covers;
+ *    covered clips are left out of the build)
+ * 3. Fall back to Web Speech API if file unavailable
  *
  * Features:
  * - Hash-based file lookup
@@ -17,7 +19,15 @@ export class AudioManager {
     this.speechManager = speechManager;
     this.audioCache = new Map(); // Cache loaded audio elements
     this.failedHashes = new Set(); // Track files that don't exist
+    this.audioIndexes = new Map(); // Language -> Promise of words with audio (scripts/build_audio_index.py)
     this.AUDIO_BASE_PATH = '/audio'; // Base path for audio files
+    this.AUDIO_INDEX_PATH = '/data/audio'; // Per-language audio indexes
+
+    // Audio sprites (scripts/build_audio_sprites.py)
+    this.profileKey = null;
+    this.spriteIndexes = new Map(); // Profile -> Promise of sprite index
+    this.spriteBuffers = new Map(); // Sprite URL -> Promise of decoded AudioBuffer
+    this.contextResume = null; // Pending AudioContext.resume() started in a tap
 
     // Preload popular words on idle
     this.preloadQueue = [];
@@ -136,6 +146,175 @@ export class AudioManager {
     return `${this.AUDIO_BASE_PATH}/${normalizedLang}/${hash}.mp3`;
   }
 
+  /**
+   * Load the audio index for a language once
+   * @param {string} language - Base language code
+   * @returns {Promise<Set<string>|null>} Normalized words that have audio, or null if there is no index
+   */
+  loadAudioIndex(language) {
+    if (!this.audioIndexes.has(language)) {
+      this.audioIndexes.set(language, (async () => {
+        try {
+          const response = await fetch(`${this.AUDIO_INDEX_PATH}/${language}.json`);
+          if (!response.ok) {
+            return null;
+          }
+          const index = await response.json();
+          return new Set(index.available);
+        } catch (error) {
+          console.debug(`[Audio] No audio index for ${language}, probing files directly`);
+          return null;
+        }
+      })());
+    }
+    return this.audioIndexes.get(language);
+  }
+
+  /**
+   * Set the profile whose audio sprites are used
+   * @param {string} profileKey - Profile key (e.g. 'salman')
+   */
+  setProfile(profileKey) {
+    this.profileKey = profileKey;
+  }
+
+  /**
+   * Load the sprite index of the current profile once
+   * @returns {Promise<Object|null>} Sprite index, or null if there is none
+   */
+  loadSpriteIndex() {
+    const profileKey = this.profileKey;
+    if (!profileKey) {
+      return Promise.resolve(null);
+    }
+
+    if (!this.spriteIndexes.has(profileKey)) {
+      this.spriteIndexes.set(profileKey, (async () => {
+        try {
+          const response = await fetch(`${this.AUDIO_INDEX_PATH}/sprites/${profileKey}.json`);
+          if (!response.ok) {
+            return null;
+          }
+          return await response.json();
+        } catch (error) {
+          console.debug(`[Audio] No sprite index for ${profileKey}, using single files`);
+          return null;
+        }
+      })());
+    }
+    return this.spriteIndexes.get(profileKey);
+  }
+
+  /**
+   * Find a word in the current profile's sprites
+   * @param {string} word - Word to look up
+   * @param {string} language - Profile language code (e.g. 'de-gastro')
+   * @returns {Promise<{url: string, offset: number, duration: number}|null>} Sprite placement
+   */
+  async findSpriteEntry(word, language) {
+    const index = await this.loadSpriteIndex();
+    const entry = index?.languages?.[language];
+    const placement = entry?.words?.[word.toLowerCase().trim()];
+    if (!placement) {
+      return null;
+    }
+
+    const [sprite, offset, duration] = placement;
+    return { url: entry.sprites[sprite], offset, duration };
+  }
+
+  /**
+   * Get (or create) the AudioContext sprites are decoded and played with
+   * @returns {AudioContext|null} Audio context, or null if Web Audio is unavailable
+   */
+  getAudioContext() {
+    const AudioContext = window.AudioContext || window.webkitAudioContext;
+    if (!this.audioContext && AudioContext) {
+      this.audioContext = new AudioContext();
+    }
+    return this.audioContext || null;
+  }
+
+  /**
+   * Create or resume the AudioContext from inside a tap handler
+   * Browsers (iOS Safari in particular) only let a context start during the
+   * user gesture itself, so this must run before the handler's first await
+   * @returns {Promise<void>} Settles once the context is running (or failed to)
+   */
+  resumeAudioContext() {
+    const context = this.getAudioContext();
+    if (context && context.state === 'suspended') {
+      this.contextResume = context.resume().catch((error) => {
+        console.debug('[Audio] AudioContext resume failed:', error);
+      });
+    }
+    return this.contextResume || Promise.resolve();
+  }
+
+  /**
+   * Fetch and decode a sprite once
+   * @param {string} url - Sprite URL
+   * @returns {Promise<AudioBuffer|null>} Decoded sprite, or null if it failed
+   */
+  loadSprite(url) {
+    if (!this.spriteBuffers.has(url)) {
+      this.spriteBuffers.set(url, (async () => {
+        try {
+          const context = this.getAudioContext();
+          if (!context) {
+            return null;
+          }
+          const response = await fetch(url);
+          if (!response.ok) {
+            throw new Error(`HTTP ${response.status}`);
+          }
+          const data = await response.arrayBuffer();
+          return await new Promise((resolve, reject) => context.decodeAudioData(data, resolve, reject));
+        } catch (error) {
+          console.debug(`[Audio] Sprite ${url} failed to load, using single files`);
+          this.spriteBuffers.delete(url);
+          return null;
+        }
+      })());
+    }
+    return this.spriteBuffers.get(url);
+  }
+
+  /**
+   * Play a word from its audio sprite
+   * @param {string} word - Word to play
+   * @param {string} language - Profile language code
+   * @param {HTMLElement} buttonElement - Speaker button element
+   * @returns {Promise<boolean>} True if the word was played from a sprite
+   */
+  async playFromSprite(word, language, buttonElement) {
+    const placement = await this.findSpriteEntry(word, language);
+    if (!placement) {
+      return false;
+    }
+
+    const buffer = await this.loadSprite(placement.url);
+    if (!buffer) {
+      return false;
+    }
+
+    // Resumed by playWithFallback while still inside the tap
+    const context = this.getAudioContext();
+    await this.contextResume;
+
+    const source = context.createBufferSource();
+    source.buffer = buffer;
+    source.connect(context.destination);
+
+    buttonElement.classList.add('speaking');
+    await new Promise((resolve) => {
+      source.addEventListener('ended', resolve, { once: true });
+      source.start(0, placement.offset, placement.duration);
+    });
+    buttonElement.classList.remove('speaking');
+    return true;
+  }
+
   /**
    * Load audio file from cache or fetch it
    * @param {string} word - Word to load
@@ -157,6 +336,14 @@ export class AudioManager {
       return this.audioCache.get(cacheKey);
     }
 
+    // Skip the request when the index says there is no file for this word.
+    // Checked by word: a word sharing its hash with the file's owner must not play it.
+    const available = await this.loadAudioIndex(normalizedLang);
+    if (available && !available.has(word.toLowerCase().trim())) {
+      this.failedHashes.add(cacheKey);
+      return null;
+    }
+
     // Try to load the audio file
     const audioPath = this.getAudioPath(word, language);
 
@@ -201,6 +388,10 @@ export class AudioManager {
     buttonElement.classList.add('loading');
     buttonElement.disabled = true;
 
+    // Start the AudioContext now, synchronously in the user gesture: by the
+    // time the sprite index and sprite are fetched the gesture has expired
+    this.resumeAudioContext();
+
     try {
       // Detect if this is a sentence (long text with spaces) vs a single word
       const isSentence = text.length > 50 || (text.includes(' ') && text.split(' ').length > 3);
@@ -212,7 +403,13 @@ export class AudioManager {
         return false; // Used TTS
       }
 
-      // For short text (single words or short phrases), try pre-recorded audio
+      // For short text (single words or short phrases), try the day's sprite first
+      if (await this.playFromSprite(text, language, buttonElement)) {
+        console.debug(`[Audio] Played sprite audio for: "${text}"`);
+        return true;
+      }
+
+      // Then the word's own pre-recorded audio
       const audio = await this.loadAudio(text, language);
 
       if (audio) {
@@ -314,7 +511,11 @@ export class AudioManager {
       const { word, language } = this.preloadQueue.shift();
 
       try {
-        await this.loadAudio(word, language);
+        // Words in a sprite preload the whole sprite (once), others their own file
+        const placement = await this.findSpriteEntry(word, language);
+        if (!placement || !(await this.loadSprite(placement.url))) {
+          await this.loadAudio(word, language);
+        }
       } catch (error) {
         // Silently fail preloading
         console.debug(`Preload failed for ${word} (${language})`);
@@ -336,6 +537,7 @@ export class AudioManager {
    */
   clearCache() {
     this.audioCache.clear();
+    this.spriteBuffers.clear();
     console.log('Audio cache cleared');
   }
 
@@ -346,6 +548,7 @@ export class AudioManager {
   getCacheStats() {
     return {
       cachedFiles: this.audioCache.size,
+      cachedSprites: this.spriteBuffers.size,
       failedFiles: this.failedHashes.size,
       totalAttempts: this.audioCache.size + this.failedHashes.size
     };
@@ -28,6 +28,9 @@ const SENTENCE_FILE_MAP = {
   'it-a1': '/data/sentences/it/it-a1-sentences.json'
 };
 
+// Available files and resolved cache keys (scripts/build_sentence_manifest.py)
+const SENTENCE_MANIFEST_PATH = '/data/manifest/sentences.json';
+
 /**
  * SentenceManager - Handles sentence loading and i+1 selection
  * Completely independent from vocabulary system
@@ -36,6 +39,155 @@ class SentenceManager {
   constructor() {
     this.sentenceCache = {}; // Cache loaded sentences per language
     this.loadedLanguages = new Set();
+    this.preloadedFiles = {}; // Data URL -> parsed JSON from a profile bundle
+    this.sentenceIndex = {}; // Cache key -> token index (scripts/build_sentence_index.py)
+    this.distractorTables = {}; // Vocabulary URL -> distractor table (scripts/build_distractor_tables.py)
+    this.sentenceManifest = null; // Promise of the file manifest (scripts/build_sentence_manifest.py)
+  }
+
+  /**
+   * Load the sentence file manifest once
+   * @returns {Promise<Object|null>} - Manifest or null if it was not built
+   */
+  loadSentenceManifest() {
+    if (!this.sentenceManifest) {
+      this.sentenceManifest = (async () => {
+        try {
+          const response = await fetch(SENTENCE_MANIFEST_PATH);
+          if (!response.ok) {
+            return null;
+          }
+          const manifest = await response.json();
+          console.log(`[SENTENCES] ✅ Loaded sentence manifest (${Object.keys(manifest.files).length} files)`);
+          return manifest;
+        } catch (error) {
+          console.warn(`[SENTENCES] No sentence manifest at ${SENTENCE_MANIFEST_PATH}`);
+          return null;
+        }
+      })();
+    }
+    return this.sentenceManifest;
+  }
+
+  /**
+   * Resolve the sentence file for a cache key from the manifest
+   * @param {Object} manifest - Sentence file manifest
+   * @param {string} language - Language code
+   * @param {string} cacheKey - "<language>-<level>" or "<language>"
+   * @returns {string|null} - Data URL or null if the language has no sentences
+   */
+  resolveFromManifest(manifest, language, cacheKey) {
+    return manifest.resolve[cacheKey] || manifest.resolve[language] || null;
+  }
+
+  /**
+   * Register files that were already loaded (e.g. from a profile bundle)
+   * @param {Object} files - Map of data URL -> parsed JSON
+   */
+  registerPreloadedFiles(files) {
+    Object.assign(this.preloadedFiles, files || {});
+  }
+
+  /**
+   * Fetch a sentence file, serving preloaded bundle files without a request
+   * @param {string} path - Data URL
+   * @returns {Promise<Response|Object>} - Response (or response-like object)
+   */
+  async fetchSentenceFile(path) {
+    const preloaded = this.preloadedFiles[path];
+    if (preloaded) {
+      return { ok: true, json: async () => preloaded };
+    }
+    return fetch(path);
+  }
+
+  /**
+   * Load the precomputed token index for a sentence file
+   * @param {string} path - Data URL of the sentence file
+   * @param {Object} data - The loaded sentence file
+   * @returns {Object|null} - Index or null if missing/out of date
+   */
+  async loadSentenceIndex(path, data) {
+    const indexPath = path.replace('/data/sentences/', '/data/index/');
+    try {
+      const response = await fetch(indexPath);
+      if (!response.ok) {
+        return null;
+      }
+      const index = await response.json();
+
+      // The index addresses sentences by (word, position); reject it unless it was built from this file
+      const entries = Object.values(data.sentences)
+        .reduce((count, list) => count + (Array.isArray(list) ? list.length : 0), 0);
+      const valid = index.source === path && index.entries === entries &&
+        await this.indexFingerprint(data, index) === index.fingerprint;
+      if (!valid) {
+        console.warn(`[SENTENCES] Token index out of date: ${indexPath}`);
+        return null;
+      }
+
+      index.termIds = new Map(index.terms.map((term, id) => [term, id]));
+      console.log(`[SENTENCES] ✅ Loaded token index (${index.terms.length} terms)`);
+      return index;
+    } catch (error) {
+      console.warn(`[SENTENCES] No token index at ${indexPath}`);
+      return null;
+    }
+  }
+
+  /**
+   * Fingerprint of the indexed sentences (build_sentence_index.fingerprint)
+   * @param {Object} data - The loaded sentence file
+   * @param {Object} index - Token index for that file
+   * @returns {Promise<string|null>} - 12-character hex hash, or null if a sentence is missing
+   */
+  async indexFingerprint(data, index) {
+    const rows = [];
+    for (const [word, position] of index.sentences) {
+      const sentence = data.sentences[word]?.[position];
+      if (!sentence) {
+        return null;
+      }
+      const vocabulary = Array.isArray(sentence.vocabulary_used) ? sentence.vocabulary_used : [];
+      const words = vocabulary.filter(w => typeof w === 'string').join(' ');
+      rows.push(`${word}\t${position}\t${sentence.sentence || ''}\t${words}\n`);
+    }
+
+    const digest = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(rows.join('')));
+    return Array.from(new Uint8Array(digest), byte => byte.toString(16).padStart(2, '0')).join('').slice(0, 12);
+  }
+
+  /**
+   * Score every indexed sentence against the mastered words
+   * Counts known terms per sentence by walking posting lists (integer lookups only)
+   * @param {Object} data - The loaded sentence file
+   * @param {Object} index - Token index for that file
+   * @param {Set<string>} masteredSet - Lowercased mastered words
+   * @returns {Array} - Sentences with known_percentage and difficulty features
+   */
+  scoreWithIndex(data, index, masteredSet) {
+    const known = new Uint32Array(index.sentences.length);
+    masteredSet.forEach(word => {
+      const termId = index.termIds.get(word);
+      if (termId === undefined) return;
+      for (const sentenceId of index.postings[termId]) {
+        known[sentenceId]++;
+      }
+    });
+
+    const featureColumns = Object.entries(index.features || {});
+
+    return index.sentences.map(([word, position], sentenceId) => {
+      const sentence = data.sentences[word][position];
+      return {
+        ...sentence,
+        known_percentage: (known[sentenceId] / index.lengths[sentenceId]) * 100,
+        word_source: word,
+        vocabulary_used: sentence.vocabulary_used || index.ids[sentenceId].map(id => index.terms[id]),
+        // Precomputed difficulty features (word_count, rare_word_ratio, difficulty_score, ...)
+        features: Object.fromEntries(featureColumns.map(([name, values]) => [name, values[sentenceId]]))
+      };
+    });
   }
 
   /**
@@ -58,16 +210,37 @@ class SentenceManager {
 
     try {
       let response = null;
+      let loadedPath = null;
+
+      // ============================================================
+      // PRIORITY 0: RESOLVE FROM THE BUILD MANIFEST (NO FAILED FETCHES)
+      // ============================================================
+      const manifest = await this.loadSentenceManifest();
+      if (manifest) {
+        const resolvedPath = this.resolveFromManifest(manifest, language, cacheKey);
+        if (!resolvedPath) {
+          console.warn(`[SENTENCES] No sentences in manifest for ${cacheKey}`);
+          return null;
+        }
+        console.log(`[SENTENCES] Using manifest path: ${resolvedPath}`);
+        response = await this.fetchSentenceFile(resolvedPath);
+        if (response.ok) {
+          loadedPath = resolvedPath;
+        } else {
+          console.warn(`[SENTENCES] Manifest path failed: ${resolvedPath}`);
+        }
+      }
 
       // ============================================================
       // PRIORITY 1: USE EXACT FILE MAP IF AVAILABLE
       // ============================================================
-      if (userLevel && SENTENCE_FILE_MAP[cacheKey]) {
+      if ((!response || !response.ok) && userLevel && SENTENCE_FILE_MAP[cacheKey]) {
         const exactPath = SENTENCE_FILE_MAP[cacheKey];
         console.log(`[SENTENCES] Using mapped path: ${exactPath}`);
-        response = await fetch(exactPath);
+        response = await this.fetchSentenceFile(exactPath);
 
         if (response.ok) {
+          loadedPath = exactPath;
           console.log(`[SENTENCES] ✅ Found sentences at: ${exactPath}`);
         } else {
           console.warn(`[SENTENCES] Mapped path failed: ${exactPath}`);
@@ -96,8 +269,9 @@ class SentenceManager {
         );
 
         for (const pattern of patterns) {
-          response = await fetch(pattern);
+          response = await this.fetchSentenceFile(pattern);
           if (response.ok) {
+            loadedPath = pattern;
             console.log(`[SENTENCES] Found sentences at: ${pattern}`);
             break;
           }
@@ -123,6 +297,7 @@ class SentenceManager {
       // Cache the data with level-specific key
       this.sentenceCache[cacheKey] = data;
       this.loadedLanguages.add(cacheKey);
+      this.sentenceIndex[cacheKey] = await this.loadSentenceIndex(loadedPath, data);
 
       console.log(`[SENTENCES] ✅ Loaded ${data.metadata.total_sentences} sentences for ${cacheKey}`);
       if (data.metadata.source_profile && data.metadata.source_level) {
@@ -207,6 +382,14 @@ class SentenceManager {
 
     console.log(`[SENTENCES] Processing sentences with ${masteredWords.length} mastered words`);
 
+    // Fast path: precomputed token index
+    const index = this.sentenceIndex[userLevel ? `${language}-${userLevel}` : language];
+    if (index) {
+      const scored = this.scoreWithIndex(data, index, masteredSet);
+      console.log(`[SENTENCES] Scored ${scored.length} sentences from token index`);
+      return this.shuffle(scored).slice(0, limit);
+    }
+
     // ============================================================
     // BUILD RESULTS WITH SAFE PROCESSING
     // ============================================================
@@ -228,7 +411,8 @@ class SentenceManager {
           return; // Skip invalid sentences
         }
 
-        // Get sentence text with fallbacks
+        // Canonical files have `sentence` (scripts/normalize_sentences.py); older
+        // generators still write `full`/`text` until they are updated
         const sentenceText = sentence.sentence || sentence.full || sentence.text || '';
 
         // SAFETY: Ensure we have valid text
@@ -300,13 +484,31 @@ class SentenceManager {
     return final;
   }
 
+  /**
+   * Load the precomputed distractor table for a vocabulary file
+   * @param {string} vocabularyPath - Data URL of the vocabulary file (/data/<profile>/<code>.json)
+   */
+  async loadDistractorTable(vocabularyPath) {
+    if (vocabularyPath in this.distractorTables) {
+      return;
+    }
+    const tablePath = vocabularyPath.replace('/data/', '/data/distractors/');
+    try {
+      const response = await fetch(tablePath);
+      this.distractorTables[vocabularyPath] = response.ok ? await response.json() : null;
+    } catch (error) {
+      this.distractorTables[vocabularyPath] = null;
+    }
+  }
+
   /**
    * Generate word bank: 1 correct answer + 3 distractors
    * @param {Object} sentence - Sentence object with target_word
    * @param {Array<string>} allWords - All available words for distractors
+   * @param {string} vocabularyPath - Vocabulary URL, selects a precomputed distractor table
    * @returns {Array<string>} - Shuffled array of 4 words
    */
-  generateWordBank(sentence, allWords) {
+  generateWordBank(sentence, allWords, vocabularyPath = null) {
     console.log('[SENTENCES] Generating word bank for:', sentence.target_word);
 
     // SAFETY CHECK: Validate sentence
@@ -333,8 +535,10 @@ class SentenceManager {
       return [targetWord]; // Return at least the correct word
     }
 
-    // Select 3 distractors
-    const distractors = this.selectDistractors(targetWord, validWords, 3);
+    // Select 3 distractors (precomputed table first)
+    const table = this.distractorTables[vocabularyPath];
+    const distractors = (table && this.sampleDistractors(targetWord, table, 3)) ||
+      this.selectDistractors(targetWord, validWords, 3);
 
     // Combine correct word + distractors
     const wordBank = [targetWord, ...distractors];
@@ -346,6 +550,34 @@ class SentenceManager {
     return shuffled;
   }
 
+  /**
+   * Sample distractors from a precomputed table, best bucket first
+   * @param {string} targetWord - The correct word
+   * @param {Object} table - Distractor table for the vocabulary
+   * @param {number} count - Number of distractors needed
+   * @returns {Array<string>|null} - Distractors, or null if the word is not in the table
+   */
+  sampleDistractors(targetWord, table, count) {
+    // Sentences may use the word without its article ("Ambivalenz" for "die Ambivalenz")
+    const key = table.words[targetWord] ? targetWord : table.forms[targetWord];
+    const buckets = key && table.words[key];
+    if (!buckets) {
+      return null;
+    }
+
+    const picked = [];
+    for (const bucket of buckets) {
+      picked.push(...this.shuffle(bucket).slice(0, count - picked.length));
+      if (picked.length === count) break;
+    }
+    if (picked.length < count) {
+      return null;
+    }
+
+    // Match the target's form so the article does not give the answer away
+    return key === targetWord ? picked : picked.map(word => table.bare[word] || word);
+  }
+
   /**
    * Select distractor words (similar length, different words)
    * @param {string} targetWord - The correct word
@@ -394,10 +626,13 @@ class SentenceManager {
   clearCache(language) {
     if (language) {
       delete this.sentenceCache[language];
+      delete this.sentenceIndex[language];
       this.loadedLanguages.delete(language);
       console.log(`[SENTENCES] Cleared cache for ${language}`);
     } else {
       this.sentenceCache = {};
+      this.sentenceIndex = {};
+      this.sentenceManifest = null;
       this.loadedLanguages.clear();
       console.log(`[SENTENCES] Cleared all sentence cache`);
     }
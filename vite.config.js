@@ -93,6 +93,31 @@ export default defineConfig({
           console.log('[Vite Config] Injected version into index.html');
         }
       }
+    },
+    {
+      // Words with a sprite placement are played from the sprite, so their
+      // single clips (scripts/build_audio_sprites.py lists them) are not shipped
+      name: 'audio-sprite-clips',
+      apply: 'build',
+      closeBundle() {
+        const distDir = path.join(process.cwd(), 'dist');
+        const coverageFile = path.join(distDir, 'audio/sprites/clips.json');
+        if (!fs.existsSync(coverageFile)) {
+          return;
+        }
+
+        const { clips } = JSON.parse(fs.readFileSync(coverageFile, 'utf-8'));
+        let removed = 0;
+        for (const url of clips) {
+          const clipPath = path.join(distDir, url);
+          if (fs.existsSync(clipPath)) {
+            fs.unlinkSync(clipPath);
+            removed++;
+          }
+        }
+        fs.unlinkSync(coverageFile);
+        console.log(`[Vite Config] Left ${removed} sprite-covered clips out of dist/audio`);
+      }
     }
   ]
 })